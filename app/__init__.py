@@ -4,22 +4,25 @@ from dotenv import load_dotenv
 
 from .extensions import db, migrate, login_manager
 from .routes import auth, dashboard, customers, uploads
-from .routes import sr, schedule, work, asset, user, contracts
+from .routes import sr, schedule, work, asset, user, contracts, metrics
 from .bootstrap import ensure_bootstrap_admin
-
-
-def create_app():
+from .config import load_config
+from .cli import register_cli
+from .services.sql_stats import init_sql_stats
+from .services.metrics import init_metrics
+from .services.db_routing import init_db_routing
+from .services.statement_timeout import init_statement_timeout
+from .services.db_health import report_pool_health
+from .services.compression import init_compression
+from .services.assets import init_assets
+
+
+def create_app(config_name: str | None = None):
     load_dotenv()
 
     app = Flask(__name__, static_folder="static", template_folder="templates")
-    app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "CHANGE_ME")
-    app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("DATABASE_URL")
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-    max_mb = int(os.getenv("MAX_UPLOAD_MB", "500"))
-    app.config["MAX_CONTENT_LENGTH"] = max_mb * 1024 * 1024
-
-    app.config["UPLOAD_FOLDER"] = os.getenv("UPLOAD_FOLDER", "app/static/uploads")
+    # 프로필(SOMS_ENV)별 설정 - 환경변수 목록은 app/config.py
+    app.config.from_object(load_config(config_name))
 
     os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 
@@ -27,6 +30,9 @@ def create_app():
     migrate.init_app(app, db)
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
+    init_sql_stats(app)
+    init_db_routing(app)
+    init_statement_timeout(app)
 
     app.register_blueprint(auth.bp)
     app.register_blueprint(dashboard.bp)
@@ -38,9 +44,19 @@ def create_app():
     app.register_blueprint(asset.bp)
     app.register_blueprint(user.bp)
     app.register_blueprint(contracts.bp)
+    app.register_blueprint(metrics.bp)
+
+    register_cli(app)
 
     with app.app_context():
+        init_metrics(app, db.engine)
+        report_pool_health(app)
         ensure_bootstrap_admin()
         #pass
 
+    # after_request 는 등록 역순으로 실행 - 압축을 metrics 뒤에 등록해야 응답 크기가 압축 후 값으로 기록됨
+    init_compression(app)
+    # 압축 파일 응답에도 immutable 캐시 헤더가 붙도록 static 처리를 압축 뒤에 한 번 더 감쌈
+    init_assets(app)
+
     return app
\ No newline at end of file
@@ -0,0 +1,208 @@
+import json
+import os
+import sys
+from datetime import date
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+
+from .extensions import db
+from .services.assets import build_bundles, fetch_vendor
+from .services.compression import brotli, precompress_static
+
+# 운영 도구 명령 (flask <명령>)
+#
+#   flask explain-queries        목록 / 상세 화면 쿼리의 실행 계획 확인
+#   flask vendor-assets          외부 라이브러리(Bootstrap, jQuery ...)를 static/vendor 로 받기
+#   flask build-assets           화면별 js / css 묶음 + minify → static/dist (배포 시 실행)
+#   flask compress-static        정적 파일(js / css ...)의 .gz / .br 미리 압축 (배포 시 build-assets 다음에 실행)
+#
+# 실제 라우트가 쓰는 쿼리 빌더와 정렬 키를 그대로 가져와 EXPLAIN 하므로 라우트를 바꾸면 같이 검사됩니다.
+# 데이터가 적으면 인덱스가 있어도 순차 스캔이 더 싸게 계산되므로, 순차 스캔을 꺼둔 상태
+# (PostgreSQL: SET LOCAL enable_seqscan = off) 에서도 Seq Scan 이 남으면 사용할 인덱스가 없는 것으로 봅니다.
+#
+# CI 에서는 tests/test_explain.py 가 이 검사를 실행합니다. (TEST_DATABASE_URL 이 PostgreSQL 일 때, 마이그레이션 적용 후)
+#   TEST_DATABASE_URL=postgresql+psycopg2://.../soms_test python -m pytest -q
+# 벤치마크 규모 데이터로 볼 때는 python -m bench.seed --scale tiny 후 같은 DB 로 flask explain-queries
+
+
+def _plan_queries():
+    """(이름, 쿼리) 목록 - 화면별 대표 쿼리 (첫 페이지 + 커서 다음 페이지)"""
+    from .models.work_attachments import WorkAttachment
+    from .models.servers import ServerInfo
+    from .models.ast_computersystem import AST_Computer_System
+    from .routes.asset import _security_list_query, _server_list_query
+    from .routes.customers import CUSTOMER_TABS, TAB_PAGE_SIZE
+    from .routes.sr import SR_SORT_KEYS, _sr_list_query
+    from .routes.work import WORK_SORT_KEYS, _work_list_query
+    from .services.dashboard_data import expiring_contracts_query, recent_sr_query
+    from .services.month_calendar import month_items_query, month_window
+    from .services.pagination import seek_next
+
+    today = date.today()
+    person_id = "P-EXPLAIN"
+
+    def first_page(query, keys, per_page):
+        return query.order_by(*[k.order_by() for k in keys]).limit(per_page + 1)
+
+    def next_page(query, keys, values, per_page):
+        return first_page(seek_next(query, keys, values), keys, per_page)
+
+    queries = [
+        ("work.list_work", first_page(_work_list_query("", None, None), WORK_SORT_KEYS, 10)),
+        ("work.list_work (cursor)",
+         next_page(_work_list_query("", None, None), WORK_SORT_KEYS, (today, 1000), 10)),
+        ("work.ajax_work_attachments",
+         db.session.query(WorkAttachment).filter_by(Work_ID=1).order_by(WorkAttachment.Upload_Date.desc())),
+        ("sr.list_sr", first_page(_sr_list_query("", "", "", None, None), SR_SORT_KEYS, 10)),
+        ("sr.list_sr (cursor)",
+         next_page(_sr_list_query("", "", "", None, None), SR_SORT_KEYS, (today, 1000), 10)),
+        ("asset.list_security",
+         _security_list_query("", "", "").order_by(AST_Computer_System.Asset_ID.desc()).limit(15)),
+        ("asset.list_servers",
+         _server_list_query("").order_by(ServerInfo.Create_Date.desc(), ServerInfo.Server_ID.desc()).limit(15)),
+        # 대역은 일부 행만 걸리는 크기로 (전체가 걸리는 대역이면 PK 역순 스캔이 실제로 더 싸게 계산됨)
+        ("asset.list_security (CIDR)",
+         _security_list_query("10.0.1.0/28", "", "").order_by(AST_Computer_System.Asset_ID.desc()).limit(15)),
+        # 정확한 IP 는 첫 번째 inet(GiST) 과 inet 목록(GIN) 조건의 OR (services/ip_search.py)
+        ("asset.list_servers (IP)",
+         _server_list_query("10.0.0.1").order_by(ServerInfo.Create_Date.desc(), ServerInfo.Server_ID.desc()).limit(15)),
+        ("dashboard.calendar", month_items_query(*month_window(today.year, today.month))),
+        ("dashboard.recent_sr", recent_sr_query()),
+        ("dashboard.expiring_contracts", expiring_contracts_query(today)),
+    ]
+
+    for tab, (model, keys, filters, _) in CUSTOMER_TABS.items():
+        query = db.session.query(model).filter(model.Person_ID == person_id, *filters)
+        queries.append((f"customers.tab_rows ({tab})", first_page(query, keys, TAB_PAGE_SIZE)))
+
+    return queries
+
+
+# ---------------------------------------------------------------------------
+# 실행 계획 해석
+# ---------------------------------------------------------------------------
+def _compile(query):
+    stmt = query.statement
+    compiled = stmt.compile(dialect=db.engine.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positiontup is not None:
+        params = tuple(params[name] for name in compiled.positiontup)
+    return str(compiled), params
+
+
+def _walk_pg(node, found: list):
+    found.append(node)
+    for child in node.get("Plans", []):
+        _walk_pg(child, found)
+
+
+def _explain_postgresql(conn, query) -> tuple[list[str], list[str]]:
+    """(순차 스캔 테이블 목록, 사용한 인덱스 목록)"""
+    sql, params = _compile(query)
+    raw = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", params).scalar()
+    plan = raw if isinstance(raw, list) else json.loads(raw)
+
+    nodes = []
+    _walk_pg(plan[0]["Plan"], nodes)
+    seq = [n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"]
+    # 순차 스캔을 끄면 조건에 맞는 인덱스가 없을 때 PK 인덱스 전체를 읽고 Filter 로 거르는 계획이 나옴
+    seq += [
+        f'{n["Relation Name"]} (인덱스 전체: {n["Index Name"]})' for n in nodes
+        if n["Node Type"] in ("Index Scan", "Index Only Scan") and "Filter" in n and "Index Cond" not in n
+    ]
+    used = [n["Index Name"] for n in nodes if "Index Name" in n]
+    return seq, used
+
+
+def _explain_sqlite(conn, query) -> tuple[list[str], list[str]]:
+    sql, params = _compile(query)
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).all()
+
+    seq, used = [], []
+    for row in rows:
+        detail = row[-1]
+        if detail.startswith("SCAN") and " INDEX" not in detail:
+            seq.append(detail.split()[1])
+        if " INDEX " in detail:
+            used.append(detail.split(" INDEX ")[1].split()[0])
+    return seq, used
+
+
+@click.command("explain-queries")
+@click.option("--json", "as_json", is_flag=True, help="결과를 JSON 으로 출력")
+@with_appcontext
+def explain_queries(as_json):
+    """목록 / 상세 쿼리 실행 계획 검사 (순차 스캔이 있으면 종료 코드 1)"""
+    dialect = db.engine.dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        raise click.ClickException(f"지원하지 않는 DB 입니다: {dialect}")
+
+    results = []
+    with db.engine.connect() as conn:
+        with conn.begin():
+            if dialect == "postgresql":
+                conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            explain = _explain_postgresql if dialect == "postgresql" else _explain_sqlite
+            for name, query in _plan_queries():
+                seq, used = explain(conn, query)
+                results.append({"query": name, "ok": not seq, "seq_scan": seq, "indexes": used})
+
+    failed = [r for r in results if not r["ok"]]
+    if as_json:
+        click.echo(json.dumps({"dialect": dialect, "failed": len(failed), "results": results},
+                              ensure_ascii=False, indent=2))
+    else:
+        for r in results:
+            status = "OK " if r["ok"] else "SEQ"
+            detail = ", ".join(r["indexes"]) or "-"
+            if r["seq_scan"]:
+                detail += f"  (순차 스캔: {', '.join(r['seq_scan'])})"
+            click.echo(f"[{status}] {r['query']:<36} {detail}")
+        click.echo(f"{len(results) - len(failed)}/{len(results)} 통과")
+
+    if failed:
+        sys.exit(1)
+
+
+@click.command("vendor-assets")
+@click.option("--force", is_flag=True, help="이미 받은 파일도 다시 받기")
+@with_appcontext
+def vendor_assets(force):
+    """외부 라이브러리를 static/vendor 로 받기 (인터넷 연결 필요)"""
+    try:
+        fetched = fetch_vendor(current_app.static_folder, force=force, log=click.echo)
+    except (OSError, RuntimeError) as e:
+        raise click.ClickException(str(e))
+    click.echo(f"{fetched}개 받음")
+
+
+@click.command("build-assets")
+@with_appcontext
+def build_assets():
+    """화면별 js / css 묶음을 만들어 static/dist 에 해시 파일명으로 저장"""
+    try:
+        built = build_bundles(current_app.static_folder, log=click.echo)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"{len(built)}개 묶음, static/dist/manifest.json 갱신 (앱을 다시 시작해야 반영)")
+
+
+@click.command("compress-static")
+@with_appcontext
+def compress_static():
+    """정적 파일 미리 압축 (업로드 폴더 제외, 원본이 바뀐 파일만 다시 압축)"""
+    static_folder = current_app.static_folder
+    uploads = os.path.abspath(current_app.config["UPLOAD_FOLDER"])
+    made, skipped = precompress_static(static_folder, skip_dirs=[uploads], log=click.echo)
+    if brotli is None:
+        click.echo("brotli 모듈이 없어 .gz 만 만들었습니다. (pip install Brotli)")
+    click.echo(f"{made}개 생성, {skipped}개 최신 상태")
+
+
+def register_cli(app: Flask):
+    app.cli.add_command(explain_queries)
+    app.cli.add_command(vendor_assets)
+    app.cli.add_command(build_assets)
+    app.cli.add_command(compress_static)
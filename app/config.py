@@ -0,0 +1,152 @@
+import os
+
+from sqlalchemy.pool import NullPool
+
+# 설정 프로필 (SOMS_ENV = development / testing / production, 기본 production)
+#
+# 값은 모두 환경변수(.env)에서 읽으며, create_app() 이 호출될 때 읽습니다. (import 시점이 아님)
+# SQLALCHEMY_ENGINE_OPTIONS 는 PostgreSQL URL 일 때만 풀 / 연결 옵션을 채웁니다. (SQLite 개발 DB 는 기본값)
+#
+# DB 관련 환경변수
+#   DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT / DB_POOL_RECYCLE   연결 풀 (초 단위)
+#   DB_CONNECT_TIMEOUT                                                    연결 시도 제한 시간(초)
+#   DB_STATEMENT_TIMEOUT_MS / DB_SEARCH_TIMEOUT_MS / DB_BULK_TIMEOUT_MS   화면 종류별 문장 제한 시간
+#   DB_IDLE_TX_TIMEOUT_MS                                                 트랜잭션 열어 둔 채 쉬는 연결 정리
+#   DB_PGBOUNCER=1   pgbouncer(transaction 모드) 뒤에서 실행: 앱 쪽 풀을 쓰지 않고(NullPool),
+#                    연결 시작 옵션(-c ...) 대신 트랜잭션마다 SET LOCAL 로 제한 시간을 겁니다.
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class Config:
+    """공통 설정 (production 기준값)"""
+
+    # 풀 기본값 (프로필에서 조정, 소문자라 app.config 에는 들어가지 않음)
+    pool_size = 10
+    max_overflow = 20
+
+    def __init__(self):
+        self.SECRET_KEY = os.getenv("SECRET_KEY", "CHANGE_ME")
+        self.SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
+        self.SQLALCHEMY_TRACK_MODIFICATIONS = False
+        self.SQLALCHEMY_ECHO = _env_bool("SQLALCHEMY_ECHO", False)
+
+        # 읽기 전용 복제본: 목록 / 상세 조회 화면만 사용 (services/db_routing.py)
+        replica_url = os.getenv("DATABASE_REPLICA_URL")
+        self.SQLALCHEMY_BINDS = {"replica": replica_url} if replica_url else {}
+        self.REPLICA_STICKY_SECONDS = _env_int("REPLICA_STICKY_SECONDS", 10)
+
+        # 화면 종류별 SQL 문장 제한 시간(ms, 0 이면 제한 없음) - services/statement_timeout.py
+        self.DB_PGBOUNCER = _env_bool("DB_PGBOUNCER", False)
+        self.STATEMENT_TIMEOUTS = {
+            "default": _env_int("DB_STATEMENT_TIMEOUT_MS", 30_000),
+            "search": _env_int("DB_SEARCH_TIMEOUT_MS", 8_000),
+            "bulk": _env_int("DB_BULK_TIMEOUT_MS", 300_000),
+        }
+        self.SQLALCHEMY_ENGINE_OPTIONS = self.engine_options()
+        # 시작할 때 DB 연결 / 풀 상태를 로그로 남김
+        self.DB_STARTUP_CHECK = _env_bool("DB_STARTUP_CHECK", True)
+
+        max_mb = _env_int("MAX_UPLOAD_MB", 500)
+        self.MAX_CONTENT_LENGTH = max_mb * 1024 * 1024
+        # 분할 업로드(/uploads/chunked)는 조각 단위로 받으므로 파일 전체 크기 한도를 따로 둠
+        self.MAX_RESUMABLE_UPLOAD_MB = _env_int("MAX_RESUMABLE_UPLOAD_MB", 10240)
+
+        self.UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "app/static/uploads")
+        # 첨부 다운로드 본문을 앞단 웹서버가 전송: "" (Flask 직접) / "nginx" (X-Accel-Redirect) / "sendfile" (X-Sendfile)
+        self.DOWNLOAD_OFFLOAD = os.getenv("DOWNLOAD_OFFLOAD", "").lower()
+        self.DOWNLOAD_ACCEL_PREFIX = os.getenv("DOWNLOAD_ACCEL_PREFIX", "/_protected_uploads")
+
+        # 요청별 SQL 계측 (Server-Timing 헤더 / soms.sql 로그), 같은 문장이 N회 넘게 반복되면 경고
+        self.SQL_STATS = _env_bool("SQL_STATS", True)
+        self.SQL_REPEAT_WARN = _env_int("SQL_REPEAT_WARN", 10)
+        # 엔드포인트별 SQL 문장 수 상한 확인: "" / "warn" / "raise" (services/query_budget.py)
+        self.SQL_QUERY_BUDGET = os.getenv("SQL_QUERY_BUDGET", "").lower()
+        # /metrics 접근 토큰 (비어 있으면 누구나 조회 가능 - 내부망 / 앞단에서 막을 것)
+        self.METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+        # 응답 압축 (services/compression.py) - 앞단 웹서버가 압축하면 COMPRESS=0
+        self.COMPRESS = _env_bool("COMPRESS", True)
+        self.COMPRESS_MIN_SIZE = _env_int("COMPRESS_MIN_SIZE", 1024)
+        self.COMPRESS_LEVEL = _env_int("COMPRESS_LEVEL", 6)
+        self.COMPRESS_BR_QUALITY = _env_int("COMPRESS_BR_QUALITY", 4)
+        # IP → 고객 조회 표(services/ip_owner.py)를 전체 다시 읽는 주기(초) - 다른 워커의 저장 반영
+        self.IP_OWNER_REBUILD_SECONDS = _env_int("IP_OWNER_REBUILD_SECONDS", 600)
+        # 1 이면 빌드된 묶음(static/dist) 대신 js / css 원본을 하나씩 사용 (services/assets.py)
+        self.ASSETS_DEBUG = _env_bool("ASSETS_DEBUG", False)
+
+    def engine_options(self) -> dict:
+        url = self.SQLALCHEMY_DATABASE_URI or ""
+        if not url.startswith("postgresql"):
+            return {}
+
+        connect_args = {
+            "connect_timeout": _env_int("DB_CONNECT_TIMEOUT", 5),
+            "application_name": os.getenv("DB_APPLICATION_NAME", "soms"),
+        }
+        if self.DB_PGBOUNCER:
+            # 풀은 pgbouncer 가 관리. 연결 시작 옵션은 pgbouncer 가 거부하므로 넣지 않음
+            return {"poolclass": NullPool, "connect_args": connect_args}
+
+        options = [f"-c statement_timeout={self.STATEMENT_TIMEOUTS['default']}"]
+        idle_tx = _env_int("DB_IDLE_TX_TIMEOUT_MS", 60_000)
+        if idle_tx:
+            options.append(f"-c idle_in_transaction_session_timeout={idle_tx}")
+        connect_args["options"] = " ".join(options)
+
+        return {
+            "pool_size": _env_int("DB_POOL_SIZE", self.pool_size),
+            "max_overflow": _env_int("DB_MAX_OVERFLOW", self.max_overflow),
+            "pool_timeout": _env_int("DB_POOL_TIMEOUT", 10),
+            "pool_recycle": _env_int("DB_POOL_RECYCLE", 1800),
+            "pool_pre_ping": True,
+            "connect_args": connect_args,
+        }
+
+
+class ProductionConfig(Config):
+    pass
+
+
+class DevelopmentConfig(Config):
+    pool_size = 5
+    max_overflow = 5
+
+    def __init__(self):
+        super().__init__()
+        self.SQL_QUERY_BUDGET = self.SQL_QUERY_BUDGET or "warn"
+        self.ASSETS_DEBUG = _env_bool("ASSETS_DEBUG", True)
+
+
+class TestingConfig(Config):
+    pool_size = 2
+    max_overflow = 2
+
+    def __init__(self):
+        super().__init__()
+        self.TESTING = True
+        self.SQL_QUERY_BUDGET = self.SQL_QUERY_BUDGET or "raise"
+        self.DB_STARTUP_CHECK = _env_bool("DB_STARTUP_CHECK", False)
+
+
+PROFILES = {
+    "production": ProductionConfig,
+    "development": DevelopmentConfig,
+    "testing": TestingConfig,
+}
+
+
+def load_config(name: str | None = None) -> Config:
+    name = (name or os.getenv("SOMS_ENV") or "production").lower()
+    if name not in PROFILES:
+        raise ValueError(f"알 수 없는 설정 프로필입니다: {name} ({', '.join(PROFILES)})")
+    return PROFILES[name]()
@@ -1,6 +1,10 @@
 from app import db
 from datetime import datetime
 
+from sqlalchemy.dialects.postgresql import INET
+
+from .types import InetArray
+
 
 class AST_Computer_System(db.Model):
     __tablename__ = 'AST_Computer_System'
@@ -33,6 +37,8 @@ class AST_Computer_System(db.Model):
     Description = db.Column(db.Text)  # 비고
     Service_URL__c = db.Column(db.Text)  # 서비스 URL
     IP_Address = db.Column(db.Text)  # IP 주소
+    IP_Inet = db.Column(db.Text().with_variant(INET(), 'postgresql'))  # IP 주소를 해석한 inet (저장 시 자동, services/ip_search.py)
+    IP_Inets = db.Column(InetArray)  # IP 주소에 적힌 IP / 대역 전체 (정확한 IP 검색용, 저장 시 자동)
     Region = db.Column(db.Text)  # 리전 (필요시)
     IDC_Site = db.Column(db.Text)  # DC 위치
 
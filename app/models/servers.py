@@ -1,7 +1,9 @@
 from sqlalchemy import Text, BigInteger, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import INET
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..extensions import db
+from .types import InetArray
 
 
 class ServerInfo(db.Model):
@@ -14,5 +16,11 @@ class ServerInfo(db.Model):
 
     chServerName: Mapped[str | None] = mapped_column("chServerName", Text, quote=True)
     chServerInfo: Mapped[str | None] = mapped_column("chServerInfo", Text, quote=True)
+    # chServerInfo(IP) 를 해석한 inet - 저장 시 자동으로 채움 (services/ip_search.py)
+    chServerInet: Mapped[str | None] = mapped_column(
+        "chServerInet", Text().with_variant(INET(), "postgresql"), quote=True
+    )
+    # chServerInfo 에 적힌 IP / 대역 전체 (정확한 IP 검색용)
+    chServerInets: Mapped[list | None] = mapped_column("chServerInets", InetArray, quote=True)
     Submitter: Mapped[str | None] = mapped_column("Submitter", Text, quote=True)
     Create_Date: Mapped[object | None] = mapped_column("Create_Date", DateTime, quote=True)
\ No newline at end of file
@@ -0,0 +1,25 @@
+from sqlalchemy import Text
+from sqlalchemy.dialects.postgresql import ARRAY, INET
+from sqlalchemy.types import TypeDecorator
+
+
+class InetArray(TypeDecorator):
+    """IP / 대역 목록 - PostgreSQL 은 inet[], 그 밖의 DB(개발용 SQLite)는 공백으로 감싼 텍스트 (" 10.0.0.1 10.0.0.2 ")"""
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(INET()))
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return f" {' '.join(value)} "
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        return value.split()
@@ -30,4 +30,6 @@ class User(db.Model, UserMixin):
 
 @login_manager.user_loader
 def load_user(user_id: str):
-    return db.session.get(User, user_id)
\ No newline at end of file
+    # 요청마다 DB 를 조회하지 않도록 캐시된 스냅샷 사용 (services/user_cache.py)
+    from ..services.user_cache import cached_user
+    return cached_user(user_id)
\ No newline at end of file
@@ -7,6 +7,11 @@ from ..extensions import db
 from ..models.ast_computersystem import AST_Computer_System
 from ..models.ctm_people import CTMPeople
 from ..models.servers import ServerInfo
+from ..services.export import Column, export_response
+from ..services.fragments import render_rows
+from ..services.ip_owner import MAX_BATCH, resolve_ips
+from ..services.ip_search import ip_filter, parse_ip_query
+from ..services.search import contains, contains_any
 
 bp = Blueprint('asset', __name__, url_prefix='/asset')
 
@@ -19,6 +24,29 @@ def _parse_date(value):
         return None
 
 
+def _security_list_query(q, company, a_type):
+    """보안장비 목록 조회 쿼리 (정렬 제외)"""
+    query = db.session.query(AST_Computer_System, CTMPeople) \
+        .outerjoin(CTMPeople, AST_Computer_System.Person_ID == CTMPeople.Person_ID)
+
+    ip_query = parse_ip_query(q)
+    if ip_query:
+        # IP / CIDR / 범위 검색어는 inet 컬럼으로 (services/ip_search.py)
+        query = query.filter(ip_filter(AST_Computer_System, ip_query))
+    elif q:
+        query = query.filter(contains_any(
+            q,
+            AST_Computer_System.Name,
+            AST_Computer_System.IP_Address,
+            AST_Computer_System.Serial_Number
+        ))
+    if company:
+        query = query.filter(contains(CTMPeople.Company, company))
+    if a_type:
+        query = query.filter(AST_Computer_System.Type == a_type)
+    return query
+
+
 @bp.route('/security')
 @login_required
 def list_security():
@@ -27,34 +55,59 @@ def list_security():
     company = request.args.get('company', '').strip()
     a_type = request.args.get('type', '').strip()
 
-    query = db.session.query(AST_Computer_System, CTMPeople) \
-        .outerjoin(CTMPeople, AST_Computer_System.Person_ID == CTMPeople.Person_ID)
-
-    if q:
-        query = query.filter(or_(
-            AST_Computer_System.Name.ilike(f'%{q}%'),
-            AST_Computer_System.IP_Address.ilike(f'%{q}%'),
-            AST_Computer_System.Serial_Number.ilike(f'%{q}%')
-        ))
-    if company:
-        query = query.filter(CTMPeople.Company.ilike(f'%{company}%'))
-    if a_type:
-        query = query.filter(AST_Computer_System.Type == a_type)
+    query = _security_list_query(q, company, a_type)
 
     per_page = 15
     pagination = query.order_by(AST_Computer_System.Asset_ID.desc()) \
         .paginate(page=page, per_page=per_page, error_out=False)
 
-    customers = db.session.query(CTMPeople).order_by(CTMPeople.Company).all()
-
     return render_template(
         'asset/list.html',
         pagination=pagination,
-        customers=customers,
         filters={'q': q, 'company': company, 'type': a_type}
     )
 
 
+ASSET_STATUS = {0: '주문됨', 1: '입고됨', 3: '사용중', 11: '폐기'}
+
+SECURITY_EXPORT_COLUMNS = [
+    Column('자산ID', lambda r: r[0].Asset_ID),
+    Column('고객사', lambda r: r[1].Company if r[1] else r[0].Company),
+    Column('사이트', lambda r: r[0].Owner_name),
+    Column('장비명', lambda r: r[0].Name),
+    Column('구분', lambda r: r[0].Category),
+    Column('유형', lambda r: r[0].Type),
+    Column('품목', lambda r: r[0].Item),
+    Column('제조사', lambda r: r[0].Manufacturer_Name),
+    Column('모델명', lambda r: r[0].Model_Number),
+    Column('버전', lambda r: r[0].Version_Number),
+    Column('시리얼', lambda r: r[0].Serial_Number),
+    Column('IP', lambda r: r[0].IP_Address),
+    Column('공급자', lambda r: r[0].Supplier),
+    Column('상태', lambda r: ASSET_STATUS.get(r[0].AssetLifecycleStatus, r[0].AssetLifecycleStatus)),
+    Column('설치일', lambda r: r[0].InstallationDate),
+    Column('라이선스 만료일', lambda r: r[0].License_Expiry_Date),
+    Column('비고', lambda r: r[0].Description),
+    Column('수정일', lambda r: r[0].Update_Date),
+]
+
+
+@bp.get('/security/export')
+@login_required
+def export_security():
+    """목록과 같은 검색 조건으로 보안장비 자산 내보내기 (?format=csv|xlsx)"""
+    query = _security_list_query(
+        request.args.get('q', '').strip(),
+        request.args.get('company', '').strip(),
+        request.args.get('type', '').strip(),
+    ).order_by(AST_Computer_System.Asset_ID.desc())
+
+    response = export_response(request.args.get('format', 'xlsx'), '보안장비', SECURITY_EXPORT_COLUMNS, query, '보안장비')
+    if response is None:
+        return jsonify({'ok': False, 'message': '지원하지 않는 형식입니다.'}), 400
+    return response
+
+
 @bp.route('/ajax/save', methods=['POST'])
 @login_required
 def ajax_save_asset():
@@ -133,8 +186,10 @@ def ajax_save_asset():
         if not asset_id:
             db.session.add(asset)
 
+        db.session.flush()
+        rows = render_rows([asset], customer)  # 커밋 전에 그림 (커밋 후에는 만료된 장비 / 고객을 다시 읽음)
         db.session.commit()
-        return jsonify({'ok': True})
+        return jsonify({'ok': True, **rows})
 
     except Exception as e:
         db.session.rollback()
@@ -154,9 +209,70 @@ def ajax_delete_asset(asset_id):
     return jsonify({'ok': False, 'message': '삭제 실패'})
 
 
+@bp.post('/ajax/ip-owners')
+@login_required
+def ajax_ip_owners():
+    """IP 목록의 소유 고객 / 장비 / 사이트 일괄 조회 (JSON {"ips": [...]} 또는 폼 ips=줄바꿈·쉼표 구분)"""
+    data = request.get_json(silent=True)
+    if data is not None:
+        ips = data.get('ips') if isinstance(data, dict) else None
+    else:
+        ips = request.form.get('ips', '').replace(',', ' ').split()
+    if not isinstance(ips, list) or not all(isinstance(ip, str) for ip in ips):
+        return jsonify({'ok': False, 'message': 'ips 는 IP 문자열 목록이어야 합니다.'}), 400
+    if len(ips) > MAX_BATCH:
+        return jsonify({'ok': False, 'message': f'한 번에 {MAX_BATCH}개까지 조회할 수 있습니다.'}), 400
+
+    results = resolve_ips(ips)
+    found = sum(1 for r in results.values() if r)
+    return jsonify({'ok': True, 'results': results, 'count': len(results), 'found': found})
+
+
 # ==============================================================
 # [NEW] 서버 자산 전체 조회 및 등록 페이지
 # ==============================================================
+def _server_list_query(q):
+    """서버 목록 조회 쿼리 (정렬 제외)"""
+    query = db.session.query(ServerInfo, CTMPeople) \
+        .join(CTMPeople, ServerInfo.Person_ID == CTMPeople.Person_ID)
+
+    ip_query = parse_ip_query(q)
+    if ip_query:
+        query = query.filter(ip_filter(ServerInfo, ip_query))
+    elif q:
+        query = query.filter(contains_any(
+            q,
+            ServerInfo.chServerName,
+            ServerInfo.chServerInfo,
+            CTMPeople.Company
+        ))
+    return query
+
+
+SERVER_EXPORT_COLUMNS = [
+    Column('서버ID', lambda r: r[0].Server_ID),
+    Column('고객사', lambda r: r[1].Company),
+    Column('사이트', lambda r: r[1].Last_Name),
+    Column('서버명', lambda r: r[0].chServerName),
+    Column('IP', lambda r: r[0].chServerInfo),
+    Column('등록자', lambda r: r[0].Submitter),
+    Column('등록일', lambda r: r[0].Create_Date),
+]
+
+
+@bp.get('/servers/export')
+@login_required
+def export_servers():
+    """목록과 같은 검색 조건으로 서버 자산 내보내기 (?format=csv|xlsx)"""
+    query = _server_list_query(request.args.get('q', '').strip()) \
+        .order_by(desc(ServerInfo.Create_Date), desc(ServerInfo.Server_ID))
+
+    response = export_response(request.args.get('format', 'xlsx'), '서버', SERVER_EXPORT_COLUMNS, query, '서버')
+    if response is None:
+        return jsonify({'ok': False, 'message': '지원하지 않는 형식입니다.'}), 400
+    return response
+
+
 # ==============================================================
 # [NEW] 서버 자산 전체 조회 및 등록 페이지
 # ==============================================================
@@ -194,30 +310,18 @@ def list_servers():
 
     # 2. [GET] 목록 조회 (페이지네이션 + 검색)
     page = request.args.get('page', 1, type=int)  # 페이지 번호
-    q = request.args.get('q', '')
-
-    query = db.session.query(ServerInfo, CTMPeople) \
-        .join(CTMPeople, ServerInfo.Person_ID == CTMPeople.Person_ID)
+    q = request.args.get('q', '').strip()
 
-    if q:
-        search = f"%{q}%"
-        query = query.filter(or_(
-            ServerInfo.chServerName.ilike(search),
-            ServerInfo.chServerInfo.ilike(search),
-            CTMPeople.Company.ilike(search)
-        ))
+    query = _server_list_query(q)
 
     # [수정] paginate 적용 (한 페이지당 15개)
     per_page = 15
-    pagination = query.order_by(desc(ServerInfo.Create_Date)) \
+    pagination = query.order_by(desc(ServerInfo.Create_Date), desc(ServerInfo.Server_ID)) \
         .paginate(page=page, per_page=per_page, error_out=False)
 
-    # 등록 모달용 전체 고객 리스트
-    customers = CTMPeople.query.order_by(CTMPeople.Company).all()
-
+    # 등록 모달의 사이트 선택(Select2)은 customers.ajax_search 로 원격 검색
     return render_template(
         'asset/server_list.html',
         pagination=pagination,  # rows 대신 pagination 객체 전달
-        customers=customers,
         q=q
     )
\ No newline at end of file
@@ -3,6 +3,7 @@ from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import check_password_hash, generate_password_hash
 from app import db
 from app.models.user import User  # 모델 경로 확인
+from app.services.user_cache import invalidate_user
 
 bp = Blueprint('auth', __name__, url_prefix='/auth')
 
@@ -54,12 +55,15 @@ def change_password():
         elif new_pw != confirm_pw:
             flash('비밀번호가 일치하지 않습니다.', 'danger')
         else:
+            # current_user 는 캐시된 스냅샷이므로 DB 행을 다시 조회해서 수정
+            user = db.session.get(User, current_user.user_id)
             # 1. 새 비밀번호로 업데이트
-            current_user.password_hash = generate_password_hash(new_pw)
+            user.password_hash = generate_password_hash(new_pw)
             # 2. 변경 강제 해제
-            current_user.must_change_password = False
+            user.must_change_password = False
 
             db.session.commit()
+            invalidate_user(user.user_id)
 
             flash('비밀번호가 변경되었습니다. 다시 로그인해주세요.', 'success')
             logout_user()  # 보안상 재로그인 유도
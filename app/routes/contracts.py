@@ -3,6 +3,7 @@ from flask_login import login_required
 from datetime import datetime
 from ..extensions import db
 from ..models.contracts import Contract
+from ..services.fragments import render_rows
 
 bp = Blueprint('contract', __name__, url_prefix='/contract')
 
@@ -48,8 +49,10 @@ def ajax_create_contract():
             Deleted_YN='N'
         )
         db.session.add(new_c)
+        db.session.flush()
+        rows = render_rows([new_c])
         db.session.commit()
-        return jsonify({'ok': True, 'message': '계약이 등록되었습니다.'})
+        return jsonify({'ok': True, 'message': '계약이 등록되었습니다.', **rows})
     except Exception as e:
         return jsonify({'ok': False, 'message': str(e)}), 500
 
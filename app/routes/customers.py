@@ -16,6 +16,17 @@ from ..models.contacts import Contact
 from ..models.contracts import Contract
 from ..models.work_attachments import WorkAttachment
 from ..models.ast_computersystem import AST_Computer_System
+from ..services.pagination import SortKey, entity_sort_key, keyset_paginate
+from ..services.customer_stats import customer_summary, invalidate_customer_summary
+from ..services import file_store
+from ..services.downloads import send_attachment
+from ..services.customer_lookup import invalidate_customer_search, search_customers
+from ..services.search import contains_any
+from ..services.bulk_import import IMPORT_SPECS, run_import
+from ..services.ip_owner import DEVICE_MODELS, invalidate_ip_owners
+from ..services.tabular import TabularError
+from ..services.dashboard_data import invalidate_dashboard, invalidate_work_calendar
+from ..services.fragments import render_rows
 
 bp = Blueprint("customers", __name__, url_prefix="/customers")
 
@@ -84,6 +95,8 @@ def list_customers():
         try:
             db.session.add(people)
             db.session.commit()
+            invalidate_customer_summary()
+            invalidate_customer_search()
             flash("신규 고객이 성공적으로 등록되었습니다.", "success")
             return redirect(url_for("customers.detail", person_id=person_id))
         except Exception as e:
@@ -102,13 +115,8 @@ def list_customers():
 
     # 1. 통합 검색
     if q:
-        search_keyword = f"%{q}%"
         query = query.filter(
-            or_(
-                CTMPeople.Company.ilike(search_keyword),
-                CTMPeople.Sales_Manager.ilike(search_keyword),
-                CTMPeople.Rack_Location.ilike(search_keyword)
-            )
+            contains_any(q, CTMPeople.Company, CTMPeople.Sales_Manager, CTMPeople.Rack_Location)
         )
 
     # 2. 필터 적용
@@ -128,28 +136,9 @@ def list_customers():
                       .paginate(page=page, per_page=per_page, error_out=False)
 
     # ---------------------------------------------------------
-    # [추가] 상단 대시보드 통계 계산
-    # ---------------------------------------------------------
-
-    # 1. VIP / 민감 고객 (민감: '0', VIP: '2')
-    count_vip = db.session.query(func.count(CTMPeople.Person_ID)) \
-                    .filter(CTMPeople.Client_Sensitivity.in_(['0', '2'])).scalar() or 0
-
-    # 2. 정기 레포트 발송 대상 (발송: '0' 또는 'Y')
-    count_report = db.session.query(func.count(CTMPeople.Person_ID)) \
-                       .filter(or_(CTMPeople.Report_YN == '0', CTMPeople.Report_YN == 'Y')).scalar() or 0
-
-    # 3. 이번 달 신규 등록
-    # (주의: CTMPeople 테이블에 등록일(Reg_Date)이나 개통일(Open_Date) 컬럼이 있어야 작동합니다)
-    # 여기서는 Open_Date를 기준으로 예시를 작성했습니다.
-    from datetime import date
-    today = date.today()
-    start_of_month = today.replace(day=1)
-
-    count_new = db.session.query(func.count(CTMPeople.Person_ID)) \
-                    .filter(CTMPeople.Open_Date >= start_of_month).scalar() or 0
-
+    # [추가] 상단 대시보드 통계 (단일 집계 쿼리 + 캐시, services/customer_stats.py)
     # ---------------------------------------------------------
+    summary = customer_summary()
 
     # [수정] render_template에 카운트 변수 추가 전달
     return render_template(
@@ -157,9 +146,9 @@ def list_customers():
         pagination=pagination,
         q=q, idc=idc, sensitivity=sensitivity, report=report,
         # [여기 추가]
-        count_vip=count_vip,
-        count_report=count_report,
-        count_new=count_new
+        count_vip=summary["count_vip"],
+        count_report=summary["count_report"],
+        count_new=summary["count_new"]
     )
 
 def _split_handler(detail: str | None):
@@ -188,62 +177,143 @@ def detail(person_id: str):
         flash("고객을 찾을 수 없습니다.", "warning")
         return redirect(url_for("customers.list_customers"))
 
+    # 각 탭(계약/보안장비/서버/담당자/작업 이력)은 탭을 열 때 tab_rows 로 지연 로딩
+    return render_template(
+        "customers/detail.html",
+        people=people,
 
-
-    work_rows = (
-        db.session.query(WorkInfo)
-        .filter(WorkInfo.Person_ID == person_id)
-        .order_by(WorkInfo.Work_Date.desc().nulls_last(), WorkInfo.Work_ID.desc())
-        .limit(200)
-        .all()
+        severities=SEVERITIES,
+        tags=DEFAULT_TAGS,
+        split_handler=_split_handler,
     )
 
-    ci_rows = (
-        db.session.query(AST_Computer_System)
-        .filter(AST_Computer_System.Person_ID == person_id)
-        .order_by(AST_Computer_System.Name.asc())
-        .limit(200)
-        .all()
-    )
 
-    server_rows = (
-        db.session.query(ServerInfo)
-        .filter(ServerInfo.Person_ID == person_id)
-        .order_by(ServerInfo.Server_ID.desc())
-        .limit(200)
-        .all()
-    )
+# 탭 이름 → (모델, 커서 정렬 키, 추가 필터, 행 템플릿)
+CUSTOMER_TABS = {
+    "work": (
+        WorkInfo,
+        [SortKey(WorkInfo.Work_Date, nullable=True), SortKey(WorkInfo.Work_ID)],
+        [],
+        "customers/_tab_work_rows.html",
+    ),
+    "assets": (
+        AST_Computer_System,
+        [SortKey(AST_Computer_System.Name, descending=False, nullable=True),
+         SortKey(AST_Computer_System.Asset_ID, descending=False)],
+        [],
+        "customers/_tab_assets_rows.html",
+    ),
+    "servers": (
+        ServerInfo,
+        [SortKey(ServerInfo.Server_ID)],
+        [],
+        "customers/_tab_servers_rows.html",
+    ),
+    "contacts": (
+        Contact,
+        [SortKey(Contact.Contact_ID)],
+        [],
+        "customers/_tab_contacts_rows.html",
+    ),
+    "contracts": (
+        Contract,
+        [SortKey(Contract.Contract_ID)],
+        [Contract.Deleted_YN == "N"],
+        "customers/_tab_contracts_rows.html",
+    ),
+}
+
+TAB_PAGE_SIZE = 50
+
+
+def _tab_people(person_id: str):
+    """저장 응답 행 조각(render_rows)에 넘길 고객 조회 (조각을 요청했을 때만 실행)"""
+    return lambda: db.session.query(CTMPeople).filter(CTMPeople.Person_ID == person_id).first()
+
+
+@bp.get("/<person_id>/tabs/<tab>")
+@login_required
+def tab_rows(person_id: str, tab: str):
+    """고객 상세 탭 행 조각(HTML) + 다음 페이지 커서"""
+    if tab not in CUSTOMER_TABS:
+        return jsonify({"ok": False, "message": "알 수 없는 탭입니다."}), 404
 
-    contact_rows = (
-        db.session.query(Contact)
-        .filter(Contact.Person_ID == person_id)
-        .order_by(Contact.Contact_ID.desc())
-        .limit(200)
-        .all()
+    people = (
+        db.session.query(CTMPeople)
+        .filter(CTMPeople.Person_ID == person_id)
+        .first()
     )
+    if not people:
+        return jsonify({"ok": False, "message": "고객을 찾을 수 없습니다."}), 404
 
-    contract_rows = (
-        db.session.query(Contract)
-        .filter(Contract.Person_ID == person_id)
-        .filter(Contract.Deleted_YN == "N")
-        .order_by(Contract.Contract_ID.desc())
-        .limit(200)
-        .all()
-    )
+    model, keys, filters, template = CUSTOMER_TABS[tab]
+    query = db.session.query(model).filter(model.Person_ID == person_id, *filters)
 
-    return render_template(
-        "customers/detail.html",
-        people=people,
+    cursor = request.args.get("cursor")
+    pagination = keyset_paginate(query, keys, entity_sort_key(keys), cursor, TAB_PAGE_SIZE)
 
-        severities=SEVERITIES,
-        tags=DEFAULT_TAGS,
-        work_rows=work_rows,
+    html = render_template(
+        template,
+        rows=pagination.items,
+        people=people,
+        first_page=not cursor,
         split_handler=_split_handler,
-        ci_rows=ci_rows,
-        server_rows=server_rows,
-        contact_rows=contact_rows,
-        contract_rows=contract_rows,
     )
+    return jsonify({"ok": True, "html": html, "next_cursor": pagination.next_cursor})
+
+
+@bp.post("/<person_id>/import/<kind>")
+@login_required
+def bulk_import(person_id: str, kind: str):
+    """보안장비 / 서버 / 담당자 CSV·XLSX 일괄 등록 (dry_run=1 이면 검증만)"""
+    if kind not in IMPORT_SPECS:
+        return jsonify({"ok": False, "message": "알 수 없는 등록 대상입니다."}), 404
+
+    people = db.session.query(CTMPeople).filter(CTMPeople.Person_ID == person_id).first()
+    if not people:
+        return jsonify({"ok": False, "message": "고객을 찾을 수 없습니다."}), 404
+
+    file = request.files.get("file")
+    if not file or not file.filename:
+        return jsonify({"ok": False, "message": "파일을 선택해 주세요."}), 400
+
+    dry_run = request.form.get("dry_run") == "1"
+    submitter = getattr(current_user, 'user_name', getattr(current_user, 'name', 'System'))
+    title = IMPORT_SPECS[kind].title
+    try:
+        result = run_import(kind, file, people, submitter, dry_run=dry_run)
+        if result.errors:
+            return jsonify({
+                "ok": False,
+                "message": f"오류가 있는 행이 있어 등록하지 않았습니다. (오류 {result.error_count}건)",
+                **result.as_dict(),
+            }), 400
+        if dry_run:
+            return jsonify({"ok": True, "message": f"{result.total}건 모두 등록할 수 있습니다.", **result.as_dict()})
+
+        db.session.commit()
+        if IMPORT_SPECS[kind].model in DEVICE_MODELS:
+            invalidate_ip_owners()  # Core INSERT 라 저장 이벤트로 반영되지 않음
+    except TabularError as e:
+        db.session.rollback()
+        return jsonify({"ok": False, "message": str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"ok": False, "message": str(e)}), 500
+
+    message = f"{title} {result.inserted}건이 등록되었습니다."
+    if result.updated:
+        message = f"{title} {result.inserted}건 등록, {result.updated}건 수정되었습니다."
+    return jsonify({"ok": True, "message": message, **result.as_dict()})
+
+
+@bp.get("/ajax/search")
+@login_required
+def ajax_search():
+    """고객사/사이트 선택 상자(Select2) 원격 검색"""
+    q = request.args.get("q", "")
+    page = request.args.get("page", 1, type=int)
+    return jsonify(search_customers(q, page))
 
 
 @bp.post("/<person_id>/update")
@@ -284,6 +354,9 @@ def update_customer_info(person_id: str):
         people.chEtc = request.form.get("customer_notes") or None
 
         db.session.commit()
+        invalidate_customer_summary()
+        invalidate_customer_search()
+        invalidate_dashboard()  # 달력 / 계약 목록의 고객사명
         return jsonify({"ok": True, "message": "고객 정보가 수정되었습니다."})
     except Exception as e:
         db.session.rollback()
@@ -316,8 +389,10 @@ def add_contact(person_id):
             Reg_Date=datetime.now()
         )
         db.session.add(new_contact)
+        db.session.flush()
+        rows = render_rows([new_contact], _tab_people(person_id))
         db.session.commit()
-        return jsonify({"ok": True, "message": "담당자가 등록되었습니다."})
+        return jsonify({"ok": True, "message": "담당자가 등록되었습니다.", **rows})
     except Exception as e:
         db.session.rollback()
         return jsonify({"ok": False, "message": str(e)}), 500
@@ -365,9 +440,11 @@ def update_contact(person_id, contact_id):
         c.SMS_Receive_YN = request.form.get('sms_yn')
         c.Report_Receive_YN = request.form.get('report_yn')
 
+        db.session.flush()
+        rows = render_rows([c], _tab_people(person_id))
         db.session.commit()
         # [핵심] 메시지를 JSON으로 보냄
-        return jsonify({"ok": True, "message": "담당자 정보가 수정되었습니다."})
+        return jsonify({"ok": True, "message": "담당자 정보가 수정되었습니다.", **rows})
     except Exception as e:
         db.session.rollback()
         return jsonify({"ok": False, "message": str(e)}), 500
@@ -416,7 +493,7 @@ def add_server(person_id):
         return jsonify({"ok": False, "message": "입력된 서버 정보가 없습니다."}), 400
 
     try:
-        count = 0
+        added = []
         # 이름과 IP를 짝지어 반복 (zip)
         for name, ip in zip(names, ips):
             if not name.strip(): continue  # 이름 없으면 패스
@@ -432,10 +509,12 @@ def add_server(person_id):
                 Create_Date=datetime.now()
             )
             db.session.add(new_server)
-            count += 1
+            added.append(new_server)
 
+        db.session.flush()
+        rows = render_rows(added, _tab_people(person_id))
         db.session.commit()
-        return jsonify({"ok": True, "message": f"{count}대의 서버가 등록되었습니다."})
+        return jsonify({"ok": True, "message": f"{len(added)}대의 서버가 등록되었습니다.", **rows})
 
     except Exception as e:
         db.session.rollback()
@@ -472,9 +551,11 @@ def update_server(person_id, server_id):
         server.chServerName = request.form.get('server_name')
         server.chServerInfo = request.form.get('server_ip')
 
+        db.session.flush()
+        rows = render_rows([server], _tab_people(person_id))
         db.session.commit()
         # [핵심] JSON으로 성공 메시지 반환
-        return jsonify({"ok": True, "message": "서버 정보가 수정되었습니다."})
+        return jsonify({"ok": True, "message": "서버 정보가 수정되었습니다.", **rows})
     except Exception as e:
         db.session.rollback()
         return jsonify({"ok": False, "message": str(e)}), 500
@@ -582,32 +663,20 @@ def add_work(person_id):
         print(f"DEBUG: Files count: {len(files)}")
 
         has_file = False
-        upload_folder = current_app.config.get('UPLOAD_FOLDER', 'uploads')
-
-        if not os.path.isabs(upload_folder):
-            upload_folder = os.path.join(current_app.root_path, upload_folder)
-
-        if not os.path.exists(upload_folder):
-            os.makedirs(upload_folder)
 
         for file in files:
             if file and file.filename.strip():
                 has_file = True
                 original_filename = file.filename
 
-                # uuid import 확인
-                import uuid
-                ext = os.path.splitext(original_filename)[1]
-                safe_filename = f"{new_work.Work_ID}_{uuid.uuid4().hex[:8]}{ext}"
-
-                file_path = os.path.join(upload_folder, safe_filename)
-                file.save(file_path)
+                # 해시 기반 저장소 (같은 내용은 한 번만 저장, services/file_store.py)
+                stored = file_store.save_upload(file)
 
                 attachment = WorkAttachment(
                     Work_ID=new_work.Work_ID,
                     File_Name=original_filename,
-                    File_Path=safe_filename,
-                    File_Size=os.path.getsize(file_path),
+                    File_Path=stored.path,
+                    File_Size=stored.size,
                     Upload_Date=datetime.now()
                 )
                 db.session.add(attachment)
@@ -616,8 +685,9 @@ def add_work(person_id):
             new_work.Attachment_YN = "Y"
 
         db.session.commit()
+        invalidate_work_calendar(new_work.Work_Date)
         print("=== [DEBUG] add_work Success ===")
-        return jsonify({"ok": True, "message": "등록되었습니다."})
+        return jsonify({"ok": True, "message": "등록되었습니다.", "work_id": new_work.Work_ID})
 
     except Exception as e:
         db.session.rollback()
@@ -636,12 +706,14 @@ def update_work(person_id, work_id):
             return jsonify({"ok": False, "message": "해당 작업을 찾을 수 없습니다."}), 404
 
         # 1. 텍스트 정보 수정
+        old_work_date = work.Work_Date
         work.Work_Date = datetime.strptime(request.form.get('work_date'), '%Y-%m-%d').date()
         work.Work_Type = request.form.get('work_type')
         work.Summary = request.form.get('summary')
         work.Description = request.form.get('description')
 
         # 2. [복구됨] 파일 삭제 처리 (프론트엔드에서 보낸 delete_file_ids 처리)
+        released_paths = []
         delete_ids_json = request.form.get('delete_file_ids')
         if delete_ids_json:
             try:
@@ -653,34 +725,25 @@ def update_work(person_id, work_id):
                     ).all()
 
                     for att in attachments_to_delete:
-                        # (선택사항) 실제 파일 삭제 로직이 필요하면 여기에 추가
-                        # try:
-                        #     os.remove(os.path.join(current_app.config['UPLOAD_FOLDER'], att.File_Path))
-                        # except: pass
+                        # 실제 파일은 커밋 후 참조가 없을 때만 삭제 (file_store.release)
+                        released_paths.append(att.File_Path)
                         db.session.delete(att)
             except json.JSONDecodeError:
                 pass
 
                 # 3. 새 파일 추가
         files = request.files.getlist('files[]')
-        upload_folder = current_app.config.get('UPLOAD_FOLDER', 'uploads')
-        if not os.path.exists(upload_folder):
-            os.makedirs(upload_folder)
 
         for file in files:
             if file and file.filename.strip():
                 original_filename = file.filename
-                ext = os.path.splitext(original_filename)[1]
-                safe_filename = f"{work.Work_ID}_{uuid.uuid4().hex[:8]}{ext}"
-
-                file_path = os.path.join(upload_folder, safe_filename)
-                file.save(file_path)
+                stored = file_store.save_upload(file)
 
                 attachment = WorkAttachment(
                     Work_ID=work.Work_ID,
                     File_Name=original_filename,
-                    File_Path=safe_filename,
-                    File_Size=os.path.getsize(file_path),
+                    File_Path=stored.path,
+                    File_Size=stored.size,
                     Upload_Date=datetime.now()
                 )
                 db.session.add(attachment)
@@ -690,7 +753,10 @@ def update_work(person_id, work_id):
         count = db.session.query(WorkAttachment).filter_by(Work_ID=work_id).count()
         work.Attachment_YN = "Y" if count > 0 else "N"
 
+        new_work_date = work.Work_Date  # 커밋 후 읽으면 만료된 행을 다시 조회함
         db.session.commit()
+        file_store.release(*released_paths)
+        invalidate_work_calendar(old_work_date, new_work_date)
         return jsonify({"ok": True, "message": "수정되었습니다."})
     except Exception as e:
         db.session.rollback()
@@ -700,24 +766,17 @@ def update_work(person_id, work_id):
 # [3] 파일 다운로드 (한글 이름으로 내보내기)
 # 주의: 중복된 함수 중 경로 처리가 올바른 이 버전만 남김
 @bp.route("/download/<int:attachment_id>")
+@login_required
 def download_file(attachment_id):
     attachment = db.session.get(WorkAttachment, attachment_id)
     if not attachment:
         return "파일 정보를 찾을 수 없습니다.", 404
 
-    upload_folder = current_app.config.get('UPLOAD_FOLDER', 'uploads')
-
-    # DB에는 파일명만 저장되어 있으므로 폴더 경로와 합쳐야 함
-    file_path = os.path.join(upload_folder, attachment.File_Path)
-
-    if os.path.exists(file_path):
-        # [핵심] download_name에 원래 한글 이름을 넣어줌
-        return send_file(
-            file_path,
-            as_attachment=True,
-            download_name=attachment.File_Name
-        )
-    return "서버에 파일이 존재하지 않습니다.", 404
+    # [핵심] download_name에 원래 한글 이름을 넣어줌 (Range / ETag / 웹서버 전송은 services/downloads.py)
+    response = send_attachment(attachment.File_Path, attachment.File_Name)
+    if response is None:
+        return "서버에 파일이 존재하지 않습니다.", 404
+    return response
 
 
 # [4] 첨부파일 개별 삭제
@@ -730,10 +789,12 @@ def delete_attachment(person_id, attachment_id):
             return jsonify({"ok": False, "message": "파일이 없습니다."}), 404
 
         work_id = attachment.Work_ID
+        path = attachment.File_Path
 
-        # DB 삭제
+        # DB 삭제 (실제 파일은 다른 첨부에서 참조하지 않을 때만 삭제)
         db.session.delete(attachment)
         db.session.commit()
+        file_store.release(path)
 
         # 남은 파일 확인 후 Attachment_YN 업데이트
         remaining_count = db.session.query(WorkAttachment).filter_by(Work_ID=work_id).count()
@@ -760,12 +821,15 @@ def delete_work(person_id, work_id):
 
         # 첨부파일 DB 정보 삭제
         attachments = db.session.query(WorkAttachment).filter_by(Work_ID=work_id).all()
+        paths = [att.File_Path for att in attachments]
         for att in attachments:
             db.session.delete(att)
-            # (선택) 실제 파일 삭제 로직 추가 가능
 
+        work_date = work.Work_Date
         db.session.delete(work)
         db.session.commit()
+        file_store.release(*paths)
+        invalidate_work_calendar(work_date)
         return jsonify({"ok": True, "message": "삭제되었습니다."})
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,24 @@
+import hmac
+
+from flask import Blueprint, abort, current_app, request
+
+from ..extensions import db
+from ..services import metrics
+
+bp = Blueprint('metrics', __name__)
+
+
+# Prometheus 수집용 (로그인 없음). METRICS_TOKEN 이 있으면 Authorization: Bearer <토큰> 필요
+@bp.get('/metrics')
+def index():
+    token = current_app.config.get("METRICS_TOKEN")
+    if token:
+        given = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if not hmac.compare_digest(given.encode(), token.encode()):
+            abort(403)
+
+    return current_app.response_class(
+        metrics.render(db.engine),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+        headers={"Cache-Control": "no-store"},
+    )
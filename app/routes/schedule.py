@@ -1,62 +1,56 @@
-import calendar
-from datetime import date, timedelta, datetime
+import hashlib
+import json
+from datetime import date
 
-from flask import Blueprint, render_template, request
+from flask import Blueprint, current_app, render_template, request
 from flask_login import login_required
 
-from ..extensions import db
-from ..models.work_info import WorkInfo
-from ..models.ctm_people import CTMPeople
+from ..services.dashboard_data import work_calendar
+from ..services.month_calendar import adjacent_months, month_payload, month_weeks
 
 bp = Blueprint("schedule", __name__, url_prefix="/schedule")
 
 
+def _year_month():
+    today = date.today()
+    year = request.args.get("y", today.year, type=int)
+    month = request.args.get("m", today.month, type=int)
+    if not (1 <= month <= 12 and 1 <= year <= 9999):
+        return today.year, today.month
+    return year, month
+
+
 @bp.get("")
 @login_required
 def index():
-    today = date.today()
-    year = int(request.args.get("y", today.year))
-    month = int(request.args.get("m", today.month))
-
-    cal = calendar.Calendar(firstweekday=6)  # 일요일 시작
-    weeks = cal.monthdatescalendar(year, month)
-
-    start = weeks[0][0]
-    end = weeks[-1][-1]
-
-    # Work_Date는 DateTime이라 날짜 범위로 조회
-    start_dt = datetime.combine(start, datetime.min.time())
-    end_dt = datetime.combine(end, datetime.max.time())
-
-    rows = (
-        db.session.query(WorkInfo, CTMPeople)
-        .join(CTMPeople, CTMPeople.Person_ID == WorkInfo.Person_ID)
-        .filter(WorkInfo.Work_Date >= start_dt)
-        .filter(WorkInfo.Work_Date <= end_dt)
-        .order_by(WorkInfo.Work_Date.asc(), WorkInfo.Work_ID.asc())
-        .all()
-    )
+    year, month = _year_month()
 
-    by_day: dict[date, list[tuple[WorkInfo, CTMPeople]]] = {}
-    for work, people in rows:
-        if work.Work_Date is None:
-            continue
-        # Work_Date가 이미 date 객체인 경우 처리
-        work_date = work.Work_Date if isinstance(work.Work_Date, date) else work.Work_Date.date()
-        by_day.setdefault(work_date, []).append((work, people))
-
-    first = date(year, month, 1)
-    prev_month_last_day = first - timedelta(days=1)
-    next_month_first_day = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    # 첫 화면만 서버에서 그리고, 월 이동은 month_json 으로 받아 스크립트에서 다시 그림
+    (prev_y, prev_m), (next_y, next_m) = adjacent_months(year, month)
 
     return render_template(
         "schedule/index.html",
         year=year,
         month=month,
-        weeks=weeks,
-        by_day=by_day,
-        prev_y=prev_month_last_day.year,
-        prev_m=prev_month_last_day.month,
-        next_y=next_month_first_day.year,
-        next_m=next_month_first_day.month,
-    )
\ No newline at end of file
+        weeks=month_weeks(year, month),
+        by_day=work_calendar(year, month),
+        prev_y=prev_y,
+        prev_m=prev_m,
+        next_y=next_y,
+        next_m=next_m,
+    )
+
+
+@bp.get("/month")
+@login_required
+def month_json():
+    """월 달력 데이터 (?y=&m=). 내용이 같으면 ETag 로 304"""
+    year, month = _year_month()
+    payload = month_payload(year, month, work_calendar(year, month))
+
+    body = json.dumps({"ok": True, **payload}, ensure_ascii=False, separators=(",", ":"))
+    response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(hashlib.sha1(body.encode("utf-8")).hexdigest())
+    # 매번 재검증하되 바뀌지 않았으면 304 로 본문 없이 응답
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
@@ -7,6 +7,11 @@ from sqlalchemy import and_
 from ..extensions import db
 from ..models.sr_ticket import SRTicket
 from ..models.ctm_people import CTMPeople
+from ..services.export import Column, export_response
+from ..services.pagination import SortKey, keyset_paginate
+from ..services.search import contains
+from ..services.dashboard_data import invalidate_recent_sr
+from ..services.fragments import render_rows
 
 bp = Blueprint("sr", __name__, url_prefix="/sr")
 
@@ -25,6 +30,26 @@ def _clean(value: str | None) -> str | None:
     return v if v else None
 
 
+def _sr_list_query(location: str, company: str, content: str, date_from: date | None, date_to: date | None):
+    """SR 목록 조회 쿼리 (정렬 제외)"""
+    query = SRTicket.query  # db.session.query(SRTicket) 과 동일
+
+    if location: query = query.filter(contains(SRTicket.location, location))
+    if company: query = query.filter(contains(SRTicket.company, company))
+    if content: query = query.filter(contains(SRTicket.content, content))
+    if date_from: query = query.filter(SRTicket.request_date >= date_from)
+    if date_to: query = query.filter(SRTicket.request_date <= date_to)
+    return query
+
+
+# 최신순 정렬 = 커서 키
+SR_SORT_KEYS = [SortKey(SRTicket.request_date), SortKey(SRTicket.sr_id)]
+
+
+def _sr_sort_key(item):
+    return item.request_date, item.sr_id
+
+
 @bp.route("/list", methods=["GET"])
 @login_required
 def list_sr():
@@ -37,33 +62,26 @@ def list_sr():
     date_from = _parse_date(date_from_str)
     date_to = _parse_date(date_to_str)
 
-    # [수정] 페이지 번호 받기 (기본 1)
-    page = request.args.get('page', 1, type=int)
+    # page 가 있으면 기존 OFFSET 방식, 없으면 커서(keyset) 방식
+    page = request.args.get('page', type=int)
+    cursor = request.args.get('cursor')
 
     # 2. 쿼리 구성
-    query = SRTicket.query  # db.session.query(SRTicket) 과 동일
+    query = _sr_list_query(location, company, content, date_from, date_to)
 
-    if location: query = query.filter(SRTicket.location.ilike(f"%{location}%"))
-    if company: query = query.filter(SRTicket.company.ilike(f"%{company}%"))
-    if content: query = query.filter(SRTicket.content.ilike(f"%{content}%"))
-    if date_from: query = query.filter(SRTicket.request_date >= date_from)
-    if date_to: query = query.filter(SRTicket.request_date <= date_to)
-
-    # 3. 정렬 및 페이지네이션
-    # 최신순 정렬
-    query = query.order_by(SRTicket.request_date.desc(), SRTicket.sr_id.desc())
-
-    # [수정] paginate 적용 (한 페이지당 10개)
+    # 3. 정렬 및 페이지네이션 (한 페이지당 10개)
     per_page = 10
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-
-    # 사이트 목록 (모달용)
-    customers = CTMPeople.query.order_by(CTMPeople.Company, CTMPeople.Last_Name).all()
+    if page:
+        query = query.order_by(*[k.order_by() for k in SR_SORT_KEYS])
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    else:
+        pagination = keyset_paginate(query, SR_SORT_KEYS, _sr_sort_key, cursor, per_page)
 
+    # 사이트 선택(Select2)은 customers.ajax_search 로 원격 검색
     return render_template(
         "sr/list.html",
         pagination=pagination,  # items 대신 pagination 객체 전달
-        customers=customers,
+        keyset=not page,
         filters={
             "location": location,
             "company": company,
@@ -74,6 +92,75 @@ def list_sr():
     )
 
 
+SR_EXPORT_COLUMNS = [
+    Column("SR ID", lambda t: t.sr_id),
+    Column("요청일", lambda t: t.request_date),
+    Column("고객사", lambda t: t.company),
+    Column("사이트", lambda t: t.location),
+    Column("구분", lambda t: t.category),
+    Column("중요도", lambda t: t.severity),
+    Column("요청자", lambda t: t.requester),
+    Column("요청내용", lambda t: t.content),
+    Column("처리자", lambda t: t.handler),
+    Column("처리일", lambda t: t.handled_date),
+    Column("결과", lambda t: t.result),
+    Column("비고", lambda t: t.remark),
+    Column("등록자", lambda t: t.created_by),
+    Column("등록일시", lambda t: t.created_at),
+]
+
+
+@bp.get("/export")
+@login_required
+def export_sr():
+    """목록과 같은 검색 조건으로 SR 대장 내보내기 (?format=csv|xlsx)"""
+    query = _sr_list_query(
+        (request.args.get("location") or "").strip(),
+        (request.args.get("company") or "").strip(),
+        (request.args.get("content") or "").strip(),
+        _parse_date(request.args.get("from")),
+        _parse_date(request.args.get("to")),
+    ).order_by(*[k.order_by() for k in SR_SORT_KEYS])
+
+    response = export_response(request.args.get("format", "xlsx"), "SR대장", SR_EXPORT_COLUMNS, query, "SR")
+    if response is None:
+        return jsonify({"ok": False, "message": "지원하지 않는 형식입니다."}), 400
+    return response
+
+
+@bp.get("/ajax/list")
+@login_required
+def ajax_list_sr():
+    per_page = min(request.args.get("per_page", 10, type=int), 100)
+
+    query = _sr_list_query(
+        (request.args.get("location") or "").strip(),
+        (request.args.get("company") or "").strip(),
+        (request.args.get("content") or "").strip(),
+        _parse_date(request.args.get("from")),
+        _parse_date(request.args.get("to")),
+    )
+    pagination = keyset_paginate(query, SR_SORT_KEYS, _sr_sort_key, request.args.get("cursor"), per_page)
+
+    data = [{
+        "sr_id": it.sr_id,
+        "location": it.location,
+        "company": it.company,
+        "request_date": it.request_date.isoformat() if it.request_date else "",
+        "severity": it.severity,
+        "content": it.content,
+        "handler": it.handler,
+        "result": it.result,
+    } for it in pagination.items]
+
+    return jsonify({
+        "ok": True,
+        "items": data,
+        "next_cursor": pagination.next_cursor,
+        "prev_cursor": pagination.prev_cursor,
+    })
+
+
 @bp.get("/ajax/<int:sr_id>")
 @login_required
 def ajax_get_sr_detail(sr_id):
@@ -138,8 +225,11 @@ def ajax_create_sr():
         created_at=datetime.utcnow(),
     )
     db.session.add(item)
+    db.session.flush()
+    rows = render_rows([item])
     db.session.commit()
-    return jsonify({"ok": True, "id": item.sr_id})
+    invalidate_recent_sr()
+    return jsonify({"ok": True, "id": item.sr_id, **rows})
 
 
 @bp.post("/ajax/<int:sr_id>/update")
@@ -164,8 +254,11 @@ def ajax_update_sr(sr_id: int):
     item.updated_by = getattr(current_user, 'user_id', 'System')
     item.updated_at = datetime.utcnow()
 
+    db.session.flush()
+    rows = render_rows([item])
     db.session.commit()
-    return jsonify({"ok": True})
+    invalidate_recent_sr()
+    return jsonify({"ok": True, **rows})
 
 
 @bp.post("/ajax/<int:sr_id>/delete")
@@ -177,4 +270,5 @@ def ajax_delete_sr(sr_id: int):
 
     db.session.delete(item)
     db.session.commit()
+    invalidate_recent_sr()
     return jsonify({"ok": True})
\ No newline at end of file
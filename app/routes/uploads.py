@@ -1,14 +1,22 @@
-import os
-import uuid
-from flask import Blueprint, current_app, request, redirect, url_for, flash, send_from_directory
+import mimetypes
+import logging
+
+from flask import Blueprint, request, redirect, url_for, flash, jsonify, abort
 from flask_login import login_required, current_user
+from sqlalchemy import column, select, table
+from sqlalchemy.exc import DBAPIError
 from werkzeug.utils import secure_filename
 from datetime import datetime
 
 from ..extensions import db
 from ..models.note_attachments import NoteAttachment
+from ..models.work_attachments import WorkAttachment
+from ..models.work_info import WorkInfo
+from ..services import chunked_upload, file_store
+from ..services.downloads import send_attachment
 
 bp = Blueprint("uploads", __name__, url_prefix="/uploads")
+logger = logging.getLogger("soms.uploads")
 
 ALLOWED_EXT = {"png", "jpg", "jpeg", "pdf", "xlsx", "docx", "zip"}
 
@@ -42,24 +50,15 @@ def upload_note_attachment(note_id: int):
         return redirect(url_for("customers.detail", person_id=note.Person_ID))
 
     original = secure_filename(file.filename)
-    ext = original.rsplit(".", 1)[1].lower()
-    stored = f"{uuid.uuid4().hex}.{ext}"
-
-    upload_dir = current_app.config["UPLOAD_FOLDER"]
-    os.makedirs(upload_dir, exist_ok=True)
-
-    path = os.path.join(upload_dir, stored)
-    file.save(path)
-
-    size_bytes = os.path.getsize(path)
+    stored = file_store.save_upload(file)
     content_type = file.mimetype
 
     att = NoteAttachment(
         Note_ID=note.Note_ID,
         Original_Filename=original,
-        Stored_Filename=stored,
+        Stored_Filename=stored.path,
         Content_Type=content_type,
-        Size_Bytes=size_bytes,
+        Size_Bytes=stored.size,
         Uploaded_By=current_user.user_id,
         Uploaded_At=datetime.utcnow(),
         Deleted_YN="N",
@@ -74,5 +73,157 @@ def upload_note_attachment(note_id: int):
 @bp.get("/files/<path:stored_filename>")
 @login_required
 def download(stored_filename: str):
-    upload_dir = current_app.config["UPLOAD_FOLDER"]
-    return send_from_directory(upload_dir, stored_filename, as_attachment=True)
\ No newline at end of file
+    # 저장 파일명이 해시라 원래 파일명(확장자)은 첨부 행에서 가져옴
+    att = db.session.query(NoteAttachment).filter(NoteAttachment.Stored_Filename == stored_filename).first()
+    download_name = att.Original_Filename if att else None
+    response = send_attachment(stored_filename, download_name)
+    if response is None:
+        abort(404)
+    return response
+
+# -------------------------------------------------------------------------
+# [분할 업로드] init → PUT chunk → complete (services/chunked_upload.py)
+# -------------------------------------------------------------------------
+# Customer_Notes 는 모델이 없는 기존 테이블이라 대상 확인에 필요한 컬럼만 선언
+_customer_notes = table("Customer_Notes", column("Note_ID"), column("Deleted_YN"))
+
+TARGET_NOT_FOUND = {"work": "작업을 찾을 수 없습니다.", "note": "특이사항을 찾을 수 없습니다."}
+
+
+def _find_target(target_type: str, target_id: int):
+    """첨부 대상 작업(WorkInfo) / 특이사항 행. 없거나 삭제됐으면 None"""
+    if target_type == "work":
+        return db.session.get(WorkInfo, target_id)
+
+    try:
+        note = db.session.execute(
+            select(_customer_notes.c.Note_ID, _customer_notes.c.Deleted_YN)
+            .where(_customer_notes.c.Note_ID == target_id)
+        ).first()
+    except DBAPIError as e:
+        # 특이사항 테이블이 없는 DB (개발 / 테스트용)
+        db.session.rollback()
+        logger.warning("특이사항 조회 실패: %s", e.orig)
+        return None
+    return note if note and note.Deleted_YN != "Y" else None
+
+
+def _upload_error(e: chunked_upload.UploadError):
+    body = {"ok": False, "message": e.message}
+    if e.offset is not None:
+        body["offset"] = e.offset
+    return jsonify(body), e.status
+
+
+@bp.post("/chunked")
+@login_required
+def chunked_init():
+    data = request.get_json(silent=True) or request.form
+    try:
+        size = int(data.get("size"))
+        target_id = int(data.get("target_id"))
+    except (TypeError, ValueError):
+        return jsonify({"ok": False, "message": "size / target_id 값이 올바르지 않습니다."}), 400
+
+    target_type = data.get("target_type", "work")
+    if target_type in TARGET_NOT_FOUND and not _find_target(target_type, target_id):
+        return jsonify({"ok": False, "message": TARGET_NOT_FOUND[target_type]}), 404
+
+    try:
+        session = chunked_upload.create_session(
+            current_user.user_id, (data.get("filename") or "").strip(), size, target_type, target_id
+        )
+    except chunked_upload.UploadError as e:
+        return _upload_error(e)
+
+    return jsonify({"ok": True, "chunk_size": chunked_upload.CHUNK_SIZE, **chunked_upload.progress(session)})
+
+
+@bp.get("/chunked/<upload_id>")
+@login_required
+def chunked_status(upload_id: str):
+    try:
+        session = chunked_upload.load_session(upload_id, current_user.user_id)
+    except chunked_upload.UploadError as e:
+        return _upload_error(e)
+    return jsonify({"ok": True, **chunked_upload.progress(session)})
+
+
+@bp.put("/chunked/<upload_id>")
+@login_required
+def chunked_put(upload_id: str):
+    offset = request.args.get("offset", type=int)
+    if offset is None:
+        return jsonify({"ok": False, "message": "offset 이 필요합니다."}), 400
+
+    try:
+        session = chunked_upload.load_session(upload_id, current_user.user_id)
+        chunked_upload.append_chunk(session, offset, request.stream)
+    except chunked_upload.UploadError as e:
+        return _upload_error(e)
+    return jsonify({"ok": True, **chunked_upload.progress(session)})
+
+
+@bp.post("/chunked/<upload_id>/complete")
+@login_required
+def chunked_complete(upload_id: str):
+    # 세션은 첨부 행 커밋이 성공한 뒤에만 지움 (실패하면 complete 를 다시 호출할 수 있도록)
+    try:
+        session = chunked_upload.load_session(upload_id, current_user.user_id)
+        chunked_upload.check_received(session)
+    except chunked_upload.UploadError as e:
+        return _upload_error(e)
+
+    target_type = session["target_type"]
+    target = _find_target(target_type, session["target_id"])
+    if not target:
+        return jsonify({"ok": False, "message": TARGET_NOT_FOUND[target_type]}), 404
+
+    try:
+        stored = chunked_upload.finish(session)
+    except chunked_upload.UploadError as e:
+        return _upload_error(e)
+
+    try:
+        if target_type == "work":
+            att = WorkAttachment(
+                Work_ID=target.Work_ID,
+                File_Name=session["filename"],
+                File_Path=stored.path,
+                File_Size=stored.size,
+                Upload_Date=datetime.now(),
+            )
+            target.Attachment_YN = "Y"
+        else:
+            att = NoteAttachment(
+                Note_ID=target.Note_ID,
+                Original_Filename=secure_filename(session["filename"]),
+                Stored_Filename=stored.path,
+                Content_Type=mimetypes.guess_type(session["filename"])[0],
+                Size_Bytes=stored.size,
+                Uploaded_By=current_user.user_id,
+                Uploaded_At=datetime.utcnow(),
+                Deleted_YN="N",
+            )
+        db.session.add(att)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        file_store.release(stored.path)
+        logger.exception("분할 업로드 첨부 저장 실패 (%s)", upload_id)
+        return jsonify({"ok": False, "message": str(e)}), 500
+
+    chunked_upload.discard(session)
+    return jsonify({"ok": True, "message": "업로드가 완료되었습니다.", "attachment_id": att.Attachment_ID,
+                    "size": stored.size})
+
+
+@bp.delete("/chunked/<upload_id>")
+@login_required
+def chunked_abort(upload_id: str):
+    try:
+        session = chunked_upload.load_session(upload_id, current_user.user_id)
+    except chunked_upload.UploadError as e:
+        return _upload_error(e)
+    chunked_upload.discard(session)
+    return jsonify({"ok": True})
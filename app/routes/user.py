@@ -6,6 +6,7 @@ from datetime import datetime
 
 from app import db
 from app.models.user import User  # 모델 경로 확인
+from app.services.user_cache import invalidate_user
 
 bp = Blueprint('users', __name__, url_prefix='/users')
 
@@ -40,6 +41,7 @@ def list_users():
                         user.must_change_password = False
 
                     db.session.commit()
+                    invalidate_user(target_id)
                     flash('사용자 정보가 수정되었습니다.', 'success')
             else:
                 # [신규 등록 모드]
@@ -100,6 +102,7 @@ def delete_user(user_id):
         if user:
             db.session.delete(user)
             db.session.commit()
+            invalidate_user(user_id)
             flash('사용자가 삭제되었습니다.', 'success')
     except Exception as e:
         db.session.rollback()
@@ -1,16 +1,22 @@
 import os
-import uuid
 from datetime import datetime, date
 
 from flask import Blueprint, render_template, request, jsonify, current_app, send_from_directory, url_for
 from flask_login import login_required, current_user
 from sqlalchemy import or_, desc
-from werkzeug.utils import secure_filename
 
 from ..extensions import db
 from ..models.work_info import WorkInfo
 from ..models.work_attachments import WorkAttachment
 from ..models.ctm_people import CTMPeople
+from ..services.pagination import SortKey, keyset_paginate
+from ..services import file_store
+from ..services.customer_lookup import customer_option
+from ..services.downloads import send_attachment
+from ..services.export import Column, export_response
+from ..services.search import contains_any
+from ..services.dashboard_data import invalidate_work_calendar
+from ..services.fragments import render_rows
 
 bp = Blueprint("work", __name__, url_prefix="/work")
 
@@ -35,12 +41,7 @@ def _parse_date(value: str | None) -> date | None:
 
 
 def get_upload_folder():
-    folder = current_app.config.get("UPLOAD_FOLDER")
-    if not folder:
-        folder = os.path.join(current_app.root_path, "static", "uploads")
-    if not os.path.isabs(folder):
-        folder = os.path.join(current_app.root_path, folder)
-    return folder
+    return file_store.upload_root()
 
 
 def _save_work_file(work_id, file_obj):
@@ -50,25 +51,13 @@ def _save_work_file(work_id, file_obj):
         return False
 
     original_name = file_obj.filename
-    safe_name = secure_filename(original_name)
-    ext = os.path.splitext(safe_name)[1].lower()
-    stored_name = f"{uuid.uuid4().hex}{ext}"
-    upload_dir = get_upload_folder()
-
-    try:
-        os.makedirs(upload_dir, exist_ok=True)
-    except OSError:
-        pass
-
-    file_path = os.path.join(upload_dir, stored_name)
-    file_obj.save(file_path)
-    size_bytes = os.path.getsize(file_path)
+    stored = file_store.save_upload(file_obj)
 
     attachment = WorkAttachment(
         Work_ID=work_id,
         File_Name=original_name,
-        File_Path=stored_name,
-        File_Size=size_bytes,
+        File_Path=stored.path,
+        File_Size=stored.size,
         Upload_Date=datetime.now(),
     )
     db.session.add(attachment)
@@ -79,59 +68,126 @@ def _save_work_file(work_id, file_obj):
 # [View 라우트]
 # -------------------------------------------------------------------------
 
-@bp.route("/list", methods=["GET"])
-@login_required
-def list_work():
-    # 1. 파라미터 수신
-    q = (request.args.get("q") or "").strip()
-    date_from = _parse_date(request.args.get("from"))
-    date_to = _parse_date(request.args.get("to"))
-
-    # [수정됨] 페이지 번호 받기 (기본값 1)
-    page = request.args.get('page', 1, type=int)
-
-    # 2. 쿼리 구성 (WorkInfo + CTMPeople 조인)
+def _work_list_query(q: str, date_from: date | None, date_to: date | None):
+    """작업 목록 조회 쿼리 (WorkInfo + CTMPeople 조인, 정렬 제외)"""
     query = db.session.query(WorkInfo, CTMPeople).join(CTMPeople, CTMPeople.Person_ID == WorkInfo.Person_ID)
 
-    # 3. 필터링
     if q:
         query = query.filter(
-            or_(
-                CTMPeople.Company.ilike(f"%{q}%"),
-                CTMPeople.Last_Name.ilike(f"%{q}%"),
-                WorkInfo.Summary.ilike(f"%{q}%"),
-                WorkInfo.Submitter.ilike(f"%{q}%"),
-            )
+            contains_any(q, CTMPeople.Company, CTMPeople.Last_Name, WorkInfo.Summary, WorkInfo.Submitter)
         )
     if date_from:
         query = query.filter(WorkInfo.Work_Date >= date_from)
     if date_to:
         query = query.filter(WorkInfo.Work_Date <= date_to)
+    return query
 
-    # 4. 정렬 및 페이지네이션
-    # 최신 날짜순, 그리고 ID 역순 정렬
-    query = query.order_by(WorkInfo.Work_Date.desc().nulls_last(), WorkInfo.Work_ID.desc())
 
-    # [수정됨] paginate 적용 (한 페이지당 10개)
-    per_page = 10
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+# 최신 날짜순(NULL 마지막), 그리고 ID 역순 정렬 = 커서 키
+WORK_SORT_KEYS = [SortKey(WorkInfo.Work_Date, nullable=True), SortKey(WorkInfo.Work_ID)]
+
+
+def _work_sort_key(row):
+    w, _ = row
+    return w.Work_Date, w.Work_ID
+
+
+@bp.route("/list", methods=["GET"])
+@login_required
+def list_work():
+    # 1. 파라미터 수신
+    q = (request.args.get("q") or "").strip()
+    date_from = _parse_date(request.args.get("from"))
+    date_to = _parse_date(request.args.get("to"))
+
+    # page 가 있으면 기존 OFFSET 방식, 없으면 커서(keyset) 방식
+    page = request.args.get('page', type=int)
+    cursor = request.args.get('cursor')
+
+    # 2. 쿼리 구성 및 필터링
+    query = _work_list_query(q, date_from, date_to)
 
-    # 5. 등록 모달(Select2)에서 사용할 전체 고객 리스트
-    people = db.session.query(CTMPeople).order_by(CTMPeople.Company).all()
+    # 3. 정렬 및 페이지네이션 (한 페이지당 10개)
+    per_page = 10
+    if page:
+        query = query.order_by(*[k.order_by() for k in WORK_SORT_KEYS])
+        pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    else:
+        pagination = keyset_paginate(query, WORK_SORT_KEYS, _work_sort_key, cursor, per_page)
 
+    # 등록/수정 모달의 고객 선택(Select2)은 customers.ajax_search 로 원격 검색
     return render_template(
         "work/list.html",
         pagination=pagination,  # rows 대신 pagination 객체 전달
-        people=people,
+        keyset=not page,
         filters={"q": q, "from": request.args.get("from", ""), "to": request.args.get("to", "")},
         today_date=datetime.now().strftime('%Y-%m-%d')
     )
 
 
+WORK_EXPORT_COLUMNS = [
+    Column("작업ID", lambda r: r[0].Work_ID),
+    Column("작업일", lambda r: r[0].Work_Date),
+    Column("고객사", lambda r: r[1].Company),
+    Column("사이트", lambda r: r[1].Last_Name),
+    Column("작업유형", lambda r: r[0].Work_Type),
+    Column("요약", lambda r: r[0].Summary),
+    Column("상세내용", lambda r: r[0].Description),
+    Column("작성자", lambda r: r[0].Submitter),
+    Column("첨부", lambda r: r[0].Attachment_YN),
+    Column("등록일", lambda r: r[0].Create_Date),
+]
+
+
+@bp.get("/export")
+@login_required
+def export_work():
+    """목록과 같은 검색 조건으로 전체 작업 이력 내보내기 (?format=csv|xlsx)"""
+    query = _work_list_query(
+        (request.args.get("q") or "").strip(),
+        _parse_date(request.args.get("from")),
+        _parse_date(request.args.get("to")),
+    ).order_by(*[k.order_by() for k in WORK_SORT_KEYS])
+
+    response = export_response(request.args.get("format", "xlsx"), "작업이력", WORK_EXPORT_COLUMNS, query, "작업이력")
+    if response is None:
+        return jsonify({"ok": False, "message": "지원하지 않는 형식입니다."}), 400
+    return response
+
+
 # -------------------------------------------------------------------------
 # [API 라우트] (AJAX) - 기존 로직 유지
 # -------------------------------------------------------------------------
 
+@bp.get("/ajax/list")
+@login_required
+def ajax_list_work():
+    q = (request.args.get("q") or "").strip()
+    per_page = min(request.args.get("per_page", 10, type=int), 100)
+
+    query = _work_list_query(q, _parse_date(request.args.get("from")), _parse_date(request.args.get("to")))
+    pagination = keyset_paginate(query, WORK_SORT_KEYS, _work_sort_key, request.args.get("cursor"), per_page)
+
+    data = [{
+        "work_id": w.Work_ID,
+        "person_id": w.Person_ID,
+        "company": p.Company,
+        "location": p.Last_Name,
+        "work_date": w.Work_Date.isoformat() if w.Work_Date else "",
+        "work_type": w.Work_Type,
+        "summary": w.Summary,
+        "attachment_yn": w.Attachment_YN,
+        "submitter": w.Submitter,
+    } for w, p in pagination.items]
+
+    return jsonify({
+        "ok": True,
+        "items": data,
+        "next_cursor": pagination.next_cursor,
+        "prev_cursor": pagination.prev_cursor,
+    })
+
+
 @bp.post("/ajax/create")
 @login_required
 def ajax_create_work():
@@ -169,8 +225,12 @@ def ajax_create_work():
     if has_file:
         item.Attachment_YN = "Y"
 
+    db.session.flush()
+    work_id, work_date = item.Work_ID, item.Work_Date  # 커밋 후 읽으면 만료된 행을 다시 조회함
+    rows = render_rows([item], lambda: item.people)
     db.session.commit()
-    return jsonify({"ok": True, "message": "작업이 등록되었습니다."})
+    invalidate_work_calendar(work_date)
+    return jsonify({"ok": True, "message": "작업이 등록되었습니다.", "work_id": work_id, **rows})
 
 
 @bp.get("/ajax/<int:work_id>/detail")
@@ -185,6 +245,7 @@ def ajax_get_work_detail(work_id):
         "data": {
             "work_id": w.Work_ID,
             "person_id": w.Person_ID,
+            "customer": customer_option(w.people) if w.people else None,
             "work_date": w.Work_Date.isoformat() if w.Work_Date else "",
             "work_type": w.Work_Type,
             "summary": w.Summary,
@@ -200,6 +261,7 @@ def ajax_update_work(work_id):
     if not item:
         return jsonify({"ok": False, "message": "작업을 찾을 수 없습니다."}), 404
 
+    old_work_date = item.Work_Date
     item.Person_ID = request.form.get("person_id")
     item.Work_Date = _parse_date(request.form.get("work_date"))
     item.Work_Type = request.form.get("work_type")
@@ -215,8 +277,22 @@ def ajax_update_work(work_id):
     if has_new_file:
         item.Attachment_YN = "Y"
 
+    db.session.flush()
+    new_work_date = item.Work_Date
+    rows = render_rows([item], lambda: item.people)
     db.session.commit()
-    return jsonify({"ok": True, "message": "작업 정보가 수정되었습니다."})
+    invalidate_work_calendar(old_work_date, new_work_date)
+    return jsonify({"ok": True, "message": "작업 정보가 수정되었습니다.", **rows})
+
+
+@bp.get("/ajax/<int:work_id>/row")
+@login_required
+def ajax_work_row(work_id):
+    """작업 한 건의 목록 행 조각 (분할 업로드로 첨부 여부가 바뀐 뒤 다시 그릴 때)"""
+    item = db.session.get(WorkInfo, work_id)
+    if not item:
+        return jsonify({"ok": False, "message": "데이터 없음"}), 404
+    return jsonify({"ok": True, **render_rows([item], lambda: item.people)})
 
 
 @bp.post("/ajax/<int:work_id>/delete")
@@ -227,18 +303,16 @@ def ajax_delete_work(work_id):
         return jsonify({"ok": False, "message": "데이터 없음"}), 404
 
     attachments = db.session.query(WorkAttachment).filter_by(Work_ID=work_id).all()
-    upload_dir = get_upload_folder()
+    paths = [att.File_Path for att in attachments]
 
     for att in attachments:
-        try:
-            path = os.path.join(upload_dir, att.File_Path)
-            if os.path.exists(path): os.remove(path)
-        except:
-            pass
         db.session.delete(att)
 
+    work_date = item.Work_Date
     db.session.delete(item)
     db.session.commit()
+    file_store.release(*paths)  # 다른 첨부에서 참조하지 않는 파일만 삭제
+    invalidate_work_calendar(work_date)
     return jsonify({"ok": True, "message": "삭제되었습니다."})
 
 
@@ -263,15 +337,11 @@ def ajax_delete_attachment(attachment_id):
         return jsonify({"ok": False}), 404
 
     work_id = att.Work_ID
-    upload_dir = get_upload_folder()
-    try:
-        path = os.path.join(upload_dir, att.File_Path)
-        if os.path.exists(path): os.remove(path)
-    except:
-        pass
+    path = att.File_Path
 
     db.session.delete(att)
     db.session.commit()
+    file_store.release(path)
 
     remaining = db.session.query(WorkAttachment).filter_by(Work_ID=work_id).count()
     work = db.session.get(WorkInfo, work_id)
@@ -288,8 +358,7 @@ def download_attachment(attachment_id):
     att = db.session.get(WorkAttachment, attachment_id)
     if not att: return "File not found", 404
 
-    upload_dir = get_upload_folder()
-    try:
-        return send_from_directory(upload_dir, att.File_Path, as_attachment=True, download_name=att.File_Name)
-    except FileNotFoundError:
-        return "File Not Found on Server", 404
\ No newline at end of file
+    response = send_attachment(att.File_Path, att.File_Name)
+    if response is None:
+        return "File Not Found on Server", 404
+    return response
\ No newline at end of file
@@ -0,0 +1,306 @@
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import re
+import urllib.request
+
+from flask import Flask, current_app, url_for
+from markupsafe import Markup
+
+# 정적 자원(js / css) 묶음 + 내용 해시 파일명
+#
+# 화면마다 필요한 스크립트만 묶어서(BUNDLES) 한 파일로 내려보냅니다.
+#   vendor.css / vendor.js   Bootstrap, jQuery, Select2, SweetAlert2, 글꼴 (static/vendor 에 받아 둔 파일)
+#   app.css / common.js      soms.css / soms.js (모든 화면 공통)
+#   <화면>.js                화면 전용 스크립트 (템플릿의 {% block scripts %} 에서 asset_tags("work") 등)
+#
+# 배포 순서
+#   flask vendor-assets   외부 라이브러리를 static/vendor 로 받기 (인터넷이 되는 곳에서 한 번, 결과를 저장소에 커밋)
+#   flask build-assets    묶기 + 압축(minify) → static/dist/<이름>.<해시>.js, static/dist/manifest.json
+#   flask compress-static dist 파일의 .gz / .br 생성
+# build-assets 는 vendor 파일이 하나라도 없으면 실패하므로 배포 파이프라인에서 이 명령의 성공을 배포 조건으로 둡니다.
+#
+# manifest.json 이 있으면 해시 파일명으로, 없거나 ASSETS_DEBUG 이면 원본 파일을 하나씩 내려보냅니다. (개발 중 수정 바로 반영)
+# 해시 / 버전이 경로에 들어간 dist/, vendor/ 는 내용이 바뀌면 주소도 바뀌므로 1년 immutable 캐시를 붙입니다.
+# vendor 파일을 아직 받지 않았으면 원본 CDN 주소로 대신 내려보냅니다. (개발 환경용, 폐쇄망에서는 vendor-assets 필수)
+# ASSETS_DEBUG 가 꺼져 있는데 manifest 가 없거나 CDN 으로 대신할 vendor 파일이 있으면 시작할 때 soms.assets 경고를 남깁니다.
+
+logger = logging.getLogger("soms.assets")
+
+# 외부 라이브러리: static/vendor/<이름>/<경로> ← <기준 URL><경로>
+# css 가 참조하는 글꼴(url(...))은 vendor-assets 가 같은 상대 경로로 함께 받습니다.
+VENDOR_PACKAGES = {
+    "bootstrap@5.3.3": ("https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/", [
+        "dist/css/bootstrap.min.css",
+        "dist/js/bootstrap.bundle.min.js",
+    ]),
+    "jquery@3.7.1": ("https://code.jquery.com/", [
+        "jquery-3.7.1.min.js",
+    ]),
+    "select2@4.1.0-rc.0": ("https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/", [
+        "dist/css/select2.min.css",
+        "dist/js/select2.min.js",
+    ]),
+    "select2-bootstrap-5-theme@1.3.0": ("https://cdn.jsdelivr.net/npm/select2-bootstrap-5-theme@1.3.0/", [
+        "dist/select2-bootstrap-5-theme.min.css",
+    ]),
+    "sweetalert2@11.10.5": ("https://cdn.jsdelivr.net/npm/sweetalert2@11.10.5/", [
+        "dist/sweetalert2.all.min.js",
+    ]),
+    "pretendard@1.3.9": ("https://cdn.jsdelivr.net/gh/orioncactus/pretendard@v1.3.9/", [
+        "dist/web/static/pretendard.css",
+    ]),
+    "font-awesome@6.5.2": ("https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/", [
+        "css/all.min.css",
+    ]),
+    "bootstrap-icons@1.11.3": ("https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.3/", [
+        "font/bootstrap-icons.min.css",
+    ]),
+}
+
+# 묶음 이름 → static 기준 파일 목록 (순서대로 이어 붙임)
+BUNDLES = {
+    "vendor.css": [
+        "vendor/bootstrap@5.3.3/dist/css/bootstrap.min.css",
+        "vendor/select2@4.1.0-rc.0/dist/css/select2.min.css",
+        "vendor/select2-bootstrap-5-theme@1.3.0/dist/select2-bootstrap-5-theme.min.css",
+        "vendor/pretendard@1.3.9/dist/web/static/pretendard.css",
+        "vendor/font-awesome@6.5.2/css/all.min.css",
+        "vendor/bootstrap-icons@1.11.3/font/bootstrap-icons.min.css",
+    ],
+    "app.css": ["css/soms.css"],
+    "vendor.js": [
+        "vendor/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js",
+        "vendor/jquery@3.7.1/jquery-3.7.1.min.js",
+        "vendor/select2@4.1.0-rc.0/dist/js/select2.min.js",
+        "vendor/sweetalert2@11.10.5/dist/sweetalert2.all.min.js",
+    ],
+    "common.js": ["js/soms.js"],
+    # work.js 의 createWork / openWorkEditModal / updateWork / deleteWork 가 customer.js 의 같은 이름 함수를
+    # 덮어쓰는 기존 동작(예전 base.html 의 로딩 순서)을 그대로 유지
+    "customers-detail.js": ["js/customer.js", "js/work.js", "js/contracts.js"],
+    "work.js": ["js/work.js"],
+    "dashboard.js": ["js/dashboard.js"],
+    "sr.js": ["js/sr.js"],
+    "asset.js": ["js/asset.js"],
+    "users.js": ["js/users.js"],
+}
+
+DIST_DIR = "dist"
+MANIFEST = "dist/manifest.json"
+IMMUTABLE_PREFIXES = ("dist/", "vendor/")
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+_CSS_URL = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+def _is_relative(url: str) -> bool:
+    return not re.match(r"^([a-z][a-z0-9+.-]*:|/|#)", url, re.I)
+
+
+def _vendor_source_url(path: str) -> str | None:
+    """vendor/<이름>/<경로> 의 원본 CDN 주소"""
+    parts = path.split("/", 2)
+    if len(parts) < 3 or parts[0] != "vendor" or parts[1] not in VENDOR_PACKAGES:
+        return None
+    return VENDOR_PACKAGES[parts[1]][0] + parts[2]
+
+
+# ---------------------------------------------------------------------------
+# 템플릿
+# ---------------------------------------------------------------------------
+def _load_manifest(app: Flask) -> dict:
+    path = os.path.join(app.static_folder, MANIFEST)
+    if app.config["ASSETS_DEBUG"] or not os.path.isfile(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["bundles"]
+
+
+def _source_url(path: str) -> str:
+    if path.startswith("vendor/") and not os.path.isfile(os.path.join(current_app.static_folder, path)):
+        return _vendor_source_url(path) or url_for("static", filename=path)
+    return url_for("static", filename=path)
+
+
+def _tag(url: str, ext: str) -> str:
+    if ext == ".css":
+        return f'<link href="{url}" rel="stylesheet">'
+    return f'<script src="{url}"></script>'
+
+
+def asset_urls(name: str) -> list[str]:
+    """묶음의 주소 목록 (빌드된 묶음이 있으면 1개)"""
+    built = current_app.extensions["soms_assets"].get(name)
+    if built:
+        return [url_for("static", filename=built)]
+    return [_source_url(p) for p in BUNDLES[name]]
+
+
+def asset_tags(*names: str) -> Markup:
+    """템플릿용: {{ asset_tags("vendor.js", "common.js") }}"""
+    tags = []
+    for name in names:
+        ext = os.path.splitext(name)[1]
+        tags.extend(_tag(url, ext) for url in asset_urls(name))
+    return Markup("\n".join(tags))
+
+
+def _static_view(app: Flask):
+    original = app.view_functions["static"]
+
+    def static(filename):
+        response = original(filename=filename)
+        if filename.startswith(IMMUTABLE_PREFIXES) and response.status_code == 200:
+            response.cache_control.public = True
+            response.cache_control.max_age = IMMUTABLE_MAX_AGE
+            response.cache_control.immutable = True
+            response.cache_control.no_cache = None
+        return response
+
+    return static
+
+
+def missing_vendor_files(static_folder: str) -> list[str]:
+    """묶음에 들어가는 vendor 파일 중 static/vendor 에 없는 파일 (화면에서는 CDN 주소로 대신함)"""
+    return [p for files in BUNDLES.values() for p in files
+            if p.startswith("vendor/") and not os.path.isfile(os.path.join(static_folder, p))]
+
+
+def _warn_unbuilt(app: Flask):
+    """운영 설정(ASSETS_DEBUG 꺼짐)인데 빌드 결과가 없으면 경고 (배포 단계에서 build-assets 누락)"""
+    if app.config["ASSETS_DEBUG"] or app.extensions["soms_assets"]:
+        return
+    logger.warning("%s 이 없어 js / css 원본을 하나씩 내려보냅니다. (배포 시 flask build-assets 실행)", MANIFEST)
+    missing = missing_vendor_files(app.static_folder)
+    if missing:
+        logger.warning("static/vendor 에 없는 파일 %d개를 외부 CDN 주소로 대신합니다. (flask vendor-assets 실행): %s",
+                       len(missing), ", ".join(missing))
+
+
+def init_assets(app: Flask):
+    app.config.setdefault("ASSETS_DEBUG", False)
+    app.extensions["soms_assets"] = _load_manifest(app)
+    app.add_template_global(asset_tags)
+    app.view_functions["static"] = _static_view(app)
+    _warn_unbuilt(app)
+
+
+# ---------------------------------------------------------------------------
+# 빌드 (flask build-assets / vendor-assets)
+# ---------------------------------------------------------------------------
+def _rewrite_css_urls(css: str, source: str, target: str) -> str:
+    """source(static 기준 경로) 의 상대 url() 을 target 위치 기준으로 바꿈"""
+    source_dir = posixpath.dirname(source)
+    target_dir = posixpath.dirname(target)
+
+    def replace(m):
+        url = m.group(2).strip()
+        if not _is_relative(url) or url.startswith("data:"):
+            return m.group(0)
+        resolved = posixpath.normpath(posixpath.join(source_dir, url))
+        return f'url("{posixpath.relpath(resolved, target_dir)}")'
+
+    return _CSS_URL.sub(replace, css)
+
+
+def _minify(text: str, ext: str) -> str:
+    try:
+        import rcssmin
+        import rjsmin
+    except ImportError as e:
+        raise RuntimeError("minify 모듈이 없습니다. (pip install rjsmin rcssmin)") from e
+    if ext == ".css":
+        return rcssmin.cssmin(text)
+    return rjsmin.jsmin(text)
+
+
+def build_bundles(static_folder: str, log=print) -> dict:
+    """BUNDLES 를 묶어 dist/ 에 해시 파일명으로 저장하고 manifest.json 을 씀"""
+    missing = [p for files in BUNDLES.values() for p in files
+               if not os.path.isfile(os.path.join(static_folder, p))]
+    if missing:
+        raise RuntimeError("없는 파일이 있습니다 (flask vendor-assets 먼저 실행): " + ", ".join(missing))
+
+    dist = os.path.join(static_folder, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+    manifest_path = os.path.join(static_folder, MANIFEST)
+    previous = {}
+    if os.path.isfile(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f)["bundles"]
+
+    built = {}
+    for name, files in BUNDLES.items():
+        stem, ext = os.path.splitext(name)
+        parts = []
+        for path in files:
+            with open(os.path.join(static_folder, path), encoding="utf-8") as f:
+                text = f.read()
+            if ext == ".css":
+                text = _rewrite_css_urls(text, path, f"{DIST_DIR}/{name}")
+            parts.append(_minify(text, ext).strip())
+        # 파일 끝에 ; 이 없는 스크립트끼리 붙어도 문장이 이어지지 않도록
+        body = (";\n" if ext == ".js" else "\n").join(parts) + "\n"
+        data = body.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:10]
+        target = f"{DIST_DIR}/{stem}.{digest}{ext}"
+        with open(os.path.join(static_folder, target), "wb") as f:
+            f.write(data)
+        built[name] = target
+        size = sum(os.path.getsize(os.path.join(static_folder, p)) for p in files)
+        log(f"{target}  {size:,} → {len(data):,} bytes ({len(files)}개 파일)")
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"bundles": built}, f, ensure_ascii=False, indent=2)
+
+    # 이번 빌드와 직전 빌드 파일만 남김 (배포 중 이전 페이지가 아직 직전 파일을 요청할 수 있음)
+    keep = {os.path.basename(p) for p in list(built.values()) + list(previous.values())}
+    keep.add(os.path.basename(MANIFEST))
+    for entry in os.listdir(dist):
+        base = entry[:-3] if entry.endswith((".gz", ".br")) else entry
+        if base not in keep:
+            os.remove(os.path.join(dist, entry))
+    return built
+
+
+def _download(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return response.read()
+
+
+def fetch_vendor(static_folder: str, force: bool = False, log=print) -> int:
+    """VENDOR_PACKAGES 를 static/vendor 로 받음 (css 가 참조하는 글꼴 포함). 받은 파일 수"""
+    fetched = 0
+    for package, (base_url, files) in VENDOR_PACKAGES.items():
+        root = os.path.join(static_folder, "vendor", package)
+        queue = list(files)
+        seen = set()
+        while queue:
+            rel = queue.pop(0)
+            if rel in seen:
+                continue
+            seen.add(rel)
+            local = os.path.join(root, *rel.split("/"))
+            if force or not os.path.isfile(local):
+                data = _download(base_url + rel)
+                os.makedirs(os.path.dirname(local), exist_ok=True)
+                with open(local, "wb") as f:
+                    f.write(data)
+                fetched += 1
+                log(f"vendor/{package}/{rel}  {len(data):,} bytes")
+            if rel.endswith(".css"):
+                with open(local, encoding="utf-8") as f:
+                    css = f.read()
+                for m in _CSS_URL.finditer(css):
+                    url = m.group(2).strip().split("?")[0].split("#")[0]
+                    if not url or not _is_relative(url):
+                        continue
+                    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(rel), url))
+                    if resolved.startswith("../"):
+                        # 패키지 밖을 가리키는 경로는 받을 수 없음
+                        raise RuntimeError(f"{package}/{rel}: 패키지 밖 경로 {url}")
+                    queue.append(resolved)
+    return fetched
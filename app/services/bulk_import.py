@@ -0,0 +1,306 @@
+import re
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from ..extensions import db
+from ..models.ast_computersystem import AST_Computer_System
+from ..models.contacts import Contact
+from ..models.servers import ServerInfo
+from .ip_search import fill_inet_values
+from .tabular import TabularError, iter_rows
+
+# 보안장비 / 서버 / 담당자 일괄 등록 (CSV / XLSX)
+#
+# 파일을 한 행씩 읽어 BATCH_SIZE 건씩 검증하고, 검증된 배치는 executemany 한 번으로 넣습니다.
+# 장비명(AST_Computer_System.Name)은 UNIQUE 라 같은 고객의 기존 장비는 갱신(upsert)합니다.
+# 오류가 한 건이라도 있으면 전체를 되돌리고 행 번호별 오류만 돌려줍니다. (고쳐서 다시 올리면 됨)
+# 열 제목은 export.py 로 내려받은 파일의 제목과 모델 속성명을 모두 인식하며, 모르는 열은 무시합니다.
+
+BATCH_SIZE = 500
+MAX_ERRORS = 200
+
+_EXCEL_EPOCH = date(1899, 12, 30)
+_EXCEL_SERIAL_MAX = 100_000  # 2173년 (그 이상의 숫자는 날짜 일련번호로 보지 않음)
+_NUMBER = re.compile(r"^\d+(\.\d+)?$")
+
+
+class ImportResult:
+    def __init__(self):
+        self.total = 0
+        self.inserted = 0
+        self.updated = 0
+        self.errors: list[dict] = []
+
+    def error(self, row_no: int, message: str):
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row_no, "message": message})
+
+    @property
+    def error_count(self):
+        return len(self.errors)
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "errors": sorted(self.errors, key=lambda e: e["row"]),
+        }
+
+
+# ---------------------------------------------------------------------------
+# 값 변환 (잘못된 값이면 ValueError)
+# ---------------------------------------------------------------------------
+def _text(value: str):
+    return value or None
+
+
+def _date(value: str):
+    if not value:
+        return None
+    if _NUMBER.match(value) and not (value.isdigit() and len(value) == 8):
+        # 엑셀 날짜 일련번호 (8자리 숫자는 20240101 형식으로 봄)
+        if float(value) < _EXCEL_SERIAL_MAX:
+            return _EXCEL_EPOCH + timedelta(days=int(float(value)))
+        raise ValueError(f"날짜 형식이 아닙니다: {value}")
+    for fmt in ("%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value[:10], fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"날짜 형식이 아닙니다: {value}")
+
+
+def _choice(labels: dict):
+    def parse(value: str):
+        if not value:
+            return None
+        if value in labels:
+            return labels[value]
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"알 수 없는 값입니다: {value}")
+    return parse
+
+
+def _yn(value: str):
+    if not value:
+        return "N"
+    return "Y" if value.strip().upper() in ("Y", "O", "TRUE", "1", "예", "수신") else "N"
+
+
+ASSET_STATUS_LABELS = {"주문됨": 0, "입고됨": 1, "사용중": 3, "폐기": 11}
+
+
+class Field:
+    def __init__(self, attr: str, headers: tuple, parse=_text, required: bool = False):
+        self.attr = attr
+        self.headers = headers
+        self.parse = parse
+        self.required = required
+
+
+class ImportSpec:
+    def __init__(self, model, title: str, fields: list[Field], upsert_key: str | None = None):
+        self.model = model
+        self.title = title
+        self.fields = fields
+        self.upsert_key = upsert_key
+
+    def resolve_header(self, header_row: list[str]) -> dict[int, Field]:
+        aliases = {}
+        for f in self.fields:
+            for h in (f.attr, *f.headers):
+                aliases[_norm(h)] = f
+        return {i: aliases[_norm(h)] for i, h in enumerate(header_row) if _norm(h) in aliases}
+
+
+def _norm(header: str) -> str:
+    return re.sub(r"[\s_()]", "", (header or "").lower())
+
+
+IMPORT_SPECS = {
+    "assets": ImportSpec(AST_Computer_System, "보안장비", [
+        Field("Name", ("장비명", "CI 이름", "ci_name"), required=True),
+        Field("Owner_name", ("사이트", "사이트명", "owner_name"), required=True),
+        Field("Category", ("구분", "제품 계층 1")),
+        Field("Type", ("유형", "제품 계층 2")),
+        Field("Item", ("품목", "제품 계층 3")),
+        Field("Product_Name", ("제품명", "제품 이름")),
+        Field("Manufacturer_Name", ("제조사",)),
+        Field("Model_Number", ("모델명",)),
+        Field("Version_Number", ("버전", "os_version")),
+        Field("Serial_Number", ("시리얼", "시리얼 번호")),
+        Field("IP_Address", ("IP", "IP 주소")),
+        Field("Supplier", ("공급자",)),
+        Field("Region", ("리전",)),
+        Field("IDC_Site", ("IDC", "DC 위치")),
+        Field("AssetLifecycleStatus", ("상태",), _choice(ASSET_STATUS_LABELS)),
+        Field("InstallationDate", ("설치일",), _date),
+        Field("PurchaseDate", ("구매일",), _date),
+        Field("License_Expiry_Date", ("라이선스 만료일",), _date),
+        Field("Short_Description", ("장비 특이사항", "특이사항")),
+        Field("Description", ("비고",)),
+    ], upsert_key="Name"),
+    "servers": ImportSpec(ServerInfo, "서버", [
+        Field("chServerName", ("서버명", "server_name"), required=True),
+        Field("chServerInfo", ("IP", "서버 IP", "server_ip")),
+    ]),
+    "contacts": ImportSpec(Contact, "담당자", [
+        Field("Name", ("이름", "담당자명"), required=True),
+        Field("Role_Type", ("정/부", "구분")),
+        Field("General_Phone", ("일반전화",)),
+        Field("Phone", ("휴대폰", "휴대폰 번호")),
+        Field("Email", ("이메일",)),
+        Field("Status", ("상태",)),
+        Field("SMS_Receive_YN", ("침탐수신", "SMS 수신"), _yn),
+        Field("Report_Receive_YN", ("보고서수신",), _yn),
+    ]),
+}
+
+
+# ---------------------------------------------------------------------------
+# 저장
+# ---------------------------------------------------------------------------
+def _upsert_statement(spec: ImportSpec, columns: list[str]):
+    """upsert_key 충돌 시 나머지 열을 갱신하는 INSERT (PostgreSQL / SQLite)"""
+    table = spec.model.__table__
+    dialect = db.engine.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+
+    stmt = dialect_insert(table)
+    update_cols = {c: stmt.excluded[c] for c in columns if c != spec.upsert_key}
+    return stmt.on_conflict_do_update(index_elements=[spec.upsert_key], set_=update_cols)
+
+
+def _check_owners(spec: ImportSpec, person_id: str, batch: list[tuple[int, dict]], result: ImportResult) -> set:
+    """다른 고객사에 이미 등록된 키는 오류로 기록하고, 이 고객의 기존 키 집합을 반환"""
+    key = spec.upsert_key
+    key_col = getattr(spec.model, key)
+    owners = dict(
+        db.session.query(key_col, spec.model.Person_ID)
+        .filter(key_col.in_([values[key] for _, values in batch]))
+        .all()
+    )
+    for row_no, values in batch:
+        owner = owners.get(values[key])
+        if owner is not None and owner != person_id:
+            result.error(row_no, f"다른 고객사에 이미 등록된 값입니다: {values[key]}")
+    return {k for k, owner in owners.items() if owner == person_id}
+
+
+def _write_batch(spec: ImportSpec, batch: list[tuple[int, dict]], existing: set, result: ImportResult):
+    rows = [values for _, values in batch]
+    if not spec.upsert_key:
+        db.session.execute(insert(spec.model.__table__), rows)
+        result.inserted += len(rows)
+        return
+
+    key = spec.upsert_key
+    updated = sum(1 for v in rows if v[key] in existing)
+    result.updated += updated
+    result.inserted += len(rows) - updated
+
+    stmt = _upsert_statement(spec, list(rows[0]))
+    if stmt is None:
+        # ON CONFLICT 를 지원하지 않는 DB 는 기존 행 UPDATE + 새 행 INSERT
+        key_col = getattr(spec.model, key)
+        for values in rows:
+            if values[key] in existing:
+                db.session.query(spec.model).filter(key_col == values[key]).update(values)
+        rows = [v for v in rows if v[key] not in existing]
+        stmt = insert(spec.model.__table__)
+    if rows:
+        db.session.execute(stmt, rows)
+
+
+def _flush_batch(spec: ImportSpec, person_id: str, batch: list[tuple[int, dict]], result: ImportResult):
+    """배치 단위 DB 검증 후, 지금까지 오류가 없으면 저장 (오류가 생기면 이후로는 검증만 계속)"""
+    existing = set()
+    if spec.upsert_key:
+        existing = _check_owners(spec, person_id, batch, result)
+    if not result.errors:
+        _write_batch(spec, batch, existing, result)
+
+
+def _base_values(kind: str, customer, submitter: str) -> dict:
+    """파일에 없는 공통 값 (고객, 등록자, 등록일)"""
+    now = datetime.now()
+    if kind == "assets":
+        return {"Person_ID": customer.Person_ID, "Company": customer.Company, "Submitter": submitter,
+                "Update_Date": now}
+    if kind == "servers":
+        return {"Person_ID": customer.Person_ID, "Submitter": submitter, "Create_Date": now}
+    return {"Person_ID": customer.Person_ID, "Status": "활성화", "SMS_Receive_YN": "N",
+            "Report_Receive_YN": "N", "Reg_Date": now}
+
+
+def run_import(kind: str, file_storage, customer, submitter: str, dry_run: bool = False) -> ImportResult:
+    """파일을 검증해 저장. 오류가 있거나 dry_run 이면 커밋하지 않음 (호출한 쪽에서 commit/rollback)"""
+    spec = IMPORT_SPECS[kind]
+    result = ImportResult()
+    base = _base_values(kind, customer, submitter)
+
+    rows = iter_rows(file_storage)
+    columns = None
+    seen_keys = set()
+    batch: list[tuple[int, dict]] = []
+
+    try:
+        for row_no, raw in rows:
+            if not any(v.strip() for v in raw):
+                continue
+            if columns is None:
+                columns = spec.resolve_header(raw)
+                missing = [f.headers[0] for f in spec.fields if f.required and f not in columns.values()]
+                if missing:
+                    raise TabularError(f"필수 열이 없습니다: {', '.join(missing)}")
+                continue
+
+            result.total += 1
+            values = dict(base)
+            row_errors = []
+            for index, field in columns.items():
+                cell = raw[index].strip() if index < len(raw) else ""
+                try:
+                    values[field.attr] = field.parse(cell)
+                except ValueError as e:
+                    row_errors.append(f"{field.headers[0]}: {e}")
+                if field.required and not values.get(field.attr):
+                    row_errors.append(f"{field.headers[0]} 값이 비어 있습니다.")
+
+            if spec.upsert_key and values.get(spec.upsert_key):
+                if values[spec.upsert_key] in seen_keys:
+                    row_errors.append(f"파일 안에서 중복된 값입니다: {values[spec.upsert_key]}")
+                seen_keys.add(values[spec.upsert_key])
+
+            if row_errors:
+                result.error(row_no, " / ".join(row_errors))
+                continue
+
+            fill_inet_values(spec.model, values)  # Core INSERT 는 ORM 저장 이벤트를 거치지 않음
+            batch.append((row_no, values))
+            if len(batch) >= BATCH_SIZE:
+                _flush_batch(spec, customer.Person_ID, batch, result)
+                batch = []
+    except (UnicodeDecodeError, KeyError, IndexError) as e:
+        raise TabularError(f"파일을 읽을 수 없습니다: {e}")
+
+    if columns is None:
+        raise TabularError("데이터가 없는 파일입니다.")
+
+    if batch:
+        _flush_batch(spec, customer.Person_ID, batch, result)
+
+    if dry_run or result.errors:
+        db.session.rollback()
+    if result.errors:
+        result.inserted = result.updated = 0
+    return result
@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """프로세스 내 메모리 캐시 (항목별 만료 시간 + 최대 개수 초과 시 오래된 항목부터 제거)
+
+    워커 프로세스마다 따로 존재하므로, 다른 워커에서 발생한 변경은 ttl 이내에 반영됩니다.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, factory):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class _Entry:
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class SWRCache:
+    """stale-while-revalidate 캐시 + 키별 단일 계산(single-flight)
+
+    - ttl 이내: 캐시 값 반환
+    - ttl ~ stale_ttl: 이전 값을 바로 반환하고, 백그라운드 스레드 한 개가 새로 계산
+    - 값이 없거나 stale_ttl 초과: 같은 키를 동시에 요청하면 한 요청만 계산하고 나머지는 그 결과를 기다림
+    invalidate() 이후 끝난 계산 결과는 저장하지 않습니다. (무효화 전 데이터로 덮어쓰지 않도록)
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float, maxsize: int = 64, wait_timeout: float = 30):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.wait_timeout = wait_timeout
+        self._data: OrderedDict = OrderedDict()
+        self._inflight: dict = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def _store(self, key, value, version: int):
+        now = time.monotonic()
+        with self._lock:
+            if version != self._version:
+                return
+            self._data[key] = _Entry(value, now + self.ttl, now + self.stale_ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def _finish(self, key, event):
+        with self._lock:
+            if self._inflight.get(key) is event:
+                del self._inflight[key]
+        event.set()
+
+    def _refresh(self, key, factory, event, version: int):
+        try:
+            self._store(key, factory(), version)
+        except Exception:
+            pass  # 다음 요청에서 다시 시도 (그동안은 이전 값 사용)
+        finally:
+            self._finish(key, event)
+
+    def get(self, key, factory):
+        """factory() 는 백그라운드 스레드에서도 호출되므로 필요한 컨텍스트를 스스로 준비해야 합니다."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and now < entry.fresh_until:
+                return entry.value
+
+            event = self._inflight.get(key)
+            if entry is not None and now < entry.stale_until:
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    threading.Thread(
+                        target=self._refresh, args=(key, factory, event, self._version), daemon=True
+                    ).start()
+                return entry.value
+
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+            version = self._version
+
+        if not leader:
+            event.wait(self.wait_timeout)
+            with self._lock:
+                entry = self._data.get(key)
+            if entry is not None:
+                return entry.value
+            return factory()  # 먼저 계산하던 요청이 실패했거나 무효화됨
+
+        try:
+            value = factory()
+            self._store(key, value, version)
+            return value
+        finally:
+            self._finish(key, event)
+
+    def invalidate(self, predicate=None):
+        """predicate(key) 가 참인 항목 삭제 (없으면 전체)"""
+        with self._lock:
+            self._version += 1
+            for key in [k for k in self._data if predicate is None or predicate(k)]:
+                del self._data[key]
@@ -0,0 +1,211 @@
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+
+from flask import current_app
+
+from . import file_store
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 이어받기(resumable) 분할 업로드
+#
+# init → PUT chunk (offset 지정, 여러 번) → complete 순서로 호출합니다.
+# 조각은 요청 본문을 CHUNK_READ 단위로 읽어 곧바로 .part 파일 끝에 붙이므로 메모리 사용량이 파일 크기와 무관합니다.
+# 연결이 끊기면 상태 조회로 받은 offset 부터 다시 보내면 됩니다.
+# 세션 정보는 저장소 임시 폴더의 JSON 파일에 두므로 워커가 달라도 이어서 받을 수 있습니다.
+# complete 는 첨부 행을 커밋한 뒤에야 세션을 지우므로, 커밋이 실패해도 조각을 다시 보내지 않고 complete 만 다시 호출하면 됩니다.
+
+CHUNK_READ = 1024 * 1024
+MAX_CHUNK_BYTES = 16 * 1024 * 1024  # 조각 한 개 최대 크기 (클라이언트 권장값은 CHUNK_SIZE)
+CHUNK_SIZE = 8 * 1024 * 1024
+STALE_SECONDS = 24 * 60 * 60
+
+TARGET_TYPES = ("work", "note")
+
+# 일반 첨부 허용 확장자 + 현장 엔지니어가 올리는 패킷 캡처 / 로그 묶음
+ALLOWED_EXTENSIONS = {
+    ".pdf", ".png", ".jpg", ".jpeg", ".gif", ".txt", ".csv", ".xlsx", ".xls", ".docx", ".pptx", ".zip",
+    ".pcap", ".pcapng", ".cap", ".log", ".gz", ".tgz", ".7z",
+}
+
+_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+class UploadError(Exception):
+    def __init__(self, message: str, status: int = 400, offset: int | None = None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.offset = offset
+
+
+def _session_dir() -> str:
+    path = os.path.join(file_store.tmp_dir(), "chunks")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _meta_path(upload_id: str) -> str:
+    return os.path.join(_session_dir(), f"{upload_id}.json")
+
+
+def part_path(upload_id: str) -> str:
+    return os.path.join(_session_dir(), f"{upload_id}.part")
+
+
+def max_upload_bytes() -> int:
+    return int(current_app.config.get("MAX_RESUMABLE_UPLOAD_MB", 10240)) * 1024 * 1024
+
+
+def is_allowed_filename(filename: str) -> bool:
+    lower = filename.lower()
+    return lower.endswith(".tar.gz") or os.path.splitext(lower)[1] in ALLOWED_EXTENSIONS
+
+
+def received_bytes(session: dict) -> int:
+    try:
+        return os.path.getsize(part_path(session["upload_id"]))
+    except OSError:
+        return 0
+
+
+def progress(session: dict) -> dict:
+    received = received_bytes(session)
+    size = session["size"]
+    return {
+        "upload_id": session["upload_id"],
+        "offset": received,
+        "size": size,
+        "percent": round(received * 100 / size, 1) if size else 100.0,
+        "complete": received == size,
+    }
+
+
+def sweep_stale():
+    """STALE_SECONDS 동안 갱신되지 않은 세션 정리"""
+    cutoff = time.time() - STALE_SECONDS
+    session_dir = _session_dir()
+    for name in os.listdir(session_dir):
+        path = os.path.join(session_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def create_session(user_id: str, filename: str, size: int, target_type: str, target_id: int) -> dict:
+    if target_type not in TARGET_TYPES:
+        raise UploadError("알 수 없는 첨부 대상입니다.")
+    if not filename or not is_allowed_filename(filename):
+        raise UploadError("허용되지 않는 파일 확장자입니다.")
+    if size < 0 or size > max_upload_bytes():
+        raise UploadError("파일 크기가 허용 범위를 벗어났습니다.", 413)
+
+    sweep_stale()
+
+    session = {
+        "upload_id": uuid.uuid4().hex,
+        "user_id": user_id,
+        "filename": filename,
+        "size": size,
+        "target_type": target_type,
+        "target_id": target_id,
+        "created_at": time.time(),
+    }
+    with open(_meta_path(session["upload_id"]), "w", encoding="utf-8") as f:
+        json.dump(session, f, ensure_ascii=False)
+    open(part_path(session["upload_id"]), "wb").close()
+    return session
+
+
+def load_session(upload_id: str, user_id: str) -> dict:
+    if not _ID_RE.match(upload_id or ""):
+        raise UploadError("업로드 세션을 찾을 수 없습니다.", 404)
+    try:
+        with open(_meta_path(upload_id), encoding="utf-8") as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        raise UploadError("업로드 세션을 찾을 수 없습니다.", 404)
+    if session.get("user_id") != user_id:
+        raise UploadError("업로드 세션을 찾을 수 없습니다.", 404)
+    return session
+
+
+def append_chunk(session: dict, offset: int, stream) -> int:
+    """offset 이 현재까지 받은 크기와 같을 때만 이어 붙임. 새 offset 반환"""
+    path = part_path(session["upload_id"])
+    with open(path, "ab") as out:
+        if fcntl:
+            # 같은 세션에 조각이 동시에 들어오면 하나씩 처리
+            fcntl.flock(out, fcntl.LOCK_EX)
+
+        current = out.seek(0, os.SEEK_END)
+        if offset != current:
+            raise UploadError("offset 이 일치하지 않습니다.", 409, offset=current)
+
+        limit = min(MAX_CHUNK_BYTES, session["size"] - current)
+        written = 0
+        try:
+            while True:
+                chunk = stream.read(CHUNK_READ)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > limit:
+                    raise UploadError("조각 크기가 허용 범위를 벗어났습니다.", 413, offset=current)
+                out.write(chunk)
+            out.flush()
+        except BaseException:
+            # 잘못 받은 조각은 버리고 이전 offset 으로 되돌림
+            out.truncate(current)
+            raise
+
+    os.utime(_meta_path(session["upload_id"]))
+    return current + written
+
+
+def check_received(session: dict):
+    received = received_bytes(session)
+    if received != session["size"]:
+        raise UploadError("아직 모든 조각을 받지 못했습니다.", 409, offset=received)
+
+
+def finish(session: dict) -> file_store.StoredFile:
+    """모두 받은 파일을 해시 저장소로 옮김. 첨부 행 추가 후 같은 트랜잭션에서 커밋하고, 커밋한 뒤 discard() 할 것
+
+    .part 파일은 하드 링크로 넘기므로(복사 없음) 커밋이 실패해도 세션이 그대로 남습니다.
+    """
+    check_received(session)
+
+    part = part_path(session["upload_id"])
+    adopt_path = os.path.join(file_store.tmp_dir(), f"{session['upload_id']}.adopt")
+    if os.path.exists(adopt_path):
+        os.remove(adopt_path)
+    try:
+        os.link(part, adopt_path)
+    except OSError:
+        # 하드 링크를 지원하지 않는 파일시스템
+        shutil.copyfile(part, adopt_path)
+
+    try:
+        return file_store.adopt_file(adopt_path)
+    except BaseException:
+        if os.path.exists(adopt_path):
+            os.remove(adopt_path)
+        raise
+
+
+def discard(session: dict):
+    for path in (_meta_path(session["upload_id"]), part_path(session["upload_id"])):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,203 @@
+import gzip
+import mimetypes
+import os
+import zlib
+
+from flask import Flask, current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import brotli  # pip install Brotli (없으면 gzip 만 사용)
+except ImportError:
+    brotli = None
+
+# 응답 압축 (gzip / br)
+#
+# - HTML / JSON / CSV 등 텍스트 응답이 COMPRESS_MIN_SIZE 이상이면 Accept-Encoding 에 맞춰 압축합니다.
+# - 스트리밍 응답(내보내기 등)은 조각마다 압축해 flush 하므로 첫 바이트가 늦어지지 않습니다.
+# - /static 은 미리 압축해 둔 <파일>.br / <파일>.gz 가 있으면 그 파일을 그대로 보냅니다.
+#   (flask compress-static 으로 생성, 원본보다 오래된 압축본은 무시)
+# - 이미 압축된 응답, send_file 응답(Range / X-Accel-Redirect), Cache-Control: no-transform 은 건드리지 않습니다.
+# 압축한 응답의 강한 ETag 는 약한 ETag(W/)로 바꿉니다. (같은 ETag 로 다른 바이트를 보내지 않도록)
+
+COMPRESSIBLE_MIMETYPES = {
+    "text/html", "text/css", "text/plain", "text/csv", "text/javascript",
+    "application/javascript", "application/json", "image/svg+xml",
+}
+# 미리 압축할 정적 파일 확장자 (이미지 / 글꼴(woff2) 등은 이미 압축된 형식)
+PRECOMPRESS_EXTENSIONS = {".js", ".css", ".svg", ".html", ".json", ".txt", ".map", ".ttf", ".eot"}
+
+_ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+_SUFFIX = {"br": ".br", "gzip": ".gz"}
+
+
+def _choose_encoding() -> str | None:
+    if not request.accept_encodings:
+        return None
+    best = request.accept_encodings.best_match(_ENCODINGS)
+    return best if best in _ENCODINGS else None
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    config = current_app.config
+    if encoding == "br":
+        return brotli.compress(data, quality=config["COMPRESS_BR_QUALITY"])
+    return gzip.compress(data, compresslevel=config["COMPRESS_LEVEL"], mtime=0)
+
+
+def _compress_stream(body, encoding: str):
+    """조각마다 압축 + flush (받는 쪽이 바로 풀 수 있도록)"""
+    # 본문은 요청이 끝난 뒤 읽히므로 설정값은 여기서 미리 꺼내 둠
+    config = current_app.config
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=config["COMPRESS_BR_QUALITY"])
+        process, flush, finish = compressor.process, compressor.flush, compressor.finish
+    else:
+        compressor = zlib.compressobj(config["COMPRESS_LEVEL"], zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        process = compressor.compress
+        flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)  # noqa: E731
+        finish = compressor.flush
+    return _iter_compressed(body, process, flush, finish)
+
+
+def _iter_compressed(body, process, flush, finish):
+    try:
+        for chunk in body:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if not chunk:
+                continue
+            data = process(chunk) + flush()
+            if data:
+                yield data
+        yield finish()
+    finally:
+        close = getattr(body, "close", None)
+        if close:
+            close()
+
+
+def _compressible(response) -> bool:
+    if request.method == "HEAD" or response.status_code < 200 or response.status_code in (204, 206, 304):
+        return False
+    if response.direct_passthrough or "Content-Encoding" in response.headers:
+        return False
+    if "no-transform" in (response.headers.get("Cache-Control") or ""):
+        return False
+    return response.mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def _compress_response(response):
+    if not _compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")
+
+    encoding = _choose_encoding()
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < current_app.config["COMPRESS_MIN_SIZE"]:
+            return response
+        response.set_data(_compress(data, encoding))
+
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+# ---------------------------------------------------------------------------
+# 정적 파일 (미리 압축한 파일)
+# ---------------------------------------------------------------------------
+def _precompressed(static_folder: str, filename: str) -> tuple[str, str] | None:
+    """(압축 파일 상대 경로, encoding) - 원본보다 새로운 압축본만"""
+    source = safe_join(static_folder, filename)
+    if source is None or not os.path.isfile(source):
+        return None
+    accepted = request.accept_encodings
+    # .br 는 brotli 모듈 없이도 (다른 곳에서 만들어 둔 파일이면) 그대로 보낼 수 있음
+    for encoding in ("br", "gzip"):
+        if not accepted or accepted[encoding] <= 0:
+            continue
+        variant = source + _SUFFIX[encoding]
+        if os.path.isfile(variant) and os.path.getmtime(variant) >= os.path.getmtime(source):
+            return filename + _SUFFIX[encoding], encoding
+    return None
+
+
+def _static_view(app: Flask):
+    original = app.view_functions["static"]
+
+    def static(filename):
+        found = _precompressed(app.static_folder, filename)
+        if found is None:
+            response = original(filename=filename)
+        else:
+            variant, encoding = found
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            response = send_from_directory(
+                app.static_folder, variant, mimetype=mimetype,
+                max_age=app.get_send_file_max_age(filename),
+            )
+            response.headers["Content-Encoding"] = encoding
+        if os.path.splitext(filename)[1] in PRECOMPRESS_EXTENSIONS:
+            response.vary.add("Accept-Encoding")
+        return response
+
+    return static
+
+
+def precompress_static(static_folder: str, skip_dirs=(), log=print) -> tuple[int, int]:
+    """정적 파일의 .gz / .br 생성 (원본보다 새로우면 건너뜀). (생성 수, 건너뜀 수)"""
+    encodings = ("gzip", "br") if brotli else ("gzip",)
+    skip = {os.path.abspath(d) for d in skip_dirs}
+    made = skipped = 0
+    for root, dirs, files in os.walk(static_folder):
+        dirs[:] = [d for d in dirs if os.path.abspath(os.path.join(root, d)) not in skip]
+        for name in files:
+            source = os.path.join(root, name)
+            if os.path.splitext(name)[1] not in PRECOMPRESS_EXTENSIONS:
+                # 원본이 사라진 압축본 정리
+                base, ext = os.path.splitext(source)
+                if ext in (".gz", ".br") and os.path.splitext(base)[1] in PRECOMPRESS_EXTENSIONS \
+                        and not os.path.exists(base):
+                    os.remove(source)
+                continue
+            with open(source, "rb") as f:
+                data = f.read()
+            for encoding in encodings:
+                variant = source + _SUFFIX[encoding]
+                if os.path.isfile(variant) and os.path.getmtime(variant) >= os.path.getmtime(source):
+                    skipped += 1
+                    continue
+                if encoding == "br":
+                    packed = brotli.compress(data, quality=11)
+                else:
+                    packed = gzip.compress(data, compresslevel=9, mtime=0)
+                # 거의 줄지 않으면 압축본을 두지 않음 (풀기 비용만 듦)
+                if len(packed) >= len(data) * 0.9:
+                    if os.path.exists(variant):
+                        os.remove(variant)
+                    continue
+                with open(variant, "wb") as f:
+                    f.write(packed)
+                made += 1
+                log(f"{os.path.relpath(variant, static_folder)}  {len(data):,} → {len(packed):,} bytes")
+    return made, skipped
+
+
+def init_compression(app: Flask):
+    app.config.setdefault("COMPRESS", True)
+    app.config.setdefault("COMPRESS_MIN_SIZE", 1024)
+    app.config.setdefault("COMPRESS_LEVEL", 6)
+    app.config.setdefault("COMPRESS_BR_QUALITY", 4)
+    if not app.config["COMPRESS"]:
+        return
+    app.view_functions["static"] = _static_view(app)
+    app.after_request(_compress_response)
@@ -0,0 +1,62 @@
+from sqlalchemy import case
+
+from ..extensions import db
+from ..models.ctm_people import CTMPeople
+from .cache import TTLCache
+from .search import contains_any, escape_like
+
+# 고객사/사이트 선택 상자(Select2) 원격 검색
+# 목록 화면마다 CTM_People 전체를 <option> 으로 내려주던 방식을 대체합니다.
+# 같은 검색어가 타이핑 중에 반복 요청되므로 짧은 TTL 로 캐시하고, 고객 등록/수정 시 무효화합니다.
+_search_cache = TTLCache(ttl=30, maxsize=512)
+
+SEARCH_PAGE_SIZE = 20
+
+
+def _customer_text(people: CTMPeople) -> str:
+    if people.Last_Name and people.Last_Name != people.Company:
+        return f"{people.Company} ({people.Last_Name})"
+    return people.Company or people.Last_Name or people.Person_ID
+
+
+def customer_option(people: CTMPeople) -> dict:
+    """Select2 결과 항목 한 개"""
+    return {
+        "id": people.Person_ID,
+        "text": _customer_text(people),
+        "company": people.Company or "",
+        "location": people.Last_Name or "",
+    }
+
+
+def _search(q: str, page: int, per_page: int) -> dict:
+    query = db.session.query(CTMPeople)
+    order = [CTMPeople.Company.asc(), CTMPeople.Last_Name.asc()]
+
+    if q:
+        # 부분 일치는 trigram 인덱스, 접두 일치 우선 정렬은 (Company, Last_Name) 인덱스 사용
+        query = query.filter(contains_any(q, CTMPeople.Company, CTMPeople.Last_Name))
+        prefix = f"{escape_like(q)}%"
+        order.insert(0, case(
+            (CTMPeople.Company.ilike(prefix, escape="\\"), 0),
+            (CTMPeople.Last_Name.ilike(prefix, escape="\\"), 1),
+            else_=2,
+        ))
+
+    rows = query.order_by(*order).offset((page - 1) * per_page).limit(per_page + 1).all()
+
+    return {
+        "results": [customer_option(p) for p in rows[:per_page]],
+        "pagination": {"more": len(rows) > per_page},
+    }
+
+
+def search_customers(q: str, page: int = 1, per_page: int = SEARCH_PAGE_SIZE) -> dict:
+    """{"results": [...], "pagination": {"more": bool}} (Select2 ajax 응답 형식)"""
+    q = (q or "").strip()
+    page = max(page or 1, 1)
+    return _search_cache.get_or_set((q.lower(), page, per_page), lambda: _search(q, page, per_page))
+
+
+def invalidate_customer_search():
+    _search_cache.clear()
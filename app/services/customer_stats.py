@@ -0,0 +1,39 @@
+from datetime import date
+
+from sqlalchemy import func, or_
+
+from ..extensions import db
+from ..models.ctm_people import CTMPeople
+from .cache import TTLCache
+from .db_routing import primary_reads
+
+# 고객 목록 상단 통계 카드 (VIP/민감, 레포트 발송 대상, 이번 달 신규)
+# 페이지 이동마다 바뀌지 않으므로 캐시하고, 고객 등록/수정 시 무효화합니다.
+_summary_cache = TTLCache(ttl=300, maxsize=4)
+
+
+def _compute_summary(start_of_month: date) -> dict:
+    # 3개의 COUNT 를 FILTER (WHERE ...) 집계 한 번으로 처리
+    # 목록 화면은 복제본에서 읽지만 캐시에 넣을 값은 primary 에서 (services/db_routing.py)
+    with primary_reads():
+        row = db.session.query(
+            func.count(CTMPeople.Person_ID).filter(CTMPeople.Client_Sensitivity.in_(['0', '2'])),
+            func.count(CTMPeople.Person_ID).filter(or_(CTMPeople.Report_YN == '0', CTMPeople.Report_YN == 'Y')),
+            func.count(CTMPeople.Person_ID).filter(CTMPeople.Open_Date >= start_of_month),
+        ).one()
+
+    return {
+        "count_vip": row[0] or 0,
+        "count_report": row[1] or 0,
+        "count_new": row[2] or 0,
+    }
+
+
+def customer_summary() -> dict:
+    """{"count_vip", "count_report", "count_new"} (월이 바뀌면 키가 바뀌어 새로 계산)"""
+    start_of_month = date.today().replace(day=1)
+    return _summary_cache.get_or_set(start_of_month, lambda: _compute_summary(start_of_month))
+
+
+def invalidate_customer_summary():
+    _summary_cache.clear()
@@ -0,0 +1,111 @@
+from datetime import date
+
+from flask import current_app
+
+from ..extensions import db
+from ..models.ctm_people import CTMPeople
+from ..models.sr_ticket import SRTicket
+from .cache import SWRCache
+from .month_calendar import load_month_items, month_window
+
+# 대시보드 / 작업 일정 데이터 캐시 (작업 달력 / 최근 SR / 계약 만료 임박)
+#
+# 교대 시간에 모두가 / 로 들어오므로 결과를 달력 월 단위 키로 캐시합니다. (stale-while-revalidate)
+# 같은 키를 동시에 요청하면 한 번만 계산하고, 만료된 값은 돌려주면서 뒤에서 새로 계산합니다.
+# 작업 / SR / 고객 정보를 저장하면 해당 항목을 무효화합니다.
+# 캐시 값은 세션과 무관한 dict 로 저장합니다. (ORM 객체는 요청이 끝나면 분리되므로)
+
+RECENT_SR_LIMIT = 5
+EXPIRING_LIMIT = 5
+
+_dashboard_cache = SWRCache(ttl=60, stale_ttl=600, maxsize=32)
+
+
+def _in_app_context(func, *args):
+    """백그라운드 갱신 스레드에서도 DB 를 쓸 수 있도록 앱 컨텍스트를 씌운 계산 함수"""
+    app = current_app._get_current_object()
+
+    def run():
+        with app.app_context():
+            return func(*args)
+    return run
+
+
+def recent_sr_query():
+    return (
+        db.session.query(SRTicket)
+        .order_by(SRTicket.request_date.desc(), SRTicket.sr_id.desc())
+        .limit(RECENT_SR_LIMIT)
+    )
+
+
+def expiring_contracts_query(today: date):
+    # 고객(CTM_People)의 해지일 기준 - 대시보드 기존 조건 그대로
+    return (
+        db.session.query(CTMPeople.Terminate_Date, CTMPeople.Person_ID, CTMPeople.Company, CTMPeople.Last_Name)
+        .filter(CTMPeople.Terminate_Date != None)
+        .filter(CTMPeople.Terminate_Date >= today)
+        .order_by(CTMPeople.Terminate_Date.asc())
+        .limit(EXPIRING_LIMIT)
+    )
+
+
+def _compute_recent_sr() -> list[dict]:
+    rows = recent_sr_query().all()
+    return [{
+        'sr_id': s.sr_id,
+        'severity': s.severity,
+        'company': s.company,
+        'location': s.location,
+        'result': s.result,
+        'content': s.content,
+        'request_date': s.request_date,
+    } for s in rows]
+
+
+def _compute_expiring_contracts(today: date) -> list[dict]:
+    rows = expiring_contracts_query(today).all()
+    return [{
+        'Person_ID': r.Person_ID,
+        'Company': r.Company,
+        'Last_Name': r.Last_Name,
+        'Terminate_Date': r.Terminate_Date,
+    } for r in rows]
+
+
+def work_calendar(year: int, month: int) -> dict:
+    """{날짜: [{"id", "company", "location", "type"}, ...]} (달력에 보이는 앞뒤 달 날짜 포함)"""
+    start_date, end_date = month_window(year, month)
+    key = ("calendar", start_date, end_date)
+    return _dashboard_cache.get(key, _in_app_context(load_month_items, start_date, end_date))
+
+
+def recent_sr() -> list[dict]:
+    return _dashboard_cache.get(("recent_sr",), _in_app_context(_compute_recent_sr))
+
+
+def expiring_contracts(today: date) -> list[dict]:
+    return _dashboard_cache.get(("contracts", today), _in_app_context(_compute_expiring_contracts, today))
+
+
+# ---------------------------------------------------------------------------
+# 무효화 (커밋 후 호출)
+# ---------------------------------------------------------------------------
+def invalidate_work_calendar(*work_dates):
+    """해당 날짜가 보이는 달력만 무효화 (날짜를 모르면 전체)"""
+    dates = [d for d in work_dates if d]
+    if not dates:
+        _dashboard_cache.invalidate(lambda key: key[0] == "calendar")
+        return
+    _dashboard_cache.invalidate(
+        lambda key: key[0] == "calendar" and any(key[1] <= d <= key[2] for d in dates)
+    )
+
+
+def invalidate_recent_sr():
+    _dashboard_cache.invalidate(lambda key: key[0] == "recent_sr")
+
+
+def invalidate_dashboard():
+    """고객사명 / 사이트명 변경처럼 모든 항목에 영향이 있을 때"""
+    _dashboard_cache.invalidate()
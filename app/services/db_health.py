@@ -0,0 +1,51 @@
+import logging
+import time
+
+from flask import Flask
+from sqlalchemy import text
+
+from ..extensions import db
+
+# 시작 시 DB 연결 / 풀 상태 점검 (DB_STARTUP_CHECK)
+#
+# 기본 DB 와 복제본(있으면)에 한 번씩 연결해 응답 시간과 풀 설정을 로그로 남깁니다.
+# PostgreSQL 이면 서버 버전, max_connections, 현재 연결 수도 함께 남겨
+# (워커 수 x (pool_size + max_overflow)) 가 max_connections 를 넘는 설정을 시작할 때 알 수 있게 합니다.
+# 연결에 실패해도 앱은 뜹니다. (마이그레이션 / CLI 실행, DB 가 늦게 뜨는 경우)
+
+logger = logging.getLogger("soms.db")
+
+
+def _pool_summary(engine) -> str:
+    pool = engine.pool
+    if hasattr(pool, "size"):
+        return f"{type(pool).__name__} size={pool.size()} max_overflow={pool._max_overflow} timeout={pool._timeout}s"
+    return type(pool).__name__
+
+
+def _check_engine(name: str, engine):
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            elapsed = (time.perf_counter() - started) * 1000
+            detail = ""
+            if engine.dialect.name == "postgresql":
+                version, max_conn, in_use, timeout = conn.execute(text(
+                    "SELECT current_setting('server_version'), current_setting('max_connections')::int, "
+                    "(SELECT count(*) FROM pg_stat_activity), current_setting('statement_timeout')"
+                )).one()
+                detail = (f", PostgreSQL {version}, 연결 {in_use}/{max_conn}, "
+                          f"statement_timeout={timeout}")
+    except Exception as e:  # 연결 실패는 경고만
+        logger.warning("DB 연결 확인 실패 [%s] %s: %s", name, engine.url.render_as_string(), e)
+        return
+
+    logger.info("DB 연결 확인 [%s] %.1fms, %s%s", name, elapsed, _pool_summary(engine), detail)
+
+
+def report_pool_health(app: Flask):
+    if not app.config.get("DB_STARTUP_CHECK"):
+        return
+    for key, engine in db.engines.items():
+        _check_engine(key or "primary", engine)
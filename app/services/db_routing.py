@@ -0,0 +1,106 @@
+import time
+from contextlib import contextmanager
+
+from flask import Flask, current_app, g, has_request_context, request, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+# 읽기 전용 복제본(read replica) 라우팅
+#
+# DATABASE_REPLICA_URL 이 있으면 SQLALCHEMY_BINDS["replica"] 로 엔진을 만들고,
+# REPLICA_ENDPOINTS 의 GET 요청은 세션이 복제본 엔진으로 조회합니다.
+# - flush(INSERT / UPDATE / DELETE) 는 요청과 상관없이 항상 기본(primary) DB
+# - 요청 중 실제로 flush 한(DB 에 쓴) 사용자는 REPLICA_STICKY_SECONDS 동안 모든 조회를 primary 에서 읽음
+#   (저장 직후 목록에 방금 쓴 행이 안 보이는 복제 지연 방지, 로그인 세션 쿠키에 기록)
+# - 요청 밖(CLI, 백그라운드 캐시 갱신 스레드)과 목록에 없는 화면은 primary
+# - 프로세스 공용 캐시(고객 통계, 로그인 사용자)를 채우는 조회는 primary_reads() 안에서 primary
+#   (복제 지연된 값이 캐시에 들어가면 무효화 후에도 TTL 동안 그대로 남으므로)
+# 복제본 URL 이 없으면 아무 것도 바뀌지 않습니다.
+
+REPLICA_BIND = "replica"
+
+# 복제 지연을 허용할 수 있는 조회 화면 / AJAX
+REPLICA_ENDPOINTS = {
+    "customers.list_customers",
+    "customers.detail",
+    "customers.tab_rows",
+    "customers.get_work_detail",
+    "customers.get_contact_info",
+    "customers.get_server_info",
+    "contract.ajax_list_contracts",
+    "work.list_work",
+    "work.ajax_list_work",
+    "work.ajax_get_work_detail",
+    "work.export_work",
+    "sr.list_sr",
+    "sr.ajax_list_sr",
+    "sr.ajax_get_sr_detail",
+    "sr.export_sr",
+    "asset.list_security",
+    "asset.export_security",
+    "asset.list_servers",
+    "asset.export_servers",
+    "schedule.index",
+    "schedule.month_json",
+}
+
+_STICKY_KEY = "_primary_until"
+
+
+class RoutingSession(Session):
+    """복제본 조회 요청이면 flush 가 아닌 조회를 replica 엔진으로 보내는 세션"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and _reads_from_replica():
+            engine = self._db.engines.get(REPLICA_BIND)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _reads_from_replica() -> bool:
+    return has_request_context() and g.get("_read_replica", False)
+
+
+@contextmanager
+def primary_reads():
+    """블록 안의 조회는 복제본 조회 요청이라도 primary 에서 읽음 (캐시 채우기용)"""
+    if not _reads_from_replica():
+        yield
+        return
+    g._read_replica = False
+    try:
+        yield
+    finally:
+        g._read_replica = True
+
+
+def _route_request():
+    if request.method not in ("GET", "HEAD"):
+        return
+    if request.endpoint not in REPLICA_ENDPOINTS:
+        return
+    if session.get(_STICKY_KEY, 0) > time.time():
+        return
+    g._read_replica = True
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _note_write(db_session, flush_context):
+    if has_request_context():
+        g._wrote_primary = True
+
+
+def _mark_write(response):
+    if g.get("_wrote_primary"):
+        session[_STICKY_KEY] = int(time.time()) + current_app.config["REPLICA_STICKY_SECONDS"]
+    return response
+
+
+def init_db_routing(app: Flask):
+    """SQLALCHEMY_BINDS 에 replica 가 있을 때만 요청 라우팅 등록 (db.init_app 전에 설정되어 있어야 함)"""
+    app.config.setdefault("REPLICA_STICKY_SECONDS", 10)
+    if REPLICA_BIND not in app.config.get("SQLALCHEMY_BINDS", {}):
+        return
+    app.before_request(_route_request)
+    app.after_request(_mark_write)
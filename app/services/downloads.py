@@ -0,0 +1,91 @@
+import mimetypes
+import os
+import re
+import unicodedata
+from urllib.parse import quote
+
+from flask import current_app, request, send_file
+from werkzeug.security import safe_join
+
+from . import file_store
+
+# 첨부파일 다운로드
+#
+# - ETag: 해시 저장소 경로(ab/cd/<sha256>)면 SHA-256 자체를 강한 ETag 로 사용하므로
+#   If-None-Match 가 맞으면 디스크를 읽지 않고 304 를 반환합니다. (기존 파일명은 크기+수정시각)
+# - DOWNLOAD_OFFLOAD 설정 시 파일 본문은 앞단 웹서버가 보냅니다. (Range 처리도 웹서버 몫)
+#     "nginx"    → X-Accel-Redirect: {DOWNLOAD_ACCEL_PREFIX}/<상대 경로>
+#                  location /_protected_uploads/ { internal; alias <UPLOAD_FOLDER>/; }
+#     "sendfile" → X-Sendfile: <절대 경로>  (Apache mod_xsendfile, lighttpd)
+# - 그 외에는 send_file(conditional=True) 가 Range(206) / 304 를 처리합니다.
+
+_SHA_PATH = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/([0-9a-f]{64})$")
+
+
+def _etag_for(rel_path: str, abs_path: str) -> str | None:
+    m = _SHA_PATH.match(rel_path.replace(os.sep, "/"))
+    if m:
+        return m.group(1)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    return f"{st.st_size:x}-{st.st_mtime_ns:x}"
+
+
+def _content_disposition(download_name: str) -> str:
+    # send_file 과 같은 방식: ASCII 대체 이름 + RFC 5987 filename* (한글 파일명)
+    simple = unicodedata.normalize("NFKD", download_name).encode("ascii", "ignore").decode("ascii")
+    simple = simple.replace("\\", "\\\\").replace('"', '\\"')
+    if simple == download_name:
+        return f'attachment; filename="{simple}"'
+    return f"attachment; filename=\"{simple}\"; filename*=UTF-8''{quote(download_name, safe='')}"
+
+
+def _offload(mode: str, rel_path: str, abs_path: str, download_name: str, etag: str | None):
+    response = current_app.response_class()
+    response.headers["Content-Disposition"] = _content_disposition(download_name)
+    response.mimetype = mimetypes.guess_type(download_name)[0] or "application/octet-stream"
+    if etag:
+        response.set_etag(etag)
+
+    if mode == "nginx":
+        prefix = current_app.config.get("DOWNLOAD_ACCEL_PREFIX", "/_protected_uploads").rstrip("/")
+        response.headers["X-Accel-Redirect"] = f"{prefix}/{quote(rel_path.replace(os.sep, '/'))}"
+    else:
+        response.headers["X-Sendfile"] = abs_path
+    return response
+
+
+def send_attachment(rel_path: str, download_name: str | None = None):
+    """업로드 폴더 기준 상대 경로의 파일 응답. 파일이 없거나 경로가 잘못되면 None"""
+    abs_path = safe_join(file_store.upload_root(), rel_path)
+    download_name = download_name or os.path.basename(rel_path)
+    etag = _etag_for(rel_path, abs_path) if abs_path else None
+    if not etag:
+        return None
+
+    # 해시 ETag 는 DB 값만으로 알 수 있으므로 파일 확인 전에 304 처리
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+
+    if not os.path.isfile(abs_path):
+        return None
+
+    mode = current_app.config.get("DOWNLOAD_OFFLOAD")
+    if mode in ("nginx", "sendfile"):
+        response = _offload(mode, rel_path, abs_path, download_name, etag)
+    else:
+        response = send_file(
+            abs_path,
+            as_attachment=True,
+            download_name=download_name,
+            conditional=True,  # Range → 206, If-None-Match / If-Range 처리
+            etag=etag,
+        )
+        response.headers.setdefault("Accept-Ranges", "bytes")
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
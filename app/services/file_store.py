@@ -0,0 +1,137 @@
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+
+from flask import current_app
+from sqlalchemy import func, text
+
+from ..extensions import db
+from ..models.note_attachments import NoteAttachment
+from ..models.work_attachments import WorkAttachment
+
+# 내용 주소(Content-addressed) 첨부파일 저장소
+#
+# 업로드를 저장하면서 SHA-256 을 계산하고, 해시 앞자리로 나눈 하위 폴더에 저장합니다.
+#   UPLOAD_FOLDER/ab/cd/abcd1234...  (상대 경로가 WorkAttachment.File_Path / NoteAttachment.Stored_Filename)
+# 같은 내용은 한 번만 저장되며, 실제 파일은 그 경로를 가리키는 첨부 행이 하나도 없을 때 삭제됩니다.
+# (참조 수 = Work_Attachments + Note_Attachments 에서 같은 경로를 가진 행 수)
+
+CHUNK_SIZE = 1024 * 1024
+_TMP_DIR = ".tmp"
+
+
+@dataclass
+class StoredFile:
+    path: str  # UPLOAD_FOLDER 기준 상대 경로
+    size: int
+    sha256: str
+    created: bool  # False 면 기존 파일을 재사용 (중복 제거)
+
+
+def upload_root() -> str:
+    folder = current_app.config.get("UPLOAD_FOLDER")
+    if not folder:
+        folder = os.path.join(current_app.root_path, "static", "uploads")
+    if not os.path.isabs(folder):
+        folder = os.path.join(current_app.root_path, folder)
+    return folder
+
+
+def shard_path(digest: str) -> str:
+    return os.path.join(digest[:2], digest[2:4], digest)
+
+
+def absolute_path(rel_path: str) -> str:
+    return os.path.join(upload_root(), rel_path)
+
+
+def _lock(rel_path: str):
+    """같은 내용의 저장/삭제를 트랜잭션 단위로 직렬화 (PostgreSQL advisory lock, 커밋 시 해제)"""
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(text("SELECT pg_advisory_xact_lock(hashtext(:k))"), {"k": rel_path})
+
+
+def tmp_dir() -> str:
+    """저장소와 같은 파일시스템의 임시 폴더 (os.replace 로 옮기기 위해)"""
+    path = os.path.join(upload_root(), _TMP_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _commit_tmp(tmp_path: str, sha: str, size: int) -> StoredFile:
+    rel_path = shard_path(sha)
+    final_path = absolute_path(rel_path)
+
+    _lock(rel_path)
+    if os.path.exists(final_path):
+        os.remove(tmp_path)
+        return StoredFile(rel_path, size, sha, created=False)
+
+    os.makedirs(os.path.dirname(final_path), exist_ok=True)
+    os.replace(tmp_path, final_path)
+    return StoredFile(rel_path, size, sha, created=True)
+
+
+def save_stream(stream) -> StoredFile:
+    """stream 을 CHUNK_SIZE 단위로 읽어 해시 계산과 임시 파일 쓰기를 한 번에 처리
+
+    반환된 경로로 첨부 행을 추가하고 같은 트랜잭션에서 커밋해야 합니다.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir())
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+
+        return _commit_tmp(tmp_path, digest.hexdigest(), size)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def adopt_file(path: str) -> StoredFile:
+    """tmp_dir() 안에 이미 완성된 파일을 복사 없이 저장소로 이동 (분할 업로드 완료 시)"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return _commit_tmp(path, digest.hexdigest(), size)
+
+
+def save_upload(file_storage) -> StoredFile:
+    """werkzeug FileStorage 저장"""
+    return save_stream(file_storage.stream)
+
+
+def ref_count(rel_path: str) -> int:
+    work_refs = db.session.query(func.count(WorkAttachment.Attachment_ID)) \
+        .filter(WorkAttachment.File_Path == rel_path).scalar()
+    note_refs = db.session.query(func.count(NoteAttachment.Attachment_ID)) \
+        .filter(NoteAttachment.Stored_Filename == rel_path).scalar()
+    return (work_refs or 0) + (note_refs or 0)
+
+
+def release(*rel_paths: str):
+    """첨부 행 삭제를 커밋한 뒤 호출. 더 이상 참조되지 않는 파일만 디스크에서 삭제"""
+    for rel_path in set(p for p in rel_paths if p):
+        try:
+            _lock(rel_path)
+            if ref_count(rel_path) == 0:
+                path = absolute_path(rel_path)
+                if os.path.exists(path):
+                    os.remove(path)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.warning("첨부파일 정리 실패 (%s): %s", rel_path, e)
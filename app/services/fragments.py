@@ -0,0 +1,52 @@
+from flask import render_template, request
+
+# 저장 / 삭제 AJAX 응답에 넣는 목록 행 조각
+#
+# 저장 후 페이지를 새로고침하면 목록 쿼리 / 페이지 count / 선택 상자 로딩이 모두 다시 실행되므로,
+# 저장 API 가 바뀐 행만 <tr> 조각(html)으로 돌려주고 스크립트가 그 행만 교체합니다. (soms.js applyRows / removeRow)
+#
+#   <tbody data-rows="work" data-fragment="work.list">  ← 목록 화면이 행 모양(fragment)을 선언
+#   <tr data-row-id="123">                               ← 교체 / 삭제 대상 행
+#
+# 같은 저장 API 를 여러 화면에서 쓰므로(예: 작업 - 작업 목록 / 고객 상세 작업 이력 탭)
+# 스크립트가 요청에 fragment=<이름> 을 붙이고, 응답 행 모양은 그 이름으로 고릅니다.
+# fragment 가 없거나 모르는 이름이면 html 없이 기존 응답만 돌려줍니다.
+#
+# 저장 API 는 flush 후 커밋 전에 render_rows() 를 호출합니다.
+# 커밋하면 세션의 객체가 만료되어(expire_on_commit) 행을 그릴 때 저장한 행 / 고객을 다시 조회하게 됩니다.
+
+# 이름 → (행 템플릿, 행 모양) - "pair" 는 목록 쿼리와 같은 (엔티티, CTMPeople) 튜플, "entity" 는 엔티티만
+ROW_FRAGMENTS = {
+    "work.list": ("work/_rows.html", "pair"),
+    "sr.list": ("sr/_rows.html", "entity"),
+    "asset.security": ("asset/_security_rows.html", "pair"),
+    # 고객 상세 탭 (customers.tab_rows 와 같은 행 템플릿, 고객은 people 로 전달)
+    "customers.work": ("customers/_tab_work_rows.html", "entity"),
+    "customers.assets": ("customers/_tab_assets_rows.html", "entity"),
+    "customers.servers": ("customers/_tab_servers_rows.html", "entity"),
+    "customers.contacts": ("customers/_tab_contacts_rows.html", "entity"),
+    "customers.contracts": ("customers/_tab_contracts_rows.html", "entity"),
+}
+
+
+def requested_fragment() -> str | None:
+    name = request.values.get("fragment")
+    return name if name in ROW_FRAGMENTS else None
+
+
+def render_rows(items, people=None) -> dict:
+    """요청한 화면의 행 조각 {"html": ...} (요청하지 않았으면 {})
+
+    items 는 저장한 엔티티 목록, people 은 그 행들의 고객(CTMPeople, SR 처럼 없으면 None).
+    items / people 에 함수를 넘기면 조각을 요청했을 때만 호출합니다. (조각이 필요 없는 요청에 조회 추가 방지)
+    """
+    name = requested_fragment()
+    if name is None:
+        return {}
+    if callable(items):
+        items = items()
+    if callable(people):
+        people = people()
+    template, shape = ROW_FRAGMENTS[name]
+    rows = [(item, people) for item in items] if shape == "pair" else items
+    return {"html": render_template(template, rows=rows, people=people, first_page=False)}
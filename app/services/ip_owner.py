@@ -0,0 +1,263 @@
+import ipaddress
+import threading
+import time
+from itertools import chain
+
+from flask import current_app
+from sqlalchemy import event
+
+from ..extensions import db
+from ..models.ast_computersystem import AST_Computer_System
+from ..models.ctm_people import CTMPeople
+from ..models.servers import ServerInfo
+from .db_routing import RoutingSession
+from .ip_search import INET_COLUMNS, iter_inets
+
+# IP → 소유 고객 / 장비 / 사이트 일괄 조회 (경보가 몰릴 때 출발지 / 목적지 IP 수천 개의 고객 확인)
+#
+# 보안장비(AST_Computer_System.IP_Address) / 서버(Server_Info.chServerInfo) IP 텍스트에 적힌
+# IP / 대역을 모두 해석해 프로세스 메모리에 최장 접두사 일치(longest-prefix match) 표로 올려 둡니다.
+#   접두사 길이별 dict {네트워크 >> 호스트 비트: [장비, ...]}
+#   조회 = 등록된 접두사 길이 수만큼(보통 /32 + 대역 몇 종류) dict 조회 → IP 한 개에 수 µs
+# 처음 조회할 때 전체를 읽고(고객 / 보안장비 / 서버 각 1회), 이후 ORM 저장 / 삭제는
+# flush 때 바뀐 행을 모아 두었다가 commit 후 그 장비 / 고객만 표에 다시 반영합니다. (rollback 이면 버림)
+# 일괄 등록(Core INSERT)은 ORM 이벤트가 없으므로 invalidate_ip_owners() 로 다음 조회 때 다시 읽습니다.
+# 워커 프로세스마다 따로 존재하므로, 다른 워커에서 저장한 변경은 IP_OWNER_REBUILD_SECONDS 마다 전체를 다시 읽어 반영합니다.
+
+MAX_BATCH = 10_000
+
+# 모델 → (장비 종류, PK 속성, 장비명 속성, 사이트 속성)
+DEVICE_MODELS = {
+    AST_Computer_System: ("asset", "Asset_ID", "Name", "Owner_name"),
+    ServerInfo: ("server", "Server_ID", "chServerName", None),
+}
+
+_CHANGES_KEY = "_ip_owner_changes"
+
+
+class Device:
+    __slots__ = ("kind", "id", "name", "person_id", "site")
+
+    def __init__(self, kind: str, device_id: int, name: str | None, person_id: str, site: str | None):
+        self.kind = kind
+        self.id = device_id
+        self.name = name
+        self.person_id = person_id
+        self.site = site
+
+
+class PrefixIndex:
+    """IP 버전별 {접두사 길이: {네트워크 키: [Device]}} - 긴 접두사부터 찾아 처음 일치하는 대역의 장비"""
+
+    def __init__(self):
+        self.people: dict[str, tuple] = {}  # Person_ID → (고객사, 사이트)
+        self._tables = {4: {}, 6: {}}
+        self._lengths = {4: (), 6: ()}  # 등록된 접두사 길이 (긴 것부터)
+        self._placed: dict[tuple, list] = {}  # (종류, ID) → [(버전, 길이, 키)] (다시 반영 / 삭제용)
+
+    def __len__(self):
+        return len(self._placed)
+
+    def add(self, device: Device, ip_text: str | None):
+        placed = []
+        for value in dict.fromkeys(iter_inets(ip_text)):
+            network = ipaddress.ip_network(value)
+            version, length = network.version, network.prefixlen
+            key = int(network.network_address) >> (network.max_prefixlen - length)
+            tables = self._tables[version]
+            if length not in tables:
+                tables[length] = {}
+                self._lengths[version] = tuple(sorted(tables, reverse=True))
+            tables[length].setdefault(key, []).append(device)
+            placed.append((version, length, key))
+        if placed:
+            self._placed[(device.kind, device.id)] = placed
+
+    def remove(self, kind: str, device_id: int):
+        for version, length, key in self._placed.pop((kind, device_id), ()):
+            tables = self._tables[version]
+            devices = [d for d in tables[length][key] if d.kind != kind or d.id != device_id]
+            if devices:
+                tables[length][key] = devices
+                continue
+            del tables[length][key]
+            if not tables[length]:
+                del tables[length]
+                self._lengths[version] = tuple(sorted(tables, reverse=True))
+
+    def lookup(self, address) -> tuple[int, list] | None:
+        """(일치한 접두사 길이, 장비 목록) 또는 None"""
+        value, bits = int(address), address.max_prefixlen
+        tables = self._tables[address.version]
+        for length in self._lengths[address.version]:
+            devices = tables[length].get(value >> (bits - length))
+            if devices:
+                return length, devices
+        return None
+
+    def apply(self, change: tuple):
+        """flush 에서 모은 변경 한 건 - ("device", 종류, ID, Device | None, IP 텍스트) / ("person", Person_ID, 값 | None)"""
+        if change[0] == "person":
+            _, person_id, values = change
+            if values is None:
+                self.people.pop(person_id, None)
+            else:
+                self.people[person_id] = values
+            return
+        _, kind, device_id, device, ip_text = change
+        self.remove(kind, device_id)
+        if device is not None:
+            self.add(device, ip_text)
+
+
+def _load_index() -> PrefixIndex:
+    index = PrefixIndex()
+    for person_id, company, site in db.session.query(CTMPeople.Person_ID, CTMPeople.Company, CTMPeople.Last_Name):
+        index.people[person_id] = (company, site)
+
+    for model, (kind, pk, name, site) in DEVICE_MODELS.items():
+        ip_column = getattr(model, INET_COLUMNS[model][0])
+        columns = [getattr(model, pk), getattr(model, name), model.Person_ID, ip_column]
+        if site:
+            columns.append(getattr(model, site))
+        for row in db.session.query(*columns).filter(ip_column.isnot(None)).order_by(columns[0]):
+            device = Device(kind, row[0], row[1], row[2], row[4] if site else None)
+            index.add(device, row[3])
+    return index
+
+
+class _OwnerIndex:
+    """프로세스 공용 표 + 재구성 / commit 반영 순서 관리"""
+
+    def __init__(self):
+        self.index: PrefixIndex | None = None
+        self.built_at = 0.0
+        self._pending: list | None = None  # 재구성 중에 commit 된 변경 (새 표에도 반영, None 은 다시 읽기 요청)
+        self._lock = threading.Lock()  # 표 조회 / 변경
+        self._build_lock = threading.Lock()  # 전체 읽기는 한 번에 하나
+
+    def _fresh(self, max_age: float) -> bool:
+        return self.index is not None and time.monotonic() - self.built_at < max_age
+
+    def get(self, max_age: float) -> PrefixIndex:
+        if self._fresh(max_age):
+            return self.index
+        with self._build_lock:
+            if self._fresh(max_age):  # 기다리는 동안 다른 요청이 읽음
+                return self.index
+            with self._lock:
+                self._pending = []
+            try:
+                index = _load_index()
+            finally:
+                with self._lock:
+                    pending, self._pending = self._pending, None
+            with self._lock:
+                for change in pending:
+                    if change is not None:
+                        index.apply(change)
+                self.index = index
+                # 읽는 도중 무효화됐으면 이번 결과는 쓰되 다음 조회에서 다시 읽음
+                self.built_at = 0.0 if None in pending else time.monotonic()
+            return index
+
+    def apply(self, changes: list):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.extend(changes)
+            if self.index is not None:
+                for change in changes:
+                    self.index.apply(change)
+
+    def invalidate(self):
+        with self._lock:
+            self.built_at = 0.0
+            if self._pending is not None:
+                self._pending.append(None)
+
+
+_owners = _OwnerIndex()
+
+
+def invalidate_ip_owners():
+    """일괄 등록처럼 ORM 이벤트 없이 장비를 바꾼 뒤 호출 (다음 조회 때 전체를 다시 읽음)"""
+    _owners.invalidate()
+
+
+# ---------------------------------------------------------------------------
+# 저장 / 삭제 반영 (flush 때 값을 모아 두고 commit 후 반영)
+# ---------------------------------------------------------------------------
+def _device_change(obj, deleted: bool):
+    kind, pk, name, site = DEVICE_MODELS[type(obj)]
+    device_id = getattr(obj, pk)
+    if deleted:
+        return ("device", kind, device_id, None, None)
+    device = Device(kind, device_id, getattr(obj, name), obj.Person_ID, getattr(obj, site) if site else None)
+    return ("device", kind, device_id, device, getattr(obj, INET_COLUMNS[type(obj)][0]))
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _collect_changes(db_session, flush_context):
+    changes = []
+    for obj, deleted in chain(
+        ((o, False) for o in chain(db_session.new, db_session.dirty)),
+        ((o, True) for o in db_session.deleted),
+    ):
+        if type(obj) in DEVICE_MODELS:
+            changes.append(_device_change(obj, deleted))
+        elif isinstance(obj, CTMPeople):
+            changes.append(("person", obj.Person_ID, None if deleted else (obj.Company, obj.Last_Name)))
+    if changes:
+        db_session.info.setdefault(_CHANGES_KEY, []).extend(changes)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _apply_changes(db_session):
+    changes = db_session.info.pop(_CHANGES_KEY, None)
+    if changes:
+        _owners.apply(changes)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_changes(db_session):
+    db_session.info.pop(_CHANGES_KEY, None)
+
+
+# ---------------------------------------------------------------------------
+# 조회
+# ---------------------------------------------------------------------------
+def _describe(index: PrefixIndex, address, length: int, devices: list) -> dict:
+    matches = []
+    for d in sorted(devices, key=lambda d: (d.kind != "asset", d.id)):
+        company, site = index.people.get(d.person_id, (None, None))
+        matches.append({
+            "type": d.kind,
+            "id": d.id,
+            "name": d.name,
+            "person_id": d.person_id,
+            "company": company,
+            "site": d.site or site,
+        })
+    network = ipaddress.ip_network((address, length), strict=False)
+    return {"network": str(network), "matches": matches}
+
+
+def resolve_ips(ips) -> dict[str, dict | None]:
+    """IP 문자열 목록 → {IP: {"network", "matches": [장비 ...]} 또는 None (해석할 수 없거나 등록되지 않은 IP)}
+
+    matches 는 가장 길게 일치한 대역(보통 그 IP 자체)에 등록된 장비들이며 보안장비, 서버 순입니다.
+    """
+    index = _owners.get(current_app.config.get("IP_OWNER_REBUILD_SECONDS", 600))
+    results = {}
+    with _owners._lock:
+        for ip in ips:
+            if ip in results:
+                continue
+            try:
+                address = ipaddress.ip_address(ip.strip())
+            except (AttributeError, ValueError):
+                results[ip] = None
+                continue
+            found = index.lookup(address)
+            results[ip] = _describe(index, address, *found) if found else None
+    return results
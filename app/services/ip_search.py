@@ -0,0 +1,160 @@
+import ipaddress
+import re
+
+from sqlalchemy import Text, and_, cast, event, false, literal, or_, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, INET
+
+from ..extensions import db
+from ..models.ast_computersystem import AST_Computer_System
+from ..models.servers import ServerInfo
+
+# IP 대역 검색 (보안장비 / 서버 목록)
+#
+# IP 컬럼(AST_Computer_System.IP_Address, Server_Info.chServerInfo)은 자유 입력 텍스트라
+# "10.0.0.1 (관리)" / "10.0.0.1, 10.0.0.2" 처럼 저장되어 있어 ILIKE 로는 대역 검색을 할 수 없습니다.
+# 저장할 때 텍스트를 해석해 그림자 컬럼 두 개에 같이 넣습니다.
+#   IP_Inet  / chServerInet    첫 번째 IP(또는 10.0.0.0/24 같은 대역) - inet, GiST(inet_ops) 인덱스
+#   IP_Inets / chServerInets   적힌 IP / 대역 전체 - inet[], GIN 인덱스
+# 목록 검색어가 IP / CIDR / 범위이면 이 컬럼들을 인덱스로 검색합니다.
+#
+#   10.20.1.5                   그 IP 가 적힌 장비 (두 번째 이후 IP 포함) + 첫 번째 값이 그 IP 를 포함하는 대역인 장비
+#   10.20.0.0/16                첫 번째 IP 가 대역 안인 장비
+#   10.20.1.1-10.20.1.200       첫 번째 IP 가 범위 안인 장비 (~ 도 가능)
+# 대역 / 범위 검색은 첫 번째 IP 기준입니다. (inet[] 의 원소별 포함 검색은 인덱스를 쓸 수 없음)
+#
+# ORM 저장은 before_insert / before_update 에서, 일괄 등록(Core INSERT)은 fill_inet_values() 로 채웁니다.
+# 개발용 SQLite 는 inet 이 없으므로 정확한 IP 만 같은 문자열로 비교합니다. (목록 컬럼은 공백으로 감싼 텍스트, models/types.py)
+
+# 모델 → (IP 텍스트 속성, 첫 번째 inet 속성, inet 목록 속성)
+INET_COLUMNS = {
+    AST_Computer_System: ("IP_Address", "IP_Inet", "IP_Inets"),
+    ServerInfo: ("chServerInfo", "chServerInet", "chServerInets"),
+}
+
+_IPV4 = re.compile(r"(?<![\d.])\d{1,3}(?:\.\d{1,3}){3}(?:/\d{1,2})?(?![\d.])")
+_SEPARATORS = re.compile(r"[\s,;()\[\]]+")
+_RANGE = re.compile(r"^\s*(\S+)\s*[-~]\s*(\S+)\s*$")
+
+
+def _interface(token: str) -> str | None:
+    try:
+        iface = ipaddress.ip_interface(token)
+    except ValueError:
+        return None
+    network = iface.network
+    if iface.ip == network.network_address and network.prefixlen < network.max_prefixlen:
+        return str(network)  # 대역으로 등록된 값 (10.0.0.0/24)
+    return str(iface.ip)
+
+
+def iter_inets(text: str | None):
+    """IP 텍스트에 적힌 IP / 대역 전체 (IPv4 먼저, 해석할 수 없는 조각은 건너뜀)"""
+    if not text:
+        return
+    for token in _IPV4.findall(text):
+        value = _interface(token)
+        if value:
+            yield value
+    # IPv6 (구분자로 나눈 조각 중 해석되는 값)
+    for token in _SEPARATORS.split(text):
+        if ":" in token:
+            value = _interface(token)
+            if value:
+                yield value
+
+
+def to_inet(text: str | None) -> str | None:
+    """IP 텍스트에서 첫 번째 IP / 대역 (해석할 수 없으면 None)"""
+    return next(iter_inets(text), None)
+
+
+def to_inets(text: str | None) -> list[str] | None:
+    """IP 텍스트에 적힌 IP / 대역 목록 (중복 제거, 없으면 None)"""
+    return list(dict.fromkeys(iter_inets(text))) or None
+
+
+def fill_inet_values(model, values: dict):
+    """일괄 등록 행(dict)에 inet 그림자 값 채우기 (IP 열이 있는 파일만)"""
+    columns = INET_COLUMNS.get(model)
+    if columns and columns[0] in values:
+        source, first, every = columns
+        values[first] = to_inet(values[source])
+        values[every] = to_inets(values[source])
+
+
+def _sync_inet(mapper, connection, target):
+    source, first, every = INET_COLUMNS[mapper.class_]
+    text = getattr(target, source)
+    setattr(target, first, to_inet(text))
+    setattr(target, every, to_inets(text))
+
+
+for _model in INET_COLUMNS:
+    event.listen(_model, "before_insert", _sync_inet)
+    event.listen(_model, "before_update", _sync_inet)
+
+
+# ---------------------------------------------------------------------------
+# 검색어 해석 / 조건
+# ---------------------------------------------------------------------------
+def parse_ip_query(q: str):
+    """검색어가 IP 조건이면 ("ip", addr) / ("cidr", network) / ("range", lo, hi), 아니면 None"""
+    q = (q or "").strip()
+    if not q:
+        return None
+
+    matched = _RANGE.match(q)
+    if matched:
+        try:
+            lo, hi = (ipaddress.ip_address(v) for v in matched.groups())
+        except ValueError:
+            return None
+        if lo.version != hi.version:
+            return None
+        return ("range", min(lo, hi), max(lo, hi))
+
+    if "/" in q:
+        try:
+            return ("cidr", ipaddress.ip_network(q, strict=False))
+        except ValueError:
+            return None
+
+    try:
+        return ("ip", ipaddress.ip_address(q))
+    except ValueError:
+        return None
+
+
+def _inet(value):
+    return cast(literal(str(value)), INET)
+
+
+def ip_condition(column, ip_query):
+    """parse_ip_query() 결과를 inet 그림자 컬럼 조건으로 (GiST inet_ops 인덱스 대상)"""
+    kind = ip_query[0]
+    if db.engine.dialect.name != "postgresql":
+        # inet 연산자가 없는 DB: 정규화된 문자열 비교 (범위 / 대역은 일치하는 값 없음)
+        return column == str(ip_query[1]) if kind == "ip" else false()
+
+    if kind == "ip":
+        return column.op(">>=")(_inet(ip_query[1]))  # 그 IP, 또는 그 IP 를 포함하는 대역
+    if kind == "cidr":
+        return column.op("<<=")(_inet(ip_query[1]))
+    _, lo, hi = ip_query
+    return and_(column >= _inet(lo), column <= _inet(hi))
+
+
+def _has_address(column, address):
+    """inet 목록 컬럼에 그 IP 가 있는지 (GIN 인덱스 대상)"""
+    if db.engine.dialect.name != "postgresql":
+        return type_coerce(column, Text).like(f"% {address} %")
+    return column.op("@>")(cast(literal(f"{{{address}}}"), ARRAY(INET)))
+
+
+def ip_filter(model, ip_query):
+    """목록 검색 조건 - 첫 번째 inet 조건 + 정확한 IP 는 inet 목록에 있는지 (두 번째 이후 IP 도 찾도록)"""
+    _, first, every = INET_COLUMNS[model]
+    condition = ip_condition(getattr(model, first), ip_query)
+    if ip_query[0] == "ip":
+        condition = or_(condition, _has_address(getattr(model, every), ip_query[1]))
+    return condition
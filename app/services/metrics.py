@@ -0,0 +1,190 @@
+import threading
+import time
+from bisect import bisect_left
+
+from flask import Flask, g, request
+
+# Prometheus 텍스트 형식 지표 (GET /metrics, routes/metrics.py)
+#
+# - soms_http_request_duration_seconds   요청 처리 시간 (blueprint / endpoint / method)
+# - soms_http_response_size_bytes        응답 크기 (길이를 아는 응답만)
+# - soms_upload_bytes_total              업로드 본문 바이트 (multipart POST / 분할 업로드 PUT)
+# - soms_download_bytes_total            첨부 / 내보내기 응답 바이트 (Content-Disposition: attachment)
+# - soms_db_pool_*                       SQLAlchemy 연결 풀 상태 (수집 시점 값) / 연결 대기 시간
+#
+# 값은 프로세스 메모리에 있으므로 gunicorn 워커가 여럿이면 워커마다 따로 수집됩니다.
+# 앞단 웹서버가 보내는 다운로드(DOWNLOAD_OFFLOAD)는 본문 바이트가 세어지지 않습니다.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+EXCLUDED_ENDPOINTS = {"metrics.index"}
+
+
+def _label_text(names, values) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help_text, labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, *label_values):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for values, total in sorted(self._values.items()):
+                lines.append(f"{self.name}{_label_text(self.labels, values)} {_number(total)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name, self.help, self.labels = name, help_text, labels
+        self.buckets = buckets
+        self._series = {}  # 라벨 값 → [구간별 개수..., +Inf 개수, 합계]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labels + ("le",)
+        with self._lock:
+            for values, series in sorted(self._series.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets + ("+Inf",), series):
+                    cumulative += n
+                    le = bound if bound == "+Inf" else _number(bound)
+                    lines.append(f"{self.name}_bucket{_label_text(names, values + (le,))} {cumulative}")
+                labels = _label_text(self.labels, values)
+                lines.append(f"{self.name}_sum{labels} {_number(series[-1])}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "soms_http_request_duration_seconds", "요청 처리 시간(초)", ("blueprint", "endpoint", "method"),
+)
+RESPONSE_SIZE = Histogram(
+    "soms_http_response_size_bytes", "응답 본문 크기(바이트)", ("blueprint", "endpoint"), SIZE_BUCKETS,
+)
+UPLOAD_BYTES = Counter("soms_upload_bytes_total", "업로드 요청 본문 바이트", ("endpoint",))
+DOWNLOAD_BYTES = Counter("soms_download_bytes_total", "첨부 / 내보내기 응답 바이트", ("endpoint",))
+POOL_WAIT = Histogram(
+    "soms_db_pool_checkout_seconds", "연결 풀에서 연결을 얻기까지 걸린 시간(초, 새 연결 생성 포함)",
+)
+
+_REQUEST_METRICS = (REQUEST_LATENCY, RESPONSE_SIZE, UPLOAD_BYTES, DOWNLOAD_BYTES, POOL_WAIT)
+
+
+# ---------------------------------------------------------------------------
+# 연결 풀
+# ---------------------------------------------------------------------------
+def _time_pool_checkout(pool):
+    """풀에는 '꺼내기 전' 이벤트가 없으므로 connect 를 감싸 대기 시간을 잼"""
+    connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            POOL_WAIT.observe(time.perf_counter() - start)
+
+    pool.connect = timed_connect
+
+
+def _pool_lines(engine) -> list[str]:
+    pool = engine.pool
+    gauges = [
+        ("soms_db_pool_size", "풀 크기", "size"),
+        ("soms_db_pool_checked_out", "사용 중인 연결 수", "checkedout"),
+        ("soms_db_pool_checked_in", "풀에서 대기 중인 연결 수", "checkedin"),
+        ("soms_db_pool_overflow", "풀 크기를 넘어 만든 연결 수 (음수면 아직 만들지 않은 풀 자리)", "overflow"),
+    ]
+    lines = []
+    for name, help_text, method in gauges:
+        # QueuePool 이 아닌 풀(SQLite 메모리 DB 등)은 일부 값이 없음
+        if not hasattr(pool, method):
+            continue
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {getattr(pool, method)()}"]
+    return lines
+
+
+def render(engine) -> str:
+    lines = []
+    for metric in _REQUEST_METRICS:
+        lines += metric.render()
+    lines += _pool_lines(engine)
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# 요청 훅
+# ---------------------------------------------------------------------------
+def _count_stream(body, endpoint: str):
+    try:
+        for chunk in body:
+            DOWNLOAD_BYTES.inc(len(chunk.encode() if isinstance(chunk, str) else chunk), endpoint)
+            yield chunk
+    finally:
+        close = getattr(body, "close", None)
+        if close:
+            close()
+
+
+def _start_request():
+    g._metrics_start = time.perf_counter()
+
+
+def _finish_request(response):
+    start = g.pop("_metrics_start", None)
+    endpoint = request.endpoint or "unknown"
+    if start is None or endpoint in EXCLUDED_ENDPOINTS:
+        return response
+
+    blueprint = request.blueprint or ""
+    REQUEST_LATENCY.observe(time.perf_counter() - start, blueprint, endpoint, request.method)
+
+    if request.content_length and (request.mimetype == "multipart/form-data" or request.method == "PUT"):
+        UPLOAD_BYTES.inc(request.content_length, endpoint)
+
+    length = response.content_length
+    if length is not None:
+        RESPONSE_SIZE.observe(length, blueprint, endpoint)
+
+    if response.headers.get("Content-Disposition", "").startswith("attachment"):
+        if length is not None:
+            DOWNLOAD_BYTES.inc(length, endpoint)
+        elif response.is_streamed:
+            response.response = _count_stream(response.response, endpoint)
+    return response
+
+
+def init_metrics(app: Flask, engine):
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+    _time_pool_checkout(engine.pool)
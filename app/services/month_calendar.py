@@ -0,0 +1,74 @@
+import calendar
+from datetime import date, timedelta
+
+from ..extensions import db
+from ..models.ctm_people import CTMPeople
+from ..models.work_info import WorkInfo
+
+# 월 달력 데이터 (대시보드 / 작업 일정 공용)
+#
+# 칸에 필요한 값(id, 고객사, 사이트, 작업 유형)만 조회합니다.
+# Work_Info 는 (Work_Date, Work_ID) INCLUDE (Person_ID, Work_Type) 커버링 인덱스로 읽고,
+# 고객사명은 CTM_People 기본 키로 붙입니다. (마이그레이션 4b9e2d7a6f31)
+
+FIRST_WEEKDAY = 6  # 일요일 시작
+
+
+def month_weeks(year: int, month: int) -> list[list[date]]:
+    return calendar.Calendar(firstweekday=FIRST_WEEKDAY).monthdatescalendar(year, month)
+
+
+def month_window(year: int, month: int) -> tuple[date, date]:
+    """달력에 보이는 첫 날 ~ 마지막 날 (앞뒤 달의 날짜 포함)"""
+    weeks = month_weeks(year, month)
+    return weeks[0][0], weeks[-1][-1]
+
+
+def adjacent_months(year: int, month: int) -> tuple[tuple[int, int], tuple[int, int]]:
+    """((이전 연, 월), (다음 연, 월))"""
+    first = date(year, month, 1)
+    prev_last = first - timedelta(days=1)
+    next_first = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return (prev_last.year, prev_last.month), (next_first.year, next_first.month)
+
+
+def month_items_query(start_date: date, end_date: date):
+    return (
+        db.session.query(
+            WorkInfo.Work_ID,
+            WorkInfo.Work_Date,
+            WorkInfo.Work_Type,
+            CTMPeople.Company,
+            CTMPeople.Last_Name,
+        )
+        .join(CTMPeople, CTMPeople.Person_ID == WorkInfo.Person_ID)
+        .filter(WorkInfo.Work_Date >= start_date)
+        .filter(WorkInfo.Work_Date <= end_date)
+        .order_by(WorkInfo.Work_Date.asc(), WorkInfo.Work_ID.asc())
+    )
+
+
+def load_month_items(start_date: date, end_date: date) -> dict[date, list[dict]]:
+    """{날짜: [{"id", "company", "location", "type"}, ...]} (날짜, Work_ID 순)"""
+    by_day = {}
+    for r in month_items_query(start_date, end_date).all():
+        by_day.setdefault(r.Work_Date, []).append({
+            'id': r.Work_ID,
+            'company': r.Company,
+            'location': r.Last_Name,
+            'type': r.Work_Type,
+        })
+    return by_day
+
+
+def month_payload(year: int, month: int, by_day: dict[date, list[dict]]) -> dict:
+    """월 JSON 응답 본문 (날짜는 ISO 문자열)"""
+    (prev_y, prev_m), (next_y, next_m) = adjacent_months(year, month)
+    return {
+        "year": year,
+        "month": month,
+        "weeks": [[d.isoformat() for d in week] for week in month_weeks(year, month)],
+        "days": {d.isoformat(): items for d, items in sorted(by_day.items())},
+        "prev": {"y": prev_y, "m": prev_m},
+        "next": {"y": next_y, "m": next_m},
+    }
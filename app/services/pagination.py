@@ -0,0 +1,175 @@
+from datetime import date, datetime
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import and_, false, or_
+
+# 커서(Keyset / Seek) 페이지네이션
+#
+# OFFSET + COUNT(*) 대신 "마지막으로 본 행의 정렬 키" 이후 행만 조회합니다.
+# 정렬 키에 맞는 인덱스가 있으면 N 번째 페이지도 1 페이지와 같은 비용이고, count 쿼리가 없습니다.
+# 커서는 SECRET_KEY 로 서명된 불투명(opaque) 토큰이라 클라이언트가 값을 조작할 수 없습니다.
+
+_SALT = "soms.keyset"
+
+
+class SortKey:
+    """정렬 키 한 개 (NULL 은 항상 마지막)"""
+
+    def __init__(self, column, descending: bool = True, nullable: bool = False):
+        self.column = column
+        self.descending = descending
+        self.nullable = nullable
+
+    def order_by(self, reverse: bool = False):
+        descending = self.descending != reverse
+        clause = self.column.desc() if descending else self.column.asc()
+        if self.nullable:
+            clause = clause.nulls_first() if reverse else clause.nulls_last()
+        return clause
+
+    def eq(self, value):
+        return self.column.is_(None) if value is None else self.column == value
+
+    def after(self, value):
+        """정렬 순서상 value 보다 뒤에 오는 행"""
+        if value is None:
+            return false()
+        cond = self.column < value if self.descending else self.column > value
+        return or_(cond, self.column.is_(None)) if self.nullable else cond
+
+    def before(self, value):
+        """정렬 순서상 value 보다 앞에 오는 행"""
+        if value is None:
+            return self.column.isnot(None)
+        return self.column > value if self.descending else self.column < value
+
+    def dump(self, value):
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        return value
+
+    def load(self, value):
+        if value is None:
+            return None
+        python_type = self.column.type.python_type
+        if python_type in (date, datetime):
+            return python_type.fromisoformat(value)
+        return python_type(value)
+
+
+class KeysetPagination:
+    """Flask-SQLAlchemy Pagination 과 비슷한 인터페이스 (total / pages 없음)"""
+
+    def __init__(self, items, per_page, has_next, has_prev, next_cursor, prev_cursor):
+        self.items = items
+        self.per_page = per_page
+        self.has_next = has_next
+        self.has_prev = has_prev
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+
+def _serializer():
+    return URLSafeSerializer(current_app.config["SECRET_KEY"], salt=_SALT)
+
+
+def encode_cursor(direction: str, keys: list[SortKey], values) -> str:
+    return _serializer().dumps([direction, [k.dump(v) for k, v in zip(keys, values)]])
+
+
+def decode_cursor(token: str | None, keys: list[SortKey]):
+    """(direction, values) 반환. 잘못된 토큰이면 (None, None) → 첫 페이지"""
+    if not token:
+        return None, None
+    try:
+        direction, raw = _serializer().loads(token)
+        if direction not in ("next", "prev") or len(raw) != len(keys):
+            return None, None
+        return direction, [k.load(v) for k, v in zip(keys, raw)]
+    except (BadSignature, TypeError, ValueError):
+        return None, None
+
+
+def _range_bound(key: SortKey, value, direction: str):
+    """첫 정렬 키의 범위 조건 (인덱스 범위 검색용, NULL 행 제외)"""
+    upper = key.descending == (direction == "next")
+    return key.column <= value if upper else key.column >= value
+
+
+def _seek(keys: list[SortKey], values, direction: str):
+    """(k1, k2, ...) 행 비교를 NULL 을 고려한 OR/AND 조건으로 전개"""
+    clauses = []
+    for i, key in enumerate(keys):
+        prefix = [keys[j].eq(values[j]) for j in range(i)]
+        step = key.after(values[i]) if direction == "next" else key.before(values[i])
+        clauses.append(and_(*prefix, step))
+
+    # OR 조건만으로는 인덱스 범위(Index Cond)를 잡지 못하므로 첫 키의 범위를 중복으로 덧붙임
+    # (첫 키가 NULL 을 허용하면 NULL 행이 범위 밖이 되므로 덧붙이지 않음 → seek_next 참고)
+    first, value = keys[0], values[0]
+    if not first.nullable and value is not None:
+        return and_(_range_bound(first, value, direction), or_(*clauses))
+    return or_(*clauses)
+
+
+def _splits_nulls(keys: list[SortKey], values) -> bool:
+    return keys[0].nullable and values[0] is not None
+
+
+def seek_next(query, keys: list[SortKey], values):
+    """cursor 다음 행 조회 쿼리 (정렬 / LIMIT 제외)
+
+    첫 키가 NULL 을 허용하면 NULL 이 아닌 구간만 범위 조건으로 조회합니다.
+    정렬상 맨 뒤에 오는 NULL 행은 keyset_paginate 가 모자란 만큼 따로 채웁니다.
+    """
+    if _splits_nulls(keys, values):
+        return query.filter(_range_bound(keys[0], values[0], "next"), _seek(keys, values, "next"))
+    return query.filter(_seek(keys, values, "next"))
+
+
+def entity_sort_key(keys: list[SortKey]):
+    """모델 인스턴스 한 개를 조회하는 쿼리용 key_of (정렬 키 컬럼 속성값 튜플)"""
+    return lambda obj: tuple(getattr(obj, k.column.key) for k in keys)
+
+
+def keyset_paginate(query, keys: list[SortKey], key_of, cursor: str | None = None, per_page: int = 10):
+    """query 를 keys 순서로 정렬해 cursor 다음(또는 이전) per_page 건을 조회
+
+    key_of: 결과 행 → 정렬 키 값 튜플 (예: lambda row: (row[0].Work_Date, row[0].Work_ID))
+    """
+    direction, values = decode_cursor(cursor, keys)
+
+    if direction == "prev":
+        rows = (
+            query.filter(_seek(keys, values, "prev"))
+            .order_by(*[k.order_by(reverse=True) for k in keys])
+            .limit(per_page + 1)
+            .all()
+        )
+        if len(rows) <= per_page:
+            # 맨 앞에 도달: 첫 페이지와 같은 경계로 맞추기 위해 처음부터 다시 조회
+            return keyset_paginate(query, keys, key_of, None, per_page)
+        items = list(reversed(rows[:per_page]))
+        has_prev, has_next = True, True
+    else:
+        order = [k.order_by() for k in keys]
+        if direction == "next":
+            rows = seek_next(query, keys, values).order_by(*order).limit(per_page + 1).all()
+            if _splits_nulls(keys, values) and len(rows) <= per_page:
+                rows += (
+                    query.filter(keys[0].column.is_(None))
+                    .order_by(*order)
+                    .limit(per_page + 1 - len(rows))
+                    .all()
+                )
+        else:
+            rows = query.order_by(*order).limit(per_page + 1).all()
+        items = rows[:per_page]
+        has_next = len(rows) > per_page
+        has_prev = direction == "next"
+
+    next_cursor = encode_cursor("next", keys, key_of(items[-1])) if has_next and items else None
+    prev_cursor = encode_cursor("prev", keys, key_of(items[0])) if has_prev and items else None
+
+    return KeysetPagination(items, per_page, has_next, has_prev, next_cursor, prev_cursor)
@@ -0,0 +1,87 @@
+from flask import current_app
+
+# 엔드포인트별 SQL 문장 수 상한 (요청 한 번, 캐시가 모두 비어 있을 때 기준)
+#
+# services/sql_stats.py 가 요청마다 센 문장 수를 여기 상한과 비교합니다.
+#   SQL_QUERY_BUDGET = ""      확인 안 함 (기본)
+#                      "warn"  초과 시 soms.sql 경고 로그
+#                      "raise" 초과 시 QueryBudgetExceeded (개발 / 검증 환경에서 바로 드러나도록)
+# 전 엔드포인트 점검: python -m pytest tests/test_query_budget.py (SQLite 픽스처, 저장 요청은 fragment 유무 모두)
+#                   python -m bench.budget (PostgreSQL 벤치마크 데이터 규모로 조회 화면 확인)
+#
+# 로그인 사용자 조회 1회(user_cache 미스)가 포함된 값입니다.
+# 반복문 안의 lazy 로딩이나 count 쿼리가 추가되면 상한을 넘으므로, 상한을 올릴 때는 이유를 주석으로 남길 것.
+
+DEFAULT_BUDGET = 3
+
+QUERY_BUDGETS = {
+    # 달력 / 최근 SR / 계약 만료 임박 (각 1회, 캐시 미스 시)
+    "dashboard.index": 4,
+    # 목록 + OFFSET 페이지 count + 상단 통계 집계
+    "customers.list_customers": 4,
+    "customers.detail": 2,
+    "customers.tab_rows": 3,
+    "customers.ajax_search": 2,
+    "contract.ajax_list_contracts": 2,
+    # 커서 방식은 목록 1회, ?page= 방식은 count 1회 추가
+    "work.list_work": 3,
+    "work.ajax_list_work": 2,
+    "work.ajax_get_work_detail": 3,
+    "work.ajax_work_attachments": 2,
+    "sr.list_sr": 3,
+    "sr.ajax_list_sr": 2,
+    "sr.ajax_get_sr_detail": 2,
+    # INSERT 후 응답의 sr_id 를 읽으려고 다시 조회
+    "sr.ajax_create_sr": 3,
+    "sr.ajax_update_sr": 3,
+    "sr.ajax_delete_sr": 3,
+    # 행 조각(fragment)을 요청하면 행의 고객 조회가 추가됨 (커밋 전에 그리므로 저장한 행은 다시 읽지 않음, services/fragments.py)
+    "work.ajax_update_work": 4,
+    "customers.add_server": 4,
+    # 작업 + 첨부 조회, 삭제 시 고객(people) 관계 로딩(work_items 가 dynamic 이라 flush 때 읽음), DELETE
+    "work.ajax_delete_work": 5,
+    "customers.delete_work": 5,
+    # 작업 조회 + 삭제할 첨부 조회 + 첨부 수 count + UPDATE
+    "customers.update_work": 4,
+    # 고객 조회 + 배치(BATCH_SIZE 행)마다 기존 장비명 확인 / INSERT - 테스트 파일(배치 1개) 기준
+    "customers.bulk_import": 4,
+    "asset.list_security": 3,
+    # IP → 고객 표가 비어 있으면 고객 / 보안장비 / 서버를 한 번씩 읽음 (services/ip_owner.py)
+    "asset.ajax_ip_owners": 4,
+    "asset.list_servers": 3,
+    "schedule.index": 2,
+    "schedule.month_json": 2,
+    # POST(등록 / 수정)는 아이디 조회 + INSERT / UPDATE
+    "users.list_users": 3,
+    "auth.login": 1,
+    "auth.change_password": 1,
+    "uploads.chunked_status": 1,
+    # 대상 작업 조회 + (PostgreSQL) 저장소 advisory lock + 첨부 INSERT + 작업 첨부 여부 UPDATE
+    "uploads.chunked_complete": 5,
+    "metrics.index": 0,
+    "static": 0,
+}
+
+
+class QueryBudgetExceeded(AssertionError):
+    def __init__(self, endpoint: str, count: int, budget: int):
+        super().__init__(f"{endpoint}: SQL {count}회 실행 (상한 {budget}회)")
+        self.endpoint = endpoint
+        self.count = count
+        self.budget = budget
+
+
+def budget_for(endpoint: str | None) -> int:
+    return QUERY_BUDGETS.get(endpoint or "", DEFAULT_BUDGET)
+
+
+def check_budget(endpoint: str | None, count: int, logger):
+    """SQL_QUERY_BUDGET 설정에 따라 상한 초과를 경고하거나 예외로 알림"""
+    mode = current_app.config.get("SQL_QUERY_BUDGET")
+    budget = budget_for(endpoint)
+    if not mode or count <= budget:
+        return
+
+    if mode == "raise":
+        raise QueryBudgetExceeded(endpoint, count, budget)
+    logger.warning("SQL 문장 수 상한 초과 - %s: %d회 (상한 %d회)", endpoint, count, budget)
@@ -0,0 +1,29 @@
+from sqlalchemy import or_
+
+# 목록 화면 부분 문자열 검색 레이어
+#
+# 검색 대상 컬럼에는 pg_trgm GIN 인덱스(gin_trgm_ops)가 생성되어 있어서
+# ("migrations/versions/3f1c2a9b7d10_trgm_search_indexes.py")
+# 앞쪽 와일드카드가 있는 ILIKE '%q%' 도 인덱스 스캔으로 처리됩니다.
+# pg_trgm 이 없는 DB(또는 SQLite 개발환경)에서는 같은 조건이 일반 ILIKE 로 동작합니다.
+
+_LIKE_ESCAPE = "\\"
+
+
+def escape_like(value: str) -> str:
+    """LIKE 와일드카드(%, _)를 일반 문자로 취급하도록 이스케이프"""
+    return (
+        value.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+        .replace("%", _LIKE_ESCAPE + "%")
+        .replace("_", _LIKE_ESCAPE + "_")
+    )
+
+
+def contains(column, q: str):
+    """column ILIKE '%q%' (trigram 인덱스 대상)"""
+    return column.ilike(f"%{escape_like(q)}%", escape=_LIKE_ESCAPE)
+
+
+def contains_any(q: str, *columns):
+    """여러 컬럼 중 하나라도 q 를 포함하는 조건 (OR → BitmapOr 인덱스 스캔)"""
+    return or_(*(contains(col, q) for col in columns))
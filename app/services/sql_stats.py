@@ -0,0 +1,156 @@
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from flask import Flask, current_app, g, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .query_budget import check_budget
+
+# 요청별 SQL 계측 (문장 수 / DB 시간 / 같은 모양 문장 반복)
+#
+# 엔진 이벤트(before/after_cursor_execute)로 요청 중 실행된 문장을 셉니다.
+# 응답에 Server-Timing 헤더(db;dur=..;desc="N queries")를 붙이고 요청마다 JSON 로그 한 줄을 남깁니다.
+# 같은 모양의 문장이 한 요청에서 SQL_REPEAT_WARN 회를 넘으면 경고합니다. (N+1 - 반복문 안의 lazy 관계 로딩 등)
+# 요청 밖(CLI, 백그라운드 캐시 갱신 스레드)에서 실행된 문장은 세지 않습니다.
+# 요청 중 앱 컨텍스트를 새로 연 계산(dashboard_data 의 캐시 미스 등)도 세도록 g 대신 ContextVar 에 둡니다.
+# 엔드포인트별 문장 수 상한 확인은 services/query_budget.py (SQL_QUERY_BUDGET)
+
+logger = logging.getLogger("soms.sql")
+
+_START_KEY = "soms_sql_start"
+
+_current: ContextVar["RequestSQLStats | None"] = ContextVar("soms_sql_stats", default=None)
+
+# 리터럴 / 바인드 자리 / IN 목록 길이가 달라도 같은 모양으로 봄
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\?|:\w+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+class RequestSQLStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.samples = {}
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.duration += elapsed
+        shape = fingerprint(statement)
+        self.shapes[shape] += 1
+        self.samples.setdefault(shape, statement)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """[(지문, 횟수)] - threshold 회를 넘은 문장 모양 (많은 순)"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+def fingerprint(statement: str) -> str:
+    normalized = _PARAM.sub("?", statement)
+    normalized = _LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    normalized = _SPACES.sub(" ", normalized).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def current_stats() -> RequestSQLStats | None:
+    return _current.get()
+
+
+# ---------------------------------------------------------------------------
+# 엔진 이벤트
+# ---------------------------------------------------------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_stats() is not None:
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats()
+    starts = conn.info.get(_START_KEY)
+    if stats is None or not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    # 세션 설정(SET LOCAL statement_timeout 등)은 조회 문장 수에서 제외
+    if statement.startswith("SET "):
+        return
+    stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # 실패한 문장은 after 이벤트가 오지 않으므로 시작 시각만 버림
+    starts = exception_context.connection.info.get(_START_KEY) if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+# ---------------------------------------------------------------------------
+# 요청 훅
+# ---------------------------------------------------------------------------
+def _start_request():
+    _current.set(RequestSQLStats())
+    g._sql_request_start = time.perf_counter()
+
+
+def _finish_request(response):
+    stats = _current.get()
+    _current.set(None)
+    if stats is None:
+        return response
+
+    total_ms = (time.perf_counter() - g.pop("_sql_request_start")) * 1000
+    db_ms = stats.duration * 1000
+    response.headers.add(
+        "Server-Timing", f'db;dur={db_ms:.1f};desc="{stats.count} queries", app;dur={total_ms:.1f}'
+    )
+
+    threshold = current_app.config["SQL_REPEAT_WARN"]
+    repeated = stats.repeated(threshold)
+    for shape, n in repeated:
+        sample = _SPACES.sub(" ", stats.samples[shape])[:300]
+        logger.warning("같은 SQL 이 %d회 반복됨 (%s %s, 지문 %s): %s",
+                       n, request.method, request.endpoint, shape, sample)
+
+    logger.info(json.dumps({
+        "method": request.method,
+        "path": request.path,
+        "endpoint": request.endpoint,
+        "status": response.status_code,
+        "queries": stats.count,
+        "db_ms": round(db_ms, 1),
+        "total_ms": round(total_ms, 1),
+        "repeated": {shape: n for shape, n in repeated},
+    }, ensure_ascii=False))
+
+    check_budget(request.endpoint, stats.count, logger)
+    return response
+
+
+_listening = False
+
+
+def init_sql_stats(app: Flask):
+    """SQL_STATS 가 켜져 있으면 요청 계측 등록 (엔진 이벤트는 프로세스당 한 번)"""
+    global _listening
+    app.config.setdefault("SQL_STATS", True)
+    app.config.setdefault("SQL_REPEAT_WARN", 10)
+    app.config.setdefault("SQL_QUERY_BUDGET", "")
+    if not app.config["SQL_STATS"]:
+        return
+
+    if not _listening:
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _listening = True
+
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
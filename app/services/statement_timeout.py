@@ -0,0 +1,87 @@
+import logging
+
+from flask import Flask, current_app, has_request_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from ..extensions import db
+from .db_routing import RoutingSession
+
+# 화면 종류별 SQL 문장 제한 시간 (config.STATEMENT_TIMEOUTS, ms)
+#
+#   search  목록 / 부분 일치 검색 / 탭 - 조건이 느슨한 ilike 검색이 연결을 오래 붙잡지 않도록 짧게
+#   bulk    내보내기 / 일괄 등록 - 전체 행을 읽으므로 길게
+#   default 그 외 (연결 시작 옵션 -c statement_timeout 으로 이미 걸려 있음)
+#
+# 요청 중 세션 트랜잭션이 시작될 때 SET LOCAL statement_timeout 을 실행합니다. (트랜잭션이 끝나면 원래 값)
+# pgbouncer 모드에서는 연결 시작 옵션을 쓸 수 없으므로 default 도 트랜잭션마다 겁니다.
+# 제한 시간을 넘으면 PostgreSQL 이 문장을 취소하고(57014), 사용자에게는 조건을 좁히라는 안내를 돌려줍니다.
+
+logger = logging.getLogger("soms.sql")
+
+ROUTE_CLASSES = {
+    "search": {
+        "customers.list_customers",
+        "customers.ajax_search",
+        "customers.tab_rows",
+        "work.list_work",
+        "work.ajax_list_work",
+        "sr.list_sr",
+        "sr.ajax_list_sr",
+        "asset.list_security",
+        "asset.list_servers",
+        "users.list_users",
+    },
+    "bulk": {
+        "work.export_work",
+        "sr.export_sr",
+        "asset.export_security",
+        "asset.export_servers",
+        "customers.bulk_import",
+    },
+}
+
+_QUERY_CANCELED = "57014"
+
+
+def route_class(endpoint: str | None) -> str:
+    for name, endpoints in ROUTE_CLASSES.items():
+        if endpoint in endpoints:
+            return name
+    return "default"
+
+
+def _request_timeout() -> int | None:
+    """이번 요청에서 SET LOCAL 로 걸어야 할 제한 시간 (연결 기본값과 같으면 None)"""
+    if not has_request_context():
+        return None
+    config = current_app.config
+    name = route_class(request.endpoint)
+    if name == "default" and not config["DB_PGBOUNCER"]:
+        return None
+    return config["STATEMENT_TIMEOUTS"][name]
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def _apply_timeout(db_session, transaction, connection):
+    if connection.dialect.name != "postgresql":
+        return
+    timeout = _request_timeout()
+    if timeout is not None:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+def _handle_operational_error(e: OperationalError):
+    if getattr(e.orig, "pgcode", None) != _QUERY_CANCELED:
+        raise e
+
+    db.session.rollback()
+    logger.warning("SQL 제한 시간 초과 (%s, %s): %s", request.endpoint, route_class(request.endpoint), request.full_path)
+    message = "조회 시간이 초과되었습니다. 검색 조건을 좁혀 다시 시도해 주세요."
+    if request.accept_mimetypes.best == "application/json" or "/ajax/" in request.path or request.method != "GET":
+        return jsonify({"ok": False, "message": message}), 503
+    return message, 503
+
+
+def init_statement_timeout(app: Flask):
+    app.register_error_handler(OperationalError, _handle_operational_error)
@@ -0,0 +1,132 @@
+import codecs
+import csv
+import io
+import posixpath
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse, parse
+
+# 업로드된 CSV / XLSX 를 한 행씩 읽기 (export.py 의 반대 방향)
+#
+# 파일 전체를 메모리에 올리지 않고 행 단위로 꺼냅니다.
+# XLSX 는 외부 라이브러리 없이 시트 XML 을 iterparse 로 읽고, 처리한 행은 바로 버립니다.
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CELL_REF = re.compile(r"^([A-Z]+)")
+
+
+class TabularError(ValueError):
+    pass
+
+
+def _detect_encoding(stream) -> str:
+    """한국어 엑셀에서 저장한 CSV 는 CP949 인 경우가 많아 앞부분으로 판별"""
+    sample = stream.read(64 * 1024)
+    stream.seek(0)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def _iter_csv(stream):
+    text = io.TextIOWrapper(stream, encoding=_detect_encoding(stream), newline="")
+    try:
+        yield from enumerate(csv.reader(text), 1)
+    finally:
+        text.detach()  # 업로드 스트림은 호출한 쪽에서 닫음
+
+
+def _column_index(ref: str) -> int:
+    letters = _CELL_REF.match(ref).group(1)
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - 64)
+    return index - 1
+
+
+def _first_sheet_path(zf: zipfile.ZipFile) -> str:
+    workbook = parse(zf.open("xl/workbook.xml")).getroot()
+    sheet = workbook.find(f"{_NS}sheets/{_NS}sheet")
+    if sheet is None:
+        raise TabularError("시트가 없는 통합 문서입니다.")
+    rel_id = sheet.get(f"{_REL_NS}id")
+
+    rels = parse(zf.open("xl/_rels/workbook.xml.rels")).getroot()
+    for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target")
+            return target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join("xl", target))
+    raise TabularError("시트 경로를 찾을 수 없습니다.")
+
+
+def _shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    if "xl/sharedStrings.xml" not in zf.namelist():
+        return []
+    strings = []
+    for _, elem in iterparse(zf.open("xl/sharedStrings.xml")):
+        if elem.tag == f"{_NS}si":
+            strings.append("".join(t.text or "" for t in elem.iter(f"{_NS}t")))
+            elem.clear()
+    return strings
+
+
+def _cell_value(cell, shared: list[str]) -> str:
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(t.text or "" for t in cell.iter(f"{_NS}t"))
+    v = cell.find(f"{_NS}v")
+    raw = v.text if v is not None and v.text is not None else ""
+    if kind == "s" and raw:
+        return shared[int(raw)]
+    if kind == "b":
+        return "TRUE" if raw == "1" else "FALSE"
+    if raw.endswith(".0"):
+        raw = raw[:-2]
+    return raw
+
+
+def _iter_xlsx(stream):
+    try:
+        zf = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile:
+        raise TabularError("올바른 XLSX 파일이 아닙니다.")
+
+    with zf:
+        shared = _shared_strings(zf)
+        sheet_data = None
+        row_no = 0
+        for event, elem in iterparse(zf.open(_first_sheet_path(zf)), events=("start", "end")):
+            if event == "start":
+                if elem.tag == f"{_NS}sheetData":
+                    sheet_data = elem
+                continue
+            if elem.tag != f"{_NS}row":
+                continue
+
+            row_no = int(elem.get("r") or row_no + 1)
+            values = []
+            for position, cell in enumerate(elem.iter(f"{_NS}c")):
+                ref = cell.get("r")
+                index = _column_index(ref) if ref else position
+                if index >= len(values):
+                    values.extend([""] * (index - len(values) + 1))
+                values[index] = _cell_value(cell, shared)
+            yield row_no, values
+
+            # 처리한 행은 트리에서 제거해 메모리 사용량을 일정하게 유지
+            if sheet_data is not None:
+                sheet_data.clear()
+
+
+def iter_rows(file_storage):
+    """업로드 파일의 (행 번호, 문자열 리스트) 를 차례로 반환 (확장자로 CSV / XLSX 구분)"""
+    name = (file_storage.filename or "").lower()
+    if name.endswith(".csv"):
+        return _iter_csv(file_storage.stream)
+    if name.endswith(".xlsx"):
+        return _iter_xlsx(file_storage.stream)
+    raise TabularError("CSV 또는 XLSX 파일만 업로드할 수 있습니다.")
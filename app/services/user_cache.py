@@ -0,0 +1,74 @@
+from flask_login import UserMixin
+
+from ..extensions import db
+from ..models.user import User
+from .cache import TTLCache
+from .db_routing import primary_reads
+
+# 로그인 사용자 캐시 (Flask-Login user_loader 용)
+#
+# 모든 화면과 AJAX 요청이 @login_required 라 요청마다 users 테이블을 조회하던 것을
+# 필요한 필드만 담은 스냅샷으로 바꿔 USER_TTL 동안 재사용합니다.
+# 사용자 수정 / 삭제 / 비밀번호 변경 시 invalidate_user() 로 즉시 지우고,
+# 다른 워커 프로세스에서는 USER_TTL 이내에 비활성화가 반영됩니다.
+
+USER_TTL = 30
+
+_user_cache = TTLCache(ttl=USER_TTL, maxsize=1024)
+
+
+class UserSnapshot(UserMixin):
+    """current_user 로 쓰는 읽기 전용 사용자 정보 (DB 를 수정할 때는 User 를 다시 조회)"""
+
+    __slots__ = ("user_id", "user_name", "role", "_active", "must_change_password")
+
+    def __init__(self, user_id: str, user_name: str, role: str, is_active: bool, must_change_password: bool):
+        self.user_id = user_id
+        self.user_name = user_name
+        self.role = role
+        self._active = is_active
+        self.must_change_password = must_change_password
+
+    @property
+    def is_active(self):
+        return self._active
+
+    def get_id(self):
+        return self.user_id
+
+
+def _snapshot(user_id: str) -> UserSnapshot | None:
+    # 비활성화 / 권한 변경이 복제 지연으로 캐시에 늦게 들어가지 않도록 primary 에서 (services/db_routing.py)
+    with primary_reads():
+        row = (
+            db.session.query(User.user_id, User.user_name, User.role, User.is_active, User.must_change_password)
+            .filter(User.user_id == user_id)
+            .first()
+        )
+    if row is None:
+        return None
+    return UserSnapshot(
+        user_id=row.user_id,
+        user_name=row.user_name,
+        role=row.role,
+        is_active=bool(row.is_active),
+        must_change_password=bool(row.must_change_password),
+    )
+
+
+def cached_user(user_id: str) -> UserSnapshot | None:
+    """비활성 / 없는 사용자는 None (로그아웃 상태로 처리)"""
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = _snapshot(user_id)
+        if user is None:
+            return None
+        _user_cache.set(user_id, user)
+    return user if user.is_active else None
+
+
+def invalidate_user(user_id: str | None = None):
+    if user_id is None:
+        _user_cache.clear()
+    else:
+        _user_cache.delete(user_id)
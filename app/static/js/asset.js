@@ -4,17 +4,16 @@ $(document).ready(function () {
     window.initializeSelect2 = function () {
     };
 
-    $('.select2-dash').select2({
+    $('.select2-dash').not('#dash_person_id').select2({
         theme: 'bootstrap-5',
         dropdownParent: $('#dashEditModal'),
         width: '100%',
         placeholder: "선택하세요"
     });
+    initCustomerSelect('#dash_person_id', {dropdownParent: $('#dashEditModal'), placeholder: "고객사를 검색하세요"});
 
     $('#dash_person_id').on('change', function () {
-        const selectedOption = $(this).find(':selected');
-        const company = selectedOption.data('company');
-        $('#dash_display_company').val(company || '');
+        $('#dash_display_company').val(selectedCustomerCompany(this));
     });
 });
 
@@ -86,6 +85,7 @@ function openDashRegister() {
 
     // [수정] select2 초기화 (고객사 선택 초기화)
     $('.select2-dash').val('').trigger('change');
+    setCustomerSelectValue('#dash_person_id', null);
 
     new bootstrap.Modal(document.getElementById('dashEditModal')).show();
 }
@@ -103,7 +103,7 @@ function openDashEdit(tr) {
 
     // [수정] 고객사(Select2) 값 설정
     if (d.personId) {
-        $('#dash_person_id').val(d.personId).trigger('change');
+        setCustomerSelectValue('#dash_person_id', {id: d.personId, text: d.company || d.personId, company: d.company});
     }
 
     // [추가됨] 사이트명 (Site Name) 값 설정
@@ -155,7 +155,7 @@ async function saveDashAsset() {
         return;
     }
 
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'asset');
     try {
         const res = await fetch('/asset/ajax/save', {method: 'POST', body: formData});
         const json = await res.json();
@@ -163,7 +163,7 @@ async function saveDashAsset() {
         if (json.ok) {
             bootstrap.Modal.getInstance(document.getElementById('dashEditModal')).hide();
             await Swal.fire('성공', '저장되었습니다.', 'success');
-            window.location.reload();
+            if (!applyRows('asset', json.html)) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -189,7 +189,7 @@ async function deleteDashAsset(id) {
             const json = await res.json();
             if (json.ok) {
                 await Swal.fire('삭제됨', '삭제되었습니다.', 'success');
-                window.location.reload();
+                if (!removeRow('asset', id)) window.location.reload();
             } else {
                 Swal.fire('오류', '삭제 실패', 'error');
             }
@@ -205,22 +205,12 @@ $(document).ready(function () {
     // [Select2] 등록 모달 내 사이트 검색 기능 활성화
     window.initializeSelect2 = function () {
     };
-    $('.select2-server').select2({
-        dropdownParent: $('#serverCreateModal'),
-        theme: 'bootstrap-5',
-        placeholder: "사이트를 검색하세요",
-        width: '100%',
-        allowClear: true
-    });
+    initCustomerSelect('#modal_person_id', {dropdownParent: $('#serverCreateModal')});
 
     // [핵심 기능] 사이트 선택 시 고객사명 자동 입력
     $('#modal_person_id').on('change', function () {
-        // 선택된 옵션의 data-company 속성 값을 가져옴
-        const selectedOption = $(this).find(':selected');
-        const companyName = selectedOption.data('company');
-
         // 고객사 Input 창에 값 넣기
-        $('#modal_auto_company').val(companyName || '');
+        $('#modal_auto_company').val(selectedCustomerCompany(this));
     });
 });
 
@@ -1,59 +1,8 @@
-$(document).ready(function () {
-    // 페이지 로드 시 계약 목록 불러오기
-    loadContracts();
-});
+// 계약 목록은 탭을 열 때 customer.js 의 loadCustomerTab() 으로 지연 로딩됨
 
-// 1. 계약 목록 불러오기
-async function loadContracts() {
-    // [중요] 함수 실행 시점에 ID를 가져와야 안전함
-    const personIdInput = document.getElementById('pagePersonId');
-    if (!personIdInput) {
-        console.error("HTML에 'pagePersonId' input 태그가 없습니다.");
-        return;
-    }
-    const personId = personIdInput.value;
-
-    try {
-        const res = await fetch(`/contract/ajax/${personId}`);
-        const json = await res.json();
-        const tbody = document.getElementById('contractListBody');
-
-        if (!tbody) return;
-        tbody.innerHTML = '';
-
-        if (!json.data || json.data.length === 0) {
-            tbody.innerHTML = '<tr><td colspan="7" class="text-center py-5 text-muted">등록된 계약 정보가 없습니다.</td></tr>';
-            return;
-        }
-
-        // [테이블 렌더링] 부분의 첫 번째 <td> 수정
-        json.data.forEach(c => {
-            let statusBadge = c.status == '1' ? '<span class="badge bg-success">사용중</span>' :
-                c.status == '2' ? '<span class="badge bg-info text-dark">개통중</span>' :
-                    c.status == '5' ? '<span class="badge bg-secondary">해지</span>' :
-                        '<span class="badge bg-warning text-dark">기타</span>';
-
-            tbody.innerHTML += `
-        <tr>
-            <td class="text-center">${statusBadge}</td>
-            <td class="fw-bold text-dark">${c.service_type || '-'}</td>
-            <td class="text-primary fw-bold">${c.service_number || '-'}</td>
-            <td>${c.open_date}</td>
-            <td>${c.terminate_date}</td>
-            <td>${c.amount || '-'}</td>
-            <td class="text-center">
-                <button class="btn btn-sm btn-outline-danger" onclick="deleteContract(${c.id})" title="삭제">
-                    <i class="bi bi-trash"></i>
-                </button>
-            </td>
-        </tr>
-    `;
-        });
-    } catch (e) {
-        console.error("Load Error:", e);
-        const tbody = document.getElementById('contractListBody');
-        if (tbody) tbody.innerHTML = '<tr><td colspan="7" class="text-center text-danger">데이터 로드 중 오류가 발생했습니다.</td></tr>';
-    }
+// 1. 계약 목록 다시 불러오기 (저장 응답에 행이 없을 때)
+function loadContracts() {
+    loadCustomerTab(document.getElementById('tab-contracts'), true);
 }
 
 // 2. 모달 열기 (폼 초기화)
@@ -68,7 +17,7 @@ function openContractModal() {
 // 3. 계약 저장 (Create)
 async function saveContract() {
     const form = document.getElementById('contractForm');
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'contract');
 
     try {
         const res = await fetch('/contract/ajax/create', {method: 'POST', body: formData});
@@ -80,8 +29,8 @@ async function saveContract() {
             const modalInstance = bootstrap.Modal.getInstance(modalEl);
             if (modalInstance) modalInstance.hide();
 
-            // 목록 새로고침 및 알림
-            loadContracts();
+            // 등록한 행만 추가 및 알림
+            if (!applyRows('contract', json.html)) loadContracts();
             Swal.fire({
                 icon: 'success',
                 title: '저장 완료',
@@ -105,7 +54,7 @@ async function deleteContract(id) {
     try {
         const res = await fetch(`/contract/ajax/${id}/delete`, {method: 'POST'});
         if (res.ok) {
-            loadContracts();
+            if (!removeRow('contract', id)) loadContracts();
             Swal.fire({
                 icon: 'success',
                 title: '삭제됨',
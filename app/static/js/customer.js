@@ -252,7 +252,7 @@ let custPageRow = null;
         const form = document.getElementById('custAssetForm');
         if (!form.checkValidity()) { form.reportValidity(); return; }
 
-        const formData = new FormData(form);
+        const formData = withRowFragment(new FormData(form), 'asset');
         try {
             const res = await fetch('/asset/ajax/save', { method: 'POST', body: formData });
             const json = await res.json();
@@ -260,8 +260,7 @@ let custPageRow = null;
             if (json.ok) {
                 bootstrap.Modal.getInstance(document.getElementById('custAssetModal')).hide();
                 await Swal.fire('성공', '저장되었습니다.', 'success');
-                window.location.hash = 'tab-assets';
-                window.location.reload();
+                if (!applyRows('asset', json.html, {personId: formData.get('person_id')})) window.location.reload();
             } else {
                 Swal.fire('오류', json.message, 'error');
             }
@@ -287,8 +286,7 @@ let custPageRow = null;
                 const json = await res.json();
                 if (json.ok) {
                     await Swal.fire('삭제됨', '삭제되었습니다.', 'success');
-                    window.location.hash = 'tab-assets';
-                    window.location.reload();
+                    if (!removeRow('asset', id)) window.location.reload();
                 } else {
                     Swal.fire('오류', '삭제 실패', 'error');
                 }
@@ -350,16 +348,18 @@ async function addServer() {
     }
 
     const personId = document.getElementById('server_person_id').value;
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'server');
 
     try {
         const res = await fetch(`/customers/${personId}/servers/add`, {method: 'POST', body: formData});
         const json = await res.json();
 
         if (json.ok) {
+            hideModal('serverAddModal');
+            form.reset();
+            form.querySelectorAll('.server-row').forEach((row, i) => { if (i > 0) row.remove(); });
             await Swal.fire('성공', json.message, 'success');
-            window.location.hash = 'tab-servers';
-            window.location.reload();
+            if (!applyRows('server', json.html)) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -424,6 +424,7 @@ async function updateServer() {
     const formData = new FormData();
     formData.append('server_name', document.getElementById('edit_server_name').value);
     formData.append('server_ip', document.getElementById('edit_server_ip').value);
+    withRowFragment(formData, 'server');
 
     try {
         const res = await fetch(`/customers/${personId}/servers/${serverId}/edit`, {
@@ -439,8 +440,8 @@ async function updateServer() {
                 text: '서버 정보가 수정되었습니다.',
                 confirmButtonText: '확인'
             });
-            window.location.hash = 'tab-servers';
-            window.location.reload();
+            hideModal('serverEditModal');
+            if (!applyRows('server', json.html)) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -473,8 +474,7 @@ async function deleteServer(serverId, personId) {
             if (json.ok) {
                 // [성공 시 SweetAlert]
                 await Swal.fire('삭제됨', '서버가 삭제되었습니다.', 'success');
-                window.location.hash = 'tab-servers';
-                window.location.reload();
+                if (!removeRow('server', serverId)) window.location.reload();
             } else {
                 Swal.fire('오류', json.message, 'error');
             }
@@ -512,16 +512,17 @@ async function addContact() {
 
     const personId = document.getElementById('contact_person_id').value;
     const url = `/customers/${personId}/contacts/add`;
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'contact');
 
     try {
         const res = await fetch(url, {method: 'POST', body: formData});
         const json = await res.json();
 
         if (json.ok) {
+            hideModal('contactAddModal');
+            form.reset();
             await Swal.fire('성공', '담당자가 등록되었습니다.', 'success');
-            window.location.hash = 'tab-contacts';
-            window.location.reload();
+            if (!applyRows('contact', json.html)) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -570,7 +571,7 @@ async function updateContact() {
 
     const personId = document.getElementById('contact_person_id').value;
     const contactId = document.getElementById('edit_contact_id').value;
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'contact');
 
     try {
         const res = await fetch(`/customers/${personId}/contacts/${contactId}/edit`, {
@@ -588,9 +589,8 @@ async function updateContact() {
                 confirmButtonColor: '#3085d6' // 버튼 색상 (파랑)
             });
 
-            // 확인 버튼 누르면 탭 유지하면서 새로고침
-            window.location.hash = 'tab-contacts';
-            window.location.reload();
+            hideModal('contactEditModal');
+            if (!applyRows('contact', json.html)) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -622,8 +622,7 @@ async function deleteContact(contactId, personId) {
 
             if (json.ok) {
                 await Swal.fire('삭제됨', '삭제되었습니다.', 'success');
-                window.location.hash = 'tab-contacts';
-                window.location.reload();
+                if (!removeRow('contact', contactId)) window.location.reload();
             } else {
                 Swal.fire('오류', json.message, 'error');
             }
@@ -656,7 +655,7 @@ async function createWork() {
         return;
     }
 
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'work');
 
     // 날짜 값 없으면 오늘 날짜 자동 입력 (안전장치)
     if (!formData.get('work_date')) {
@@ -669,9 +668,9 @@ async function createWork() {
         const json = await res.json();
 
         if (json.ok) {
+            hideModal('workCreateModal');
             await Swal.fire('성공', '작업이 등록되었습니다.', 'success');
-            window.location.hash = 'tab-work'; // 작업 탭 유지
-            window.location.reload();
+            if (!applyRows('work', json.html, {personId: formData.get('person_id')})) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -768,18 +767,16 @@ async function deleteAttachmentInCustomer(attId, workId) {
 async function updateWork() {
     const form = document.getElementById('workEditForm');
     const workId = document.getElementById('edit_work_id').value;
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'work');
 
     try {
         const res = await fetch(`/work/ajax/${workId}/update`, {method: 'POST', body: formData});
         const json = await res.json();
 
         if (json.ok) {
+            hideModal('workEditModal');
             await Swal.fire('수정 완료', '작업 정보가 수정되었습니다.', 'success');
-
-            // [핵심 수정] 작업 탭을 보겠다고 명시한 뒤 새로고침
-            window.location.hash = 'tab-work';
-            window.location.reload();
+            if (!applyRows('work', json.html, {personId: formData.get('person_id')})) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -807,8 +804,7 @@ async function deleteWork(workId) {
 
             if (json.ok) {
                 await Swal.fire('삭제됨', '작업이 삭제되었습니다.', 'success');
-                window.location.hash = 'tab-work';
-                window.location.reload();
+                if (!removeRow('work', workId)) window.location.reload();
             } else {
                 Swal.fire('오류', json.message, 'error');
             }
@@ -860,4 +856,126 @@ function openWorkDetail(workId) {
     }).catch(e => {
         body.innerHTML = '<div class="text-center text-danger py-4">정보를 불러오지 못했습니다.</div>';
     });
-}
\ No newline at end of file
+}
+// ==============================================================
+// [6] 탭 지연 로딩 (계약/보안장비/서버/담당자/작업 이력)
+// - 탭을 처음 열 때 /customers/<id>/tabs/<tab> 에서 행 조각을 받아옴
+// - "더 보기" 버튼은 next_cursor 로 다음 페이지를 이어 붙임
+// ==============================================================
+async function loadCustomerTab(pane, reset = false) {
+    if (!pane || !pane.dataset.tabSrc) return;
+    if (pane.dataset.tabLoading === '1') return;
+
+    const tbody = pane.querySelector('.js-tab-rows');
+    const more = pane.querySelector('.js-tab-more');
+    const cursor = reset ? '' : (pane.dataset.tabCursor || '');
+    const url = pane.dataset.tabSrc + (cursor ? `?cursor=${encodeURIComponent(cursor)}` : '');
+
+    pane.dataset.tabLoading = '1';
+    try {
+        const res = await fetch(url);
+        const json = await res.json();
+        if (!json.ok) throw new Error(json.message);
+
+        if (cursor) {
+            tbody.insertAdjacentHTML('beforeend', json.html);
+        } else {
+            tbody.innerHTML = json.html;
+        }
+        pane.dataset.tabCursor = json.next_cursor || '';
+        pane.dataset.tabLoaded = '1';
+        if (more) more.classList.toggle('d-none', !json.next_cursor);
+    } catch (e) {
+        console.error("Tab Load Error:", e);
+        const cols = pane.querySelectorAll('thead th').length || 1;
+        tbody.innerHTML = `<tr><td colspan="${cols}" class="text-center text-danger py-4">데이터 로드 중 오류가 발생했습니다.</td></tr>`;
+    } finally {
+        pane.dataset.tabLoading = '';
+    }
+}
+
+// 탭 전환 시 (처음 한 번만) 로딩
+document.addEventListener('shown.bs.tab', function (e) {
+    const pane = document.querySelector(e.target.getAttribute('data-bs-target'));
+    if (pane && pane.dataset.tabSrc && pane.dataset.tabLoaded !== '1') {
+        loadCustomerTab(pane, true);
+    }
+});
+
+// URL 해시로 처음부터 활성화된 탭은 shown 이벤트가 없으므로 직접 로딩
+document.addEventListener("DOMContentLoaded", function () {
+    document.querySelectorAll('.tab-pane.active[data-tab-src]').forEach(function (pane) {
+        if (pane.dataset.tabLoaded !== '1') loadCustomerTab(pane, true);
+    });
+});
+
+// ==========================================
+// 일괄 등록 (CSV / XLSX)
+// ==========================================
+const BULK_IMPORT_TITLES = {assets: '보안장비', servers: '서버', contacts: '담당자'};
+
+function openBulkImportModal(kind) {
+    const form = document.getElementById('bulkImportForm');
+    form.reset();
+    document.getElementById('bulk_import_kind').value = kind;
+    document.getElementById('bulkImportTitle').textContent = `${BULK_IMPORT_TITLES[kind]} 일괄 등록`;
+    document.getElementById('bulkImportResult').classList.add('d-none');
+    bootstrap.Modal.getOrCreateInstance(document.getElementById('bulkImportModal')).show();
+}
+
+function renderBulkImportResult(json) {
+    const box = document.getElementById('bulkImportResult');
+    const errors = json.errors || [];
+    const cls = json.ok ? 'alert-success' : 'alert-danger';
+
+    const summary = document.createElement('div');
+    summary.className = `alert ${cls} py-2 mb-2 small`;
+    summary.textContent = json.message;
+
+    box.replaceChildren(summary);
+    if (errors.length) {
+        const list = document.createElement('ul');
+        list.className = 'list-group list-group-flush small border rounded bg-white';
+        list.style.maxHeight = '260px';
+        list.style.overflowY = 'auto';
+        errors.forEach(function (err) {
+            const li = document.createElement('li');
+            li.className = 'list-group-item py-1';
+            li.innerHTML = '<span class="badge bg-danger-subtle text-danger me-2"></span><span></span>';
+            li.children[0].textContent = `${err.row}행`;
+            li.children[1].textContent = err.message;
+            list.appendChild(li);
+        });
+        box.appendChild(list);
+    }
+    box.classList.remove('d-none');
+}
+
+async function submitBulkImport(dryRun) {
+    const form = document.getElementById('bulkImportForm');
+    if (!form.checkValidity()) {
+        form.reportValidity();
+        return;
+    }
+
+    const kind = document.getElementById('bulk_import_kind').value;
+    const url = document.getElementById('bulk_import_url_base').value.replace('__kind__', kind);
+    const formData = new FormData(form);
+    if (dryRun) formData.append('dry_run', '1');
+
+    Swal.fire({title: dryRun ? '검증 중...' : '등록 중...', allowOutsideClick: false, didOpen: () => Swal.showLoading()});
+    try {
+        const res = await fetch(url, {method: 'POST', body: formData});
+        const json = await res.json();
+        Swal.close();
+        renderBulkImportResult(json);
+
+        if (json.ok && !dryRun) {
+            await Swal.fire('성공', json.message, 'success');
+            bootstrap.Modal.getInstance(document.getElementById('bulkImportModal')).hide();
+            loadCustomerTab(document.getElementById(`tab-${kind}`), true);
+        }
+    } catch (e) {
+        Swal.fire('오류', '통신 오류', 'error');
+    }
+}
@@ -1,5 +1,6 @@
-async function postForm(url, formEl) {
+async function postForm(url, formEl, rowsKind) {
     const formData = new FormData(formEl);
+    if (rowsKind) withRowFragment(formData, rowsKind);
     const res = await fetch(url, {method: "POST", body: formData});
     const data = await res.json().catch(() => ({}));
     if (!res.ok || !data.ok) {
@@ -171,8 +172,11 @@ document.addEventListener("DOMContentLoaded", () => {
             }
 
             try {
-                await postForm("/work/ajax/create", createForm);
-                window.location.reload();
+                const data = await postForm("/work/ajax/create", createForm, "work");
+                bootstrap.Modal.getOrCreateInstance(createModalEl).hide();
+                if (!applyRows("work", data.html, {personId: createForm.querySelector("[name=person_id]")?.value})) {
+                    window.location.reload();
+                }
             } catch (err) {
                 setText(createError, err.message);
             }
@@ -205,8 +209,11 @@ document.addEventListener("DOMContentLoaded", () => {
             setText(editError, "");
             const workId = editForm.getAttribute("data-work-id");
             try {
-                await postForm(`/work/ajax/${workId}/update`, editForm);
-                window.location.reload();
+                const data = await postForm(`/work/ajax/${workId}/update`, editForm, "work");
+                bootstrap.Modal.getOrCreateInstance(editModalEl).hide();
+                if (!applyRows("work", data.html, {personId: editForm.querySelector("[name=person_id]")?.value})) {
+                    window.location.reload();
+                }
             } catch (err) {
                 setText(editError, err.message);
             }
@@ -236,7 +243,8 @@ document.addEventListener("DOMContentLoaded", () => {
             const workId = delForm.getAttribute("data-work-id");
             try {
                 await postForm(`/work/ajax/${workId}/delete`, delForm);
-                window.location.reload();
+                bootstrap.Modal.getOrCreateInstance(delModalEl).hide();
+                if (!removeRow("work", workId)) window.location.reload();
             } catch (err) {
                 setText(delError, err.message);
             }
@@ -500,3 +508,221 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 });
+
+// 고객사/사이트 선택 상자 (Select2 원격 검색)
+// 전체 고객 목록을 <option> 으로 렌더링하지 않고 /customers/ajax/search 에서 페이지 단위로 가져옵니다.
+// options.idField: 'id'(Person_ID, 기본값) 또는 'location'(사이트명을 값으로 저장하는 SR 등)
+function initCustomerSelect(selector, options = {}) {
+    const $el = $(selector).filter('select');
+    if (!$el.length || !$.fn.select2) return $el;
+
+    const idField = options.idField || 'id';
+    $el.data('customerIdField', idField);
+    return $el.select2({
+        theme: 'bootstrap-5',
+        dropdownParent: options.dropdownParent,
+        placeholder: options.placeholder || '사이트를 검색하세요',
+        allowClear: true,
+        width: '100%',
+        ajax: {
+            url: '/customers/ajax/search',
+            dataType: 'json',
+            delay: 250,
+            data: (params) => ({q: params.term || '', page: params.page || 1}),
+            processResults: (data) => ({
+                results: (data.results || []).map((c) => ({...c, id: c[idField]})),
+                pagination: data.pagination || {more: false}
+            })
+        }
+    });
+}
+
+// 수정 모달 등에서 현재 값을 미리 선택 (customer: {id, text, company, location})
+function setCustomerSelectValue(selector, customer) {
+    const el = typeof selector === 'string' ? document.querySelector(selector) : selector;
+    if (!el) return;
+    const idField = $(el).data('customerIdField') || 'id';
+    const value = customer ? (customer[idField] || '') : '';
+
+    if (el.tagName !== 'SELECT') {
+        el.value = value;
+        return;
+    }
+
+    $(el).find('option').filter(function () { return this.value !== ''; }).remove();
+    if (value) {
+        const opt = new Option(customer.text || value, value, true, true);
+        opt.dataset.company = customer.company || '';
+        el.appendChild(opt);
+    }
+    $(el).val(value || null).trigger('change');
+}
+
+// 선택된 고객의 고객사명 (원격 검색 결과 또는 미리 선택한 option 의 data-company)
+function selectedCustomerCompany(selector) {
+    const $el = $(selector);
+    const data = $el.data('select2') ? $el.select2('data')[0] : null;
+    if (data && data.company !== undefined) return data.company;
+    return $el.find(':selected').data('company') || '';
+}
+
+// 대용량 첨부 분할 업로드 (/uploads/chunked, 연결이 끊기면 서버가 받은 offset 부터 이어서 전송)
+const RESUMABLE_THRESHOLD = 20 * 1024 * 1024;
+
+async function uploadResumable(file, targetType, targetId, onProgress) {
+    const init = await fetch('/uploads/chunked', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({filename: file.name, size: file.size, target_type: targetType, target_id: targetId})
+    }).then(r => r.json());
+    if (!init.ok) throw new Error(init.message || '업로드를 시작하지 못했습니다.');
+
+    const url = `/uploads/chunked/${init.upload_id}`;
+    const chunkSize = init.chunk_size;
+    let offset = init.offset;
+    let retries = 0;
+
+    while (offset < file.size) {
+        try {
+            const res = await fetch(`${url}?offset=${offset}`, {
+                method: 'PUT',
+                headers: {'Content-Type': 'application/octet-stream'},
+                body: file.slice(offset, offset + chunkSize)
+            });
+            const json = await res.json();
+            if (res.status === 409 && json.offset !== undefined) {
+                offset = json.offset;  // 서버가 실제로 받은 위치부터 다시
+                continue;
+            }
+            if (!json.ok) throw new Error(json.message);
+            offset = json.offset;
+            retries = 0;
+            if (onProgress) onProgress(json.percent, file);
+        } catch (e) {
+            if (++retries > 5) throw e;
+            await new Promise(resolve => setTimeout(resolve, 1000 * retries));
+            const status = await fetch(url).then(r => r.json()).catch(() => null);
+            if (status && status.ok) offset = status.offset;
+        }
+    }
+
+    const done = await fetch(`${url}/complete`, {method: 'POST'}).then(r => r.json());
+    if (!done.ok) throw new Error(done.message || '업로드를 완료하지 못했습니다.');
+    return done;
+}
+
+// FormData 의 files[] 중 큰 파일을 빼서 반환 (폼 전송 후 uploadResumable 로 따로 올림)
+function takeLargeFiles(formData, field = 'files[]') {
+    const files = formData.getAll(field).filter(f => f instanceof File && f.name);
+    const large = files.filter(f => f.size >= RESUMABLE_THRESHOLD);
+    if (large.length) {
+        formData.delete(field);
+        files.filter(f => f.size < RESUMABLE_THRESHOLD).forEach(f => formData.append(field, f));
+    }
+    return large;
+}
+
+async function uploadLargeFiles(files, targetType, targetId) {
+    for (const file of files) {
+        Swal.fire({
+            title: '파일 업로드 중',
+            html: `${file.name}<br><span id="resumableProgress">0%</span>`,
+            allowOutsideClick: false,
+            didOpen: () => Swal.showLoading()
+        });
+        await uploadResumable(file, targetType, targetId, (percent) => {
+            const el = document.getElementById('resumableProgress');
+            if (el) el.textContent = `${percent}%`;
+        });
+    }
+}
+
+// 저장 / 삭제 후 목록 행만 교체 (페이지 새로고침 대신, 서버 쪽은 services/fragments.py)
+// 목록 tbody 에 data-rows="<종류>" data-fragment="<행 모양>", 각 행에 data-row-id 가 있으면
+// 저장 요청에 fragment 를 붙이고 응답 html 의 행으로 그 행만 바꿉니다.
+function rowsBody(kind) {
+    return document.querySelector(`tbody[data-rows="${kind}"]`);
+}
+
+// 저장 요청(FormData)에 현재 화면의 행 모양을 붙임 (목록이 없는 화면이면 그대로)
+function withRowFragment(formData, kind) {
+    const tbody = rowsBody(kind);
+    if (tbody && tbody.dataset.fragment) formData.set('fragment', tbody.dataset.fragment);
+    return formData;
+}
+
+// 같은 data-row-id 행은 교체, 없는 행은 맨 위에 추가
+// options.personId: 저장한 행의 고객 - 고객 상세 탭(tbody data-person-id)과 다르면 탭에서 뺌
+// 목록이 없거나 응답에 html 이 없으면 false (호출한 쪽에서 새로고침)
+function applyRows(kind, html, options = {}) {
+    const tbody = rowsBody(kind);
+    if (!tbody || typeof html !== 'string') return false;
+
+    // 아직 열지 않은 고객 상세 탭은 열 때 새로 읽음
+    const pane = tbody.closest('[data-tab-src]');
+    if (pane && pane.dataset.tabLoaded !== '1') return true;
+
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+    const rows = [...template.content.querySelectorAll('tr[data-row-id]')];
+
+    const owner = tbody.dataset.personId;
+    if (owner && options.personId && String(options.personId) !== owner) {
+        rows.forEach(row => removeRow(kind, row.dataset.rowId));
+        return true;
+    }
+
+    let added = 0;
+    rows.reverse().forEach(row => {
+        const old = tbody.querySelector(`tr[data-row-id="${row.dataset.rowId}"]`);
+        if (old) {
+            if (old.classList.contains('table-active')) row.classList.add('table-active');
+            old.replaceWith(row);
+        } else {
+            tbody.prepend(row);
+            added++;
+        }
+    });
+    if (added) {
+        tbody.querySelectorAll('.js-empty-row').forEach(row => row.remove());
+        adjustRowTotal(kind, added);
+    }
+    return true;
+}
+
+// 삭제한 행 제거 (마지막 행이면 빈 목록 안내), 목록이 없으면 false
+function removeRow(kind, id) {
+    const tbody = rowsBody(kind);
+    if (!tbody) return false;
+    const row = tbody.querySelector(`tr[data-row-id="${id}"]`);
+    if (!row) return true;
+
+    row.remove();
+    adjustRowTotal(kind, -1);
+    if (!tbody.querySelector('tr')) {
+        const cols = tbody.closest('table').querySelectorAll('thead th').length || 1;
+        tbody.innerHTML = `<tr class="js-empty-row"><td colspan="${cols}" class="text-center py-5 text-muted">데이터가 없습니다.</td></tr>`;
+    }
+    return true;
+}
+
+// 목록 제목의 전체 건수 (<span data-row-total="<종류>">)
+function adjustRowTotal(kind, delta) {
+    const el = document.querySelector(`[data-row-total="${kind}"]`);
+    if (!el) return;
+    const total = parseInt(el.textContent, 10);
+    if (!isNaN(total)) el.textContent = Math.max(total + delta, 0);
+}
+
+// 한 행만 다시 읽어 교체 (예: 분할 업로드로 첨부 여부가 바뀐 작업)
+async function reloadRow(kind, url, options = {}) {
+    const tbody = rowsBody(kind);
+    if (!tbody || !tbody.dataset.fragment) return false;
+    const json = await fetch(`${url}?fragment=${encodeURIComponent(tbody.dataset.fragment)}`).then(r => r.json());
+    return json.ok && applyRows(kind, json.html, options);
+}
+
+function hideModal(id) {
+    const el = document.getElementById(id);
+    if (el) bootstrap.Modal.getOrCreateInstance(el).hide();
+}
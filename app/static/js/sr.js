@@ -1,11 +1,14 @@
     const srModal = new bootstrap.Modal(document.getElementById('srModal'));
     const srDetailModal = new bootstrap.Modal(document.getElementById('srDetailModal'));
 
+    // 사이트 선택(Select2 원격 검색, 값은 사이트명)
+    $(document).ready(function () {
+        initCustomerSelect('#edit_location', {dropdownParent: $('#srModal'), idField: 'location'});
+    });
+
     // 사이트 선택 시 고객사 자동 입력
     function changeSite(selectElem) {
-        const option = selectElem.options[selectElem.selectedIndex];
-        const company = option.getAttribute('data-company');
-        document.getElementById('edit_company').value = company || '';
+        document.getElementById('edit_company').value = selectedCustomerCompany(selectElem);
     }
 
     // [1] SR 상세 조회 모달 열기
@@ -86,6 +89,7 @@
     // [2] 등록/수정 모달 열기
     async function openSrModal(srId = null) {
         document.getElementById('srForm').reset();
+        setCustomerSelectValue('#edit_location', null);
 
         if (srId) {
             document.getElementById('srModalTitle').innerText = 'SR 수정';
@@ -96,7 +100,7 @@
                 const json = await res.json();
                 if(json.ok) {
                     const d = json.data;
-                    document.getElementById('edit_location').value = d.location;
+                    setCustomerSelectValue('#edit_location', {location: d.location, text: d.location, company: d.company});
                     document.getElementById('edit_company').value = d.company;
                     document.getElementById('edit_category').value = d.category || '요청';
                     document.getElementById('edit_severity').value = d.severity || 'Low';
@@ -128,7 +132,7 @@
         const form = document.getElementById('srForm');
         if(!form.checkValidity()) { form.reportValidity(); return; }
 
-        const formData = new FormData(form);
+        const formData = withRowFragment(new FormData(form), 'sr');
         const srId = document.getElementById('edit_sr_id').value;
         const url = srId ? `/sr/ajax/${srId}/update` : `/sr/ajax/create`;
 
@@ -137,8 +141,9 @@
             const json = await res.json();
 
             if(json.ok) {
+                srModal.hide();
                 await Swal.fire('저장 완료', '정상적으로 처리되었습니다.', 'success');
-                window.location.reload();
+                if (!applyRows('sr', json.html)) window.location.reload();
             } else {
                 Swal.fire('오류', json.message || '저장 중 문제가 발생했습니다.', 'error');
             }
@@ -165,7 +170,7 @@
                 const json = await res.json();
                 if(json.ok) {
                     await Swal.fire('삭제됨', '삭제되었습니다.', 'success');
-                    window.location.reload();
+                    if (!removeRow('sr', srId)) window.location.reload();
                 } else {
                     Swal.fire('오류', json.message, 'error');
                 }
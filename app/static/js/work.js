@@ -9,23 +9,14 @@ let currentDetailId = null;
 // [0] 초기화 및 이벤트 리스너 (Select2 설정)
 // ==============================================================
 $(document).ready(function() {
-    // 1. 등록 모달 내 Select2 활성화 (bootstrap-5 테마)
-    $('.select2-site').select2({
-        theme: 'bootstrap-5',
-        dropdownParent: $('#workCreateModal'), // 모달 내 포커스 문제 해결
-        placeholder: "사이트를 검색하세요",
-        allowClear: true,
-        width: '100%'
-    });
+    // 1. 등록/수정 모달 내 Select2 활성화 (원격 검색, soms.js initCustomerSelect)
+    initCustomerSelect('#create_person_id', {dropdownParent: $('#workCreateModal')}); // 모달 내 포커스 문제 해결
+    initCustomerSelect('#edit_person_id', {dropdownParent: $('#workEditModal')});
 
     // 2. [등록] 사이트 선택 시 고객사명 자동 입력 이벤트
     $('#create_person_id').on('select2:select change', function(e) {
-        // 선택된 옵션의 data-company 속성 값을 가져옴
-        var selectedOption = $(this).find(':selected');
-        var companyName = selectedOption.data('company');
-
         // 고객사 Readonly Input에 값 설정
-        $('#create_company_view').val(companyName || '');
+        $('#create_company_view').val(selectedCustomerCompany(this));
     });
 
     // 3. 모달이 닫힐 때 초기화 (선택사항)
@@ -123,15 +114,22 @@ async function createWork() {
     const form = document.getElementById('workCreateForm');
     if(!form.checkValidity()) { form.reportValidity(); return; }
 
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'work');
+    const largeFiles = takeLargeFiles(formData);  // 큰 파일은 등록 후 분할 업로드
 
     try {
         const res = await fetch('/work/ajax/create', { method: 'POST', body: formData });
         const json = await res.json();
 
         if(json.ok) {
+            await uploadLargeFiles(largeFiles, 'work', json.work_id);
+            hideModal('workCreateModal');
+            // 등록한 행만 목록에 추가 (분할 업로드가 있었으면 첨부 표시가 바뀌었으므로 다시 읽음)
+            const applied = largeFiles.length
+                ? await reloadRow('work', `/work/ajax/${json.work_id}/row`, {personId: formData.get('person_id')})
+                : applyRows('work', json.html, {personId: formData.get('person_id')});
             await Swal.fire('성공', '작업이 등록되었습니다.', 'success');
-            window.location.reload(); // 페이지 새로고침 (목록 갱신)
+            if (!applied) window.location.reload();
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -165,7 +163,7 @@ function openWorkEditModal(workId) {
         if(!detailRes.ok) throw new Error(detailRes.message);
 
         const d = detailRes.data;
-        document.getElementById('edit_person_id').value = d.person_id;
+        setCustomerSelectValue('#edit_person_id', d.customer || {id: d.person_id});
         document.getElementById('edit_work_date').value = d.work_date;
         document.getElementById('edit_work_type').value = d.work_type;
         document.getElementById('edit_summary').value = d.summary || '';
@@ -198,15 +196,29 @@ function openWorkEditModal(workId) {
 async function updateWork() {
     const form = document.getElementById('workEditForm');
     const workId = document.getElementById('edit_work_id').value;
-    const formData = new FormData(form);
+    const formData = withRowFragment(new FormData(form), 'work');
+    const largeFiles = takeLargeFiles(formData);
 
     try {
         const res = await fetch(`/work/ajax/${workId}/update`, { method: 'POST', body: formData });
         const json = await res.json();
 
         if(json.ok) {
+            await uploadLargeFiles(largeFiles, 'work', workId);
+            hideModal('workEditModal');
+            const applied = largeFiles.length
+                ? await reloadRow('work', `/work/ajax/${workId}/row`, {personId: formData.get('person_id')})
+                : applyRows('work', json.html, {personId: formData.get('person_id')});
             await Swal.fire('수정 완료', '작업 정보가 수정되었습니다.', 'success');
-            window.location.reload();
+            if (!applied) {
+                window.location.reload();
+                return;
+            }
+
+            // 작업 목록 우측 상세 패널에 열려 있던 작업이면 다시 읽음
+            if (String(currentDetailId) === String(workId) && document.getElementById('detailPanelBody')) {
+                loadWorkDetail(workId, document.querySelector(`tr[data-row-id="${workId}"]`));
+            }
         } else {
             Swal.fire('오류', json.message, 'error');
         }
@@ -281,7 +293,17 @@ async function deleteWork(workId) {
 
             if(json.ok) {
                 await Swal.fire('삭제됨', '작업이 삭제되었습니다.', 'success');
-                window.location.reload();
+                if (!removeRow('work', workId)) {
+                    window.location.reload();
+                    return;
+                }
+                // 우측 상세 패널에 열려 있던 작업이면 패널 비움
+                if (String(currentDetailId) === String(workId) && document.getElementById('detailPanelBody')) {
+                    currentDetailId = null;
+                    document.getElementById('detailActions').classList.add('d-none');
+                    document.getElementById('detailPanelBody').innerHTML =
+                        '<div class="text-center py-5 text-muted"><i class="bi bi-mouse fs-1 d-block mb-3 opacity-50"></i>좌측 목록에서 작업을 선택하세요.</div>';
+                }
             } else {
                 Swal.fire('오류', json.message, 'error');
             }
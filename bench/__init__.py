@@ -0,0 +1,31 @@
+import os
+import sys
+
+# 라우트 벤치마크 (PostgreSQL 전용, 운영 DB 에 실행하지 말 것 - 적재 시 기존 행을 모두 지움)
+#
+#   python -m bench.seed    --database-url postgresql+psycopg2://.../soms_bench --scale small
+#   python -m bench.run     --database-url postgresql+psycopg2://.../soms_bench --output bench_report.json
+#   python -m bench.compare bench_report.old.json bench_report.json
+#
+# seed  : 테이블 / 인덱스(마이그레이션) 생성 → 합성 데이터 COPY 적재 → VACUUM ANALYZE
+# run   : Flask 테스트 클라이언트로 라우트별 응답 시간 / SQL 문장 수 측정 → JSON 보고서
+# compare: 두 보고서의 중앙값 비교 (느려진 라우트가 있으면 종료 코드 1)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BENCH_USER = "bench"
+BENCH_PASSWORD = "bench-password"
+
+
+def create_bench_app(database_url: str):
+    """벤치마크 DB 를 보는 앱 (환경변수는 create_app 이 읽으므로 먼저 설정)"""
+    if not database_url.startswith("postgresql"):
+        sys.exit("벤치마크는 PostgreSQL 에서만 실행합니다. (COPY 적재)")
+
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "bench")
+    os.environ.pop("BOOTSTRAP_ADMIN_ID", None)
+    sys.path.insert(0, REPO_ROOT)
+
+    from app import create_app
+    return create_app()
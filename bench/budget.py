@@ -0,0 +1,98 @@
+import argparse
+import os
+import re
+import sys
+from datetime import date
+from urllib.parse import urlsplit
+
+from . import BENCH_PASSWORD, BENCH_USER, create_bench_app
+from .run import build_cases
+
+# 엔드포인트별 SQL 문장 수 상한 점검 (app/services/query_budget.py)
+#
+#   python -m bench.budget --database-url URL      (bench.seed 로 적재한 DB, tiny 규모면 충분)
+#
+# 모든 블루프린트의 화면 / AJAX 요청을 캐시를 비운 상태로 한 번씩 보내고
+# 실행된 문장 수가 상한을 넘으면 목록을 출력하고 종료 코드 1 로 끝납니다.
+# SR 등록 / 수정 / 삭제처럼 쓰기 요청도 포함하므로 운영 DB 에 실행하지 말 것.
+# 저장 요청 전체(fragment 포함)의 상한은 tests/test_query_budget.py 가 SQLite 픽스처로 확인합니다. (CI 에서 실행)
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def _clear_caches():
+    from app.services.customer_lookup import invalidate_customer_search
+    from app.services.customer_stats import invalidate_customer_summary
+    from app.services.dashboard_data import invalidate_dashboard
+    from app.services.ip_owner import invalidate_ip_owners
+    from app.services.user_cache import invalidate_user
+
+    invalidate_customer_search()
+    invalidate_customer_summary()
+    invalidate_dashboard()
+    invalidate_ip_owners()
+    invalidate_user()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="엔드포인트별 SQL 문장 수 상한 점검")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"),
+                        required=not os.getenv("BENCH_DATABASE_URL"))
+    args = parser.parse_args(argv)
+
+    app = create_bench_app(args.database_url)
+    app.config["SQL_STATS"] = True
+    app.config["SQL_QUERY_BUDGET"] = ""  # 첫 초과에서 멈추지 않고 전부 모아서 보고
+
+    from app.services.query_budget import budget_for
+
+    cases, _ = build_cases(app)
+    cases = [(name, "GET", url, None) for name, url in cases if "export" not in name]
+    cases += [
+        ("auth.change_password", "GET", "/auth/change-password", None),
+        ("uploads.chunked_status", "GET", "/uploads/chunked/unknown", None),
+    ]
+
+    client = app.test_client()
+    if client.post("/auth/login", data={"user_id": BENCH_USER, "password": BENCH_PASSWORD}).status_code != 302:
+        raise SystemExit("벤치마크 계정으로 로그인하지 못했습니다. bench.seed 를 먼저 실행하세요.")
+
+    adapter = app.url_map.bind("localhost")
+    failures = []
+
+    def check(name, method, url, data=None):
+        _clear_caches()
+        response = client.open(url, method=method, data=data)
+        m = _QUERIES.search(response.headers.get("Server-Timing", ""))
+        count = int(m.group(1)) if m else 0
+        endpoint, _ = adapter.match(urlsplit(url).path, method=method)
+        budget = budget_for(endpoint)
+        status = "OK  " if count <= budget else "OVER"
+        print(f"[{status}] {name:<34} {method:<4} {count:>3} / {budget:<3} {endpoint}")
+        if count > budget:
+            failures.append((name, count, budget))
+        return response
+
+    for name, method, url, data in cases:
+        check(name, method, url, data)
+
+    check("asset.ajax_ip_owners", "POST", "/asset/ajax/ip-owners", {"ips": "10.0.0.1 192.168.0.10 8.8.8.8"})
+
+    # 쓰기 요청 (등록 → 수정 → 삭제)
+    form = {"location": "벤치 사이트", "company": "벤치 고객", "request_date": date.today().isoformat(),
+            "content": "query budget", "handler": "bench"}
+    created = check("sr.ajax_create_sr", "POST", "/sr/ajax/create", form).get_json() or {}
+    if created.get("id"):
+        check("sr.ajax_update_sr", "POST", f"/sr/ajax/{created['id']}/update", {**form, "result": "완료"})
+        check("sr.ajax_delete_sr", "POST", f"/sr/ajax/{created['id']}/delete")
+
+    if failures:
+        print(f"\n상한 초과 {len(failures)}개:", file=sys.stderr)
+        for name, count, budget in failures:
+            print(f"  {name}: {count}회 (상한 {budget}회)", file=sys.stderr)
+        sys.exit(1)
+    print("\n모든 요청이 상한 이내입니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import json
+import sys
+
+# 두 벤치마크 보고서 비교 (중앙값 기준)
+#
+#   python -m bench.compare bench_report.old.json bench_report.json --threshold 1.25
+#
+# 중앙값이 threshold 배 넘게 느려졌거나 SQL 문장 수가 늘어난 항목이 있으면 종료 코드 1
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        report = json.load(f)
+    return report, {r["name"]: r for r in report["results"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크 보고서 비교")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=1.25, help="느려짐으로 볼 중앙값 배율")
+    parser.add_argument("--min-ms", type=float, default=2.0, help="이보다 빠른 항목은 배율을 보지 않음 (측정 잡음)")
+    args = parser.parse_args(argv)
+
+    base_report, base = _load(args.base)
+    head_report, head = _load(args.head)
+    if base_report.get("rows") != head_report.get("rows"):
+        print("주의: 두 보고서의 데이터 규모가 다릅니다.", file=sys.stderr)
+
+    regressions = 0
+    print(f"{'항목':<34} {'기준 ms':>10} {'비교 ms':>10} {'배율':>6}  {'쿼리':>9}")
+    for name, new in head.items():
+        old = base.get(name)
+        if old is None:
+            print(f"{name:<34} {'-':>10} {new['median_ms']:>10.2f} {'new':>6}")
+            continue
+
+        ratio = new["median_ms"] / old["median_ms"] if old["median_ms"] else 1.0
+        slower = ratio > args.threshold and new["median_ms"] >= args.min_ms
+        more_queries = (old["queries"] is not None and new["queries"] is not None
+                        and new["queries"] > old["queries"])
+        flag = " <-" if slower or more_queries else ""
+        regressions += bool(flag)
+        print(f"{name:<34} {old['median_ms']:>10.2f} {new['median_ms']:>10.2f} {ratio:>6.2f}  "
+              f"{old['queries']!s:>4}→{new['queries']!s:<4}{flag}")
+
+    for name in base.keys() - head.keys():
+        print(f"{name:<34} (비교 보고서에 없음)")
+
+    if regressions:
+        print(f"느려진 항목 {regressions}개", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import csv
+import io
+import random
+from datetime import date, datetime, timedelta
+
+# 벤치마크용 합성 데이터 (같은 seed / 규모면 항상 같은 데이터)
+#
+# 행은 파이썬에서 만들어 CSV 조각 단위로 PostgreSQL COPY 에 넘깁니다. (ORM / INSERT 를 거치지 않음)
+# ORM 저장 이벤트가 없으므로 IP 검색용 inet 그림자 컬럼(services/ip_search.py)도 여기서 같이 채웁니다.
+# 키 값을 직접 지정하므로 상세 화면 ID 도 실행마다 같고, 적재 후 시퀀스를 최댓값으로 맞춥니다.
+# 날짜는 오늘이 아니라 BASE_DATE 기준이라 언제 만들어도 같은 데이터입니다.
+
+SCALES = {
+    "tiny": dict(people=200, work=5_000, sr=2_000, assets=1_000, servers=500, contacts=400, contracts=300),
+    "small": dict(people=5_000, work=200_000, sr=50_000, assets=20_000, servers=10_000,
+                  contacts=10_000, contracts=8_000),
+    "full": dict(people=50_000, work=2_000_000, sr=500_000, assets=200_000, servers=100_000,
+                 contacts=100_000, contracts=80_000),
+}
+
+BASE_DATE = date(2026, 1, 1)
+HISTORY_DAYS = 5 * 365
+COPY_CHUNK = 50_000
+
+COMPANY_HEAD = ["한빛", "새롬", "누리", "다온", "하늘", "미래", "푸른", "소망", "온누리", "가람"]
+COMPANY_TAIL = ["전자", "물산", "정보통신", "네트웍스", "시스템", "건설", "제약", "금융", "유통", "에너지"]
+REGIONS = ["서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "수원", "창원"]
+SITES = ["본사", "지사", "센터", "연구소", "공장"]
+IDCS = ["목동1", "목동2", "강남", "여의도", "용산"]
+WORK_TYPES = ["보안장비 변경", "오더 정보", "고객명 변경", "보안장비 이중화", "레포트", "기타"]
+WORK_VERBS = ["방화벽 정책 변경", "VPN 계정 추가", "펌웨어 업데이트", "장애 점검", "회선 증설", "백업 확인"]
+ASSET_TYPES = [("보안장비", "방화벽", "Fortinet"), ("보안장비", "IPS", "Ahnlab"),
+               ("네트워크", "스위치", "Cisco"), ("보안장비", "WAF", "Piolink")]
+SR_CATEGORIES = ["장애", "요청", "문의", "변경"]
+SEVERITIES = ["P1", "P2", "P3"]
+SUBMITTERS = [f"엔지니어{i}" for i in range(1, 21)]
+
+
+def _day(rng: random.Random) -> date:
+    return BASE_DATE - timedelta(days=rng.randrange(HISTORY_DAYS))
+
+
+def _stamp(d: date, rng: random.Random) -> datetime:
+    return datetime(d.year, d.month, d.day, rng.randrange(24), rng.randrange(60))
+
+
+def _ip(n: int) -> str:
+    return f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"
+
+
+class Dataset:
+    """테이블별 (컬럼 목록, 행 생성기)"""
+
+    def __init__(self, counts: dict, seed: int = 42):
+        self.counts = counts
+        self.seed = seed
+        # 고객 정보는 다른 테이블이 참조하므로 미리 만들어 둠 (행이 많은 고객 / 적은 고객이 섞이도록 가중치)
+        rng = self._rng("people")
+        self.people = []
+        for i in range(1, counts["people"] + 1):
+            company = f"{rng.choice(COMPANY_HEAD)}{rng.choice(COMPANY_TAIL)} {i}"
+            site = f"{rng.choice(REGIONS)} {rng.choice(SITES)}"
+            self.people.append((f"P{i:06d}", company, site))
+        self.weights = [1.0 / (1 + i % 97) for i in range(len(self.people))]
+
+    def _rng(self, table: str) -> random.Random:
+        # 테이블마다 독립된 난수열 → 한 테이블 규모를 바꿔도 다른 테이블 데이터는 그대로
+        return random.Random(f"{self.seed}:{table}")
+
+    def _owners(self, rng: random.Random, n: int):
+        return rng.choices(self.people, weights=self.weights, k=n)
+
+    # -----------------------------------------------------------------------
+    def ctm_people(self):
+        rng = self._rng("people.detail")
+        for i, (person_id, company, site) in enumerate(self.people, start=1):
+            opened = _day(rng)
+            yield (i, person_id, company, site, rng.choice(IDCS), str(rng.randrange(3)),
+                   rng.choice(["Y", "N"]), opened, f"영업{rng.randrange(1, 31)}", f"R{rng.randrange(1, 400):03d}")
+
+    def work_info(self):
+        rng = self._rng("work")
+        for i, (person_id, _, _) in enumerate(self._owners(rng, self.counts["work"]), start=1):
+            # 1% 는 작업일 없음 (정렬상 맨 뒤)
+            work_date = None if rng.random() < 0.01 else _day(rng)
+            created = _stamp(work_date or BASE_DATE, rng)
+            yield (i, person_id, rng.choice(WORK_TYPES), work_date,
+                   f"{rng.choice(WORK_VERBS)} #{i}", f"작업 상세 내용 {i}", rng.choice(SUBMITTERS), created, "N")
+
+    def sr_tickets(self):
+        rng = self._rng("sr")
+        for i, (_, company, site) in enumerate(self._owners(rng, self.counts["sr"]), start=1):
+            requested = _day(rng)
+            handled = requested + timedelta(days=rng.randrange(5)) if rng.random() < 0.9 else None
+            yield (i, site, company, rng.choice(SR_CATEGORIES), rng.choice(SEVERITIES), f"요청자{rng.randrange(500)}",
+                   requested, f"{rng.choice(WORK_VERBS)} 요청 {i}", rng.choice(SUBMITTERS), handled,
+                   "완료" if handled else None, None, "bench", _stamp(requested, rng))
+
+    def assets(self):
+        rng = self._rng("assets")
+        for i, (person_id, company, site) in enumerate(self._owners(rng, self.counts["assets"]), start=1):
+            category, a_type, item = rng.choice(ASSET_TYPES)
+            ip = _ip(i)
+            yield (i, person_id, company, site, f"{a_type}-{i:07d}", category, a_type, item,
+                   f"M{rng.randrange(100, 999)}", f"SN{rng.randrange(10**9):09d}", ip, ip, f"{{{ip}}}", rng.choice(IDCS),
+                   rng.choice([0, 1, 3, 3, 3, 11]), _day(rng))
+
+    def servers(self):
+        rng = self._rng("servers")
+        for i, (person_id, _, _) in enumerate(self._owners(rng, self.counts["servers"]), start=1):
+            ip = f"192.168.{(i >> 8) & 255}.{i & 255}"
+            yield (i, person_id, f"srv-{i:06d}", ip, ip, f"{{{ip}}}", rng.choice(SUBMITTERS), _stamp(_day(rng), rng))
+
+    def contacts(self):
+        rng = self._rng("contacts")
+        for i, (person_id, _, _) in enumerate(self._owners(rng, self.counts["contacts"]), start=1):
+            yield (i, person_id, rng.choice(["정", "부"]), f"담당자{i}", f"010-{rng.randrange(10**4):04d}-{i % 10**4:04d}",
+                   f"user{i}@example.com", "활성화", _stamp(_day(rng), rng))
+
+    def contracts(self):
+        rng = self._rng("contracts")
+        for i, (person_id, _, _) in enumerate(self._owners(rng, self.counts["contracts"]), start=1):
+            opened = _day(rng)
+            terminate = opened + timedelta(days=rng.randrange(365, 3 * 365))
+            yield (i, person_id, rng.choice(["BK", "CO_BA", "FW", "VPN"]), f"SVC{i:07d}", "사용중",
+                   str(rng.randrange(10, 500) * 10000), opened, terminate, _stamp(opened, rng),
+                   "Y" if rng.random() < 0.05 else "N")
+
+    def tables(self):
+        """[(테이블, 시퀀스 키 컬럼, 컬럼 목록, 행 생성기)] - 참조 순서대로"""
+        return [
+            ("CTM_People", "CTM_ID",
+             ["CTM_ID", "Person_ID", "Company", "Last_Name", "IDC", "Client_Sensitivity", "Report_YN",
+              "Open_Date", "Sales_Manager", "Rack_Location"], self.ctm_people()),
+            ("Work_Info", "Work_ID",
+             ["Work_ID", "Person_ID", "Work_Type", "Work_Date", "Summary", "Description", "Submitter",
+              "Create_Date", "Attachment_YN"], self.work_info()),
+            ("SR_Tickets", "SR_ID",
+             ["SR_ID", "Location", "Company", "Category", "Severity", "Requester", "Request_Date", "Content",
+              "Handler", "Handled_Date", "Result", "Remark", "Created_By", "Created_At"], self.sr_tickets()),
+            ("AST_Computer_System", "Asset_ID",
+             ["Asset_ID", "Person_ID", "Company", "Owner_name", "Name", "Category", "Type", "Item",
+              "Model_Number", "Serial_Number", "IP_Address", "IP_Inet", "IP_Inets", "IDC_Site",
+              "AssetLifecycleStatus", "InstallationDate"], self.assets()),
+            ("Server_Info", "Server_ID",
+             ["Server_ID", "Person_ID", "chServerName", "chServerInfo", "chServerInet", "chServerInets", "Submitter",
+              "Create_Date"],
+             self.servers()),
+            ("Contacts", "Contact_ID",
+             ["Contact_ID", "Person_ID", "Role_Type", "Name", "Phone", "Email", "Status", "Reg_Date"],
+             self.contacts()),
+            ("Contracts", "Contract_ID",
+             ["Contract_ID", "Person_ID", "Service_Type", "Service_Number", "Service_Status", "Contract_Amount",
+              "Open_Date", "Terminate_Date", "Create_Date", "Deleted_YN"], self.contracts()),
+        ]
+
+
+# ---------------------------------------------------------------------------
+# COPY 적재
+# ---------------------------------------------------------------------------
+def _chunks(rows, size: int):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    n = 0
+    for row in rows:
+        writer.writerow(row)  # None → 빈 칸 (CSV 형식에서 NULL)
+        n += 1
+        if n == size:
+            yield buf.getvalue(), n
+            buf.seek(0)
+            buf.truncate()
+            n = 0
+    if n:
+        yield buf.getvalue(), n
+
+
+def load(raw_conn, dataset: Dataset, log=print) -> dict:
+    """psycopg2 연결에 데이터셋 적재 (기존 행 삭제 후 COPY). {테이블: 행 수}"""
+    tables = dataset.tables()
+    loaded = {}
+    with raw_conn.cursor() as cur:
+        names = ", ".join(f'"{t[0]}"' for t in tables)
+        cur.execute(f"TRUNCATE {names} RESTART IDENTITY CASCADE")
+
+        for table, key, columns, rows in tables:
+            started = datetime.now()
+            column_list = ", ".join(f'"{c}"' for c in columns)
+            sql = f'COPY "{table}" ({column_list}) FROM STDIN WITH (FORMAT csv)'
+            total = 0
+            for chunk, n in _chunks(rows, COPY_CHUNK):
+                cur.copy_expert(sql, io.StringIO(chunk))
+                total += n
+            cur.execute(
+                f"SELECT setval(pg_get_serial_sequence('\"{table}\"', %s), GREATEST(MAX(\"{key}\"), 1)) FROM \"{table}\"",
+                (key,),
+            )
+            loaded[table] = total
+            log(f"{table:<22} {total:>10,} 행  {(datetime.now() - started).total_seconds():6.1f}s")
+    raw_conn.commit()
+
+    # 통계가 없으면 실행 계획이 실제와 달라지므로 적재 직후 갱신
+    raw_conn.autocommit = True
+    with raw_conn.cursor() as cur:
+        for table, *_ in tables:
+            cur.execute(f'VACUUM ANALYZE "{table}"')
+    raw_conn.autocommit = False
+    return loaded
@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from urllib.parse import quote
+
+from sqlalchemy import func, text
+
+from . import BENCH_PASSWORD, BENCH_USER, REPO_ROOT, create_bench_app
+
+# 라우트별 응답 시간 측정 (Flask 테스트 클라이언트 → 네트워크 / 웹서버 제외한 앱 + DB 시간)
+#
+#   python -m bench.run --database-url URL --repeat 5 --output bench_report.json [--only work.]
+#
+# 얕은 페이지(1 페이지) / 깊은 페이지(OFFSET, 같은 위치의 커서) / 검색 / 상세 / AJAX 를 측정합니다.
+# 첫 요청은 캐시가 비어 있는 상태라 first_ms 로 따로 기록하고, 이후 repeat 회의 분포를 기록합니다.
+# SQL 문장 수 / DB 시간은 Server-Timing 헤더(services/sql_stats.py)에서 읽습니다.
+
+DEEP_RATIO = 0.9  # 깊은 페이지 = 전체 페이지의 90% 지점
+_SERVER_TIMING_DB = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+def _deep_page(total: int, per_page: int) -> int:
+    return max(1, int(total / per_page * DEEP_RATIO))
+
+
+def _cursor_at(query, keys, key_of, offset: int):
+    """정렬 순서상 offset 번째 행 다음 페이지 커서 (OFFSET 깊은 페이지와 같은 위치)"""
+    from app.services.pagination import encode_cursor
+
+    row = query.order_by(*[k.order_by() for k in keys]).offset(max(offset - 1, 0)).limit(1).first()
+    return quote(encode_cursor("next", keys, key_of(row))) if row is not None else ""
+
+
+def build_cases(app) -> tuple[list[tuple[str, str]], dict]:
+    """[(이름, URL)], {테이블: 행 수} - 데이터에 맞춰 페이지 번호 / ID / 커서 결정"""
+    from app.extensions import db
+    from app.models import AST_Computer_System, CTMPeople, ServerInfo, SRTicket, WorkInfo
+    from app.routes.sr import SR_SORT_KEYS, _sr_list_query, _sr_sort_key
+    from app.routes.work import WORK_SORT_KEYS, _work_list_query, _work_sort_key
+
+    with app.app_context():
+        counts = {
+            model.__tablename__: db.session.query(func.count()).select_from(model).scalar()
+            for model in (CTMPeople, WorkInfo, SRTicket, AST_Computer_System, ServerInfo)
+        }
+        n_people, n_work, n_sr = counts["CTM_People"], counts["Work_Info"], counts["SR_Tickets"]
+
+        # 행이 가장 많은 고객 (합성 데이터는 P000001 이 가장 무거움)
+        person_id = (
+            db.session.query(WorkInfo.Person_ID).group_by(WorkInfo.Person_ID)
+            .order_by(func.count().desc(), WorkInfo.Person_ID).limit(1).scalar()
+        ) or "P000001"
+        work_id = db.session.query(func.min(WorkInfo.Work_ID)).scalar() + n_work // 2
+        sr_id = db.session.query(func.min(SRTicket.sr_id)).scalar() + n_sr // 2
+
+        work_deep, sr_deep = _deep_page(n_work, 10), _deep_page(n_sr, 10)
+        work_cursor = _cursor_at(_work_list_query("", None, None), WORK_SORT_KEYS, _work_sort_key,
+                                 (work_deep - 1) * 10)
+        sr_cursor = _cursor_at(_sr_list_query("", "", "", None, None), SR_SORT_KEYS, _sr_sort_key,
+                               (sr_deep - 1) * 10)
+        latest = db.session.query(func.max(WorkInfo.Work_Date)).scalar()
+
+    month_from = latest.replace(day=1).isoformat() if latest else ""
+    month_to = latest.isoformat() if latest else ""
+    cases = [
+        ("dashboard.index", "/"),
+        ("customers.list", "/customers"),
+        ("customers.list (deep)", f"/customers?page={_deep_page(n_people, 15)}"),
+        ("customers.list (q)", "/customers?q=" + quote("전자")),
+        ("customers.list (idc)", "/customers?idc=" + quote("강남")),
+        ("customers.ajax_search", "/customers/ajax/search?q=" + quote("한빛")),
+        ("customers.detail", f"/customers/{person_id}"),
+        ("customers.tab_rows (work)", f"/customers/{person_id}/tabs/work"),
+        ("customers.tab_rows (assets)", f"/customers/{person_id}/tabs/assets"),
+        ("customers.tab_rows (servers)", f"/customers/{person_id}/tabs/servers"),
+        ("customers.tab_rows (contacts)", f"/customers/{person_id}/tabs/contacts"),
+        ("customers.tab_rows (contracts)", f"/customers/{person_id}/tabs/contracts"),
+        ("contract.ajax_list", f"/contract/ajax/{person_id}"),
+        ("work.list_work", "/work/list"),
+        ("work.list_work (page 2)", "/work/list?page=2"),
+        ("work.list_work (deep page)", f"/work/list?page={work_deep}"),
+        ("work.list_work (deep cursor)", f"/work/list?cursor={work_cursor}"),
+        ("work.list_work (q)", "/work/list?q=" + quote("방화벽")),
+        ("work.list_work (month)", f"/work/list?from={month_from}&to={month_to}"),
+        ("work.ajax_list", "/work/ajax/list"),
+        ("work.ajax_detail", f"/work/ajax/{work_id}/detail"),
+        ("work.ajax_attachments", f"/work/ajax/{work_id}/attachments"),
+        ("work.export (month csv)", f"/work/export?format=csv&from={month_from}&to={month_to}"),
+        ("sr.list_sr", "/sr/list"),
+        ("sr.list_sr (deep page)", f"/sr/list?page={sr_deep}"),
+        ("sr.list_sr (deep cursor)", f"/sr/list?cursor={sr_cursor}"),
+        ("sr.list_sr (company)", "/sr/list?company=" + quote("한빛")),
+        ("sr.ajax_list", "/sr/ajax/list"),
+        ("sr.ajax_detail", f"/sr/ajax/{sr_id}"),
+        ("asset.list_security", "/asset/security"),
+        ("asset.list_security (deep)",
+         f"/asset/security?page={_deep_page(counts['AST_Computer_System'], 15)}"),
+        ("asset.list_security (q)", "/asset/security?q=" + quote("방화벽")),
+        ("asset.list_servers", "/asset/servers"),
+        ("asset.list_servers (deep)", f"/asset/servers?page={_deep_page(counts['Server_Info'], 15)}"),
+        ("asset.list_servers (q)", "/asset/servers?q=srv-0001"),
+        ("schedule.index", f"/schedule?y={latest.year}&m={latest.month}" if latest else "/schedule"),
+        ("schedule.month_json", f"/schedule/month?y={latest.year}&m={latest.month}" if latest else "/schedule/month"),
+        ("users.list", "/users/list"),
+    ]
+    return cases, counts
+
+
+def _measure(client, url: str, warmup: int, repeat: int) -> dict:
+    def once():
+        started = time.perf_counter()
+        response = client.get(url)
+        body = response.get_data()  # 스트리밍 응답도 끝까지 읽은 시간
+        elapsed = (time.perf_counter() - started) * 1000
+        m = _SERVER_TIMING_DB.search(response.headers.get("Server-Timing", ""))
+        return elapsed, response.status_code, len(body), m
+
+    first_ms, status, size, _ = once()
+    for _ in range(max(warmup - 1, 0)):
+        once()
+
+    samples, db_ms, queries = [], [], None
+    for _ in range(repeat):
+        elapsed, status, size, m = once()
+        samples.append(elapsed)
+        if m:
+            db_ms.append(float(m.group(1)))
+            queries = int(m.group(2))
+
+    samples.sort()
+    return {
+        "status": status,
+        "bytes": size,
+        "queries": queries,
+        "first_ms": round(first_ms, 2),
+        "min_ms": round(samples[0], 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 2),
+        "max_ms": round(samples[-1], 2),
+        "db_median_ms": round(statistics.median(db_ms), 2) if db_ms else None,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라우트 응답 시간 벤치마크")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"),
+                        required=not os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--only", default="", help="이름에 이 문자열이 들어간 항목만 측정")
+    parser.add_argument("--output", default="bench_report.json")
+    args = parser.parse_args(argv)
+
+    app = create_bench_app(args.database_url)
+    app.config["SQL_STATS"] = True
+    cases, counts = build_cases(app)
+
+    client = app.test_client()
+    response = client.post("/auth/login", data={"user_id": BENCH_USER, "password": BENCH_PASSWORD})
+    if response.status_code != 302:
+        raise SystemExit("벤치마크 계정으로 로그인하지 못했습니다. bench.seed 를 먼저 실행하세요.")
+
+    results = []
+    for name, url in cases:
+        if args.only and args.only not in name:
+            continue
+        result = {"name": name, "url": url, **_measure(client, url, args.warmup, args.repeat)}
+        results.append(result)
+        print(f"{name:<34} {result['status']}  median {result['median_ms']:>9.2f} ms  "
+              f"p95 {result['p95_ms']:>9.2f} ms  {result['queries'] if result['queries'] is not None else '-':>3} q")
+
+    from app.extensions import db
+    with app.app_context():
+        server_version = db.session.execute(text("SHOW server_version")).scalar()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "postgresql": server_version,
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "rows": counts,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"보고서: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
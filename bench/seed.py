@@ -0,0 +1,69 @@
+import argparse
+import os
+
+from werkzeug.security import generate_password_hash
+
+from . import BENCH_PASSWORD, BENCH_USER, REPO_ROOT, create_bench_app
+from .dataset import SCALES, Dataset, load
+
+# 벤치마크 DB 준비: 테이블 / 인덱스 생성 후 합성 데이터 적재
+#
+#   python -m bench.seed --database-url URL --scale small --seed 42 --rows work=500000
+
+# Customer_Notes 모델이 없어 외래 키를 만들 수 없는 테이블 (벤치마크 라우트에서 쓰지 않음)
+SKIP_TABLES = {"Note_Attachments"}
+
+
+def _parse_rows(values: list[str]) -> dict:
+    overrides = {}
+    for value in values:
+        name, _, count = value.partition("=")
+        overrides[name.strip()] = int(count.replace("_", ""))
+    return overrides
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 데이터 적재")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"),
+                        required=not os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rows", action="append", default=[], metavar="TABLE=N",
+                        help=f"규모 개별 지정 ({', '.join(SCALES['tiny'])})")
+    args = parser.parse_args(argv)
+
+    counts = {**SCALES[args.scale], **_parse_rows(args.rows)}
+    unknown = set(counts) - set(SCALES["tiny"])
+    if unknown:
+        parser.error(f"알 수 없는 테이블: {', '.join(sorted(unknown))}")
+
+    app = create_bench_app(args.database_url)
+
+    from flask_migrate import upgrade
+    from app.extensions import db
+    from app.models import User
+
+    with app.app_context():
+        tables = [t for name, t in db.metadata.tables.items() if name not in SKIP_TABLES]
+        db.metadata.create_all(db.engine, tables=tables)
+        upgrade(directory=os.path.join(REPO_ROOT, "migrations"))
+
+        user = db.session.get(User, BENCH_USER) or User(user_id=BENCH_USER)
+        user.user_name = "Benchmark"
+        user.password_hash = generate_password_hash(BENCH_PASSWORD)
+        user.role = "ADMIN"
+        user.is_active = True
+        user.must_change_password = False
+        db.session.add(user)
+        db.session.commit()
+
+        print(f"규모 {args.scale} (seed {args.seed}): " + ", ".join(f"{k}={v:,}" for k, v in counts.items()))
+        raw = db.engine.raw_connection()
+        try:
+            load(raw.driver_connection, Dataset(counts, args.seed))
+        finally:
+            raw.close()
+
+
+if __name__ == "__main__":
+    main()
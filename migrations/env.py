@@ -72,6 +72,28 @@ def run_migrations_offline():
         context.run_migrations()
 
 
+TIMEOUT_SETTINGS = ('statement_timeout', 'idle_in_transaction_session_timeout')
+
+
+def _disable_timeouts(connection):
+    """PostgreSQL 세션의 제한 시간 해제 (pgbouncer 는 세션 설정이 다른 클라이언트로 넘어가므로 제외)"""
+    if connection.dialect.name != 'postgresql' or current_app.config.get('DB_PGBOUNCER'):
+        return False
+    for name in TIMEOUT_SETTINGS:
+        connection.exec_driver_sql(f'SET {name} = 0')
+    connection.commit()
+    return True
+
+
+def _reset_timeouts(connection):
+    """연결 시작 옵션의 값으로 되돌림 (연결이 앱 풀로 돌아가므로)"""
+    if connection.in_transaction():
+        connection.rollback()
+    for name in TIMEOUT_SETTINGS:
+        connection.exec_driver_sql(f'RESET {name}')
+    connection.commit()
+
+
 def run_migrations_online():
     """Run migrations in 'online' mode.
 
@@ -97,14 +119,22 @@ def run_migrations_online():
     connectable = get_engine()
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=get_metadata(),
-            **conf_args
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        # 앱 엔진은 연결 시작 옵션으로 statement_timeout / idle_in_transaction_session_timeout 이 걸려 있음
+        # (config.py). 큰 테이블의 CREATE INDEX CONCURRENTLY 가 중간에 취소되면 INVALID 인덱스가 남고
+        # IF NOT EXISTS 로 다시 실행해도 건너뛰므로, 마이그레이션 동안은 끄고 끝나면 연결 기본값으로 되돌림
+        no_timeout = _disable_timeouts(connection)
+        try:
+            context.configure(
+                connection=connection,
+                target_metadata=get_metadata(),
+                **conf_args
+            )
+
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            if no_timeout:
+                _reset_timeouts(connection)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,82 @@
+"""pg_trgm GIN indexes for list page substring search
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2026-10-18 10:12:41.118204
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9b7d10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# app/services/search.py 의 contains()/contains_any() 가 사용하는 컬럼
+TRGM_COLUMNS = {
+    'CTM_People': ('Company', 'Last_Name', 'Sales_Manager', 'Rack_Location'),
+    'Work_Info': ('Summary', 'Submitter'),
+    'AST_Computer_System': ('Name', 'IP_Address', 'Serial_Number'),
+    'Server_Info': ('chServerName', 'chServerInfo'),
+    'SR_Tickets': ('Location', 'Company', 'Content'),
+}
+
+
+def _index_name(table, column):
+    return f'ix_{table}_{column}_trgm'.lower()
+
+
+def _ensure_trgm(bind):
+    """pg_trgm 확장 생성. 사용 불가(비 PostgreSQL, 확장 미설치, 권한 없음)면 False"""
+    if bind.dialect.name != 'postgresql':
+        return False
+
+    available = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        return False
+
+    try:
+        with op.get_context().autocommit_block():
+            op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except sa.exc.DBAPIError as e:
+        logger.warning('pg_trgm 확장을 생성할 수 없습니다: %s', e)
+        return False
+    return True
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not _ensure_trgm(bind):
+        # 확장이 없는 DB 는 인덱스 없이 일반 ILIKE 검색으로 동작
+        logger.warning('pg_trgm 을 사용할 수 없어 trigram 인덱스 생성을 건너뜁니다.')
+        return
+
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY (트랜잭션 밖에서 실행)
+    # 한글 trigram 추출은 DB LC_CTYPE 이 C 가 아닌(ko_KR.UTF-8 / en_US.UTF-8 등) 경우에만 동작
+    with op.get_context().autocommit_block():
+        for table, columns in TRGM_COLUMNS.items():
+            for column in columns:
+                op.execute(
+                    f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{_index_name(table, column)}" '
+                    f'ON "{table}" USING gin ("{column}" gin_trgm_ops)'
+                )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for table, columns in TRGM_COLUMNS.items():
+            for column in columns:
+                op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{_index_name(table, column)}"')
@@ -0,0 +1,43 @@
+"""Work_Info (Work_Date) covering index for the month calendar
+
+Revision ID: 4b9e2d7a6f31
+Revises: c51e07b9a3d2
+Create Date: 2026-10-18 19:12:44.381205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b9e2d7a6f31'
+down_revision = 'c51e07b9a3d2'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_work_info_work_date_calendar'
+
+
+def upgrade():
+    # app/services/month_calendar.py: Work_Date 범위 조회 + (Work_ID, Person_ID, Work_Type) 만 사용
+    # INCLUDE 로 나머지 열을 인덱스에 담아 Work_Info 본문을 읽지 않는 index-only scan 이 되도록 함
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.create_index(INDEX_NAME, 'Work_Info', ['Work_Date', 'Work_ID', 'Person_ID', 'Work_Type'])
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{INDEX_NAME}" '
+            f'ON "Work_Info" ("Work_Date", "Work_ID") INCLUDE ("Person_ID", "Work_Type")'
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.drop_index(INDEX_NAME, table_name='Work_Info')
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{INDEX_NAME}"')
@@ -0,0 +1,43 @@
+"""CTM_People (Company, Last_Name) index for the customer picker
+
+Revision ID: 8a4d6e2f1c57
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-18 14:03:27.502913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4d6e2f1c57'
+down_revision = '3f1c2a9b7d10'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_ctm_people_company_last_name'
+
+
+def upgrade():
+    # app/services/customer_lookup.py: 검색어 없이 열었을 때의 정렬(Company, Last_Name) + LIMIT
+    # 부분 일치 검색은 3f1c2a9b7d10 의 trigram 인덱스를 사용
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.create_index(INDEX_NAME, 'CTM_People', ['Company', 'Last_Name'])
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{INDEX_NAME}" '
+            f'ON "CTM_People" ("Company", "Last_Name")'
+        )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        op.drop_index(INDEX_NAME, table_name='CTM_People')
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{INDEX_NAME}"')
@@ -0,0 +1,87 @@
+"""Composite indexes matching list / detail query shapes
+
+Revision ID: 9d3f5b1e7c42
+Revises: 4b9e2d7a6f31
+Create Date: 2026-10-18 19:41:08.227914
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3f5b1e7c42'
+down_revision = '4b9e2d7a6f31'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# (인덱스명, 테이블, 컬럼 정의, 부분 인덱스 조건, 사용하는 곳)
+# 정렬 방향 / NULLS 위치를 쿼리의 ORDER BY 와 맞춰야 정렬 없이 인덱스 순서대로 LIMIT 까지 읽습니다.
+# 조회 계획은 `flask explain-queries` 로 확인합니다. (app/cli.py)
+INDEXES = [
+    ('ix_work_info_person_date', 'Work_Info',
+     '"Person_ID", "Work_Date" DESC NULLS LAST, "Work_ID" DESC', None,
+     '고객 상세 작업 탭 (customers.tab_rows / works)'),
+    ('ix_work_info_date_desc', 'Work_Info',
+     '"Work_Date" DESC NULLS LAST, "Work_ID" DESC', None,
+     '작업 목록 (work.list_work, work.export_work)'),
+    ('ix_work_attachments_work_upload', 'Work_Attachments',
+     '"Work_ID", "Upload_Date" DESC', None,
+     '작업 첨부 목록 (work.ajax_work_attachments)'),
+    ('ix_sr_tickets_request_date', 'SR_Tickets',
+     '"Request_Date" DESC, "SR_ID" DESC', None,
+     'SR 목록 / 대시보드 최근 SR'),
+    ('ix_server_info_person', 'Server_Info',
+     '"Person_ID", "Server_ID" DESC', None,
+     '고객 상세 서버 탭'),
+    ('ix_server_info_create_date', 'Server_Info',
+     '"Create_Date" DESC, "Server_ID" DESC', None,
+     '서버 자산 목록 (asset.list_servers, asset.export_servers)'),
+    ('ix_contacts_person', 'Contacts',
+     '"Person_ID", "Contact_ID" DESC', None,
+     '고객 상세 담당자 탭'),
+    ('ix_contracts_person_active', 'Contracts',
+     '"Person_ID", "Contract_ID" DESC', '"Deleted_YN" = \'N\'',
+     '고객 상세 계약 탭 / contract.ajax_list_contracts'),
+    ('ix_ctm_people_terminate_date', 'CTM_People',
+     '"Terminate_Date"', '"Terminate_Date" IS NOT NULL',
+     '대시보드 계약 만료 임박'),
+    ('ix_ast_computer_system_person_name', 'AST_Computer_System',
+     '"Person_ID", "Name", "Asset_ID"', None,
+     '고객 상세 보안장비 탭'),
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # 개발용 DB: 같은 컬럼 구성으로 생성 (정렬 방향 / 부분 조건은 PostgreSQL 에서만)
+        for name, table, columns, where, _ in INDEXES:
+            cols = [c.split()[0].strip('"') for c in columns.split(',')]
+            op.create_index(name, table, cols)
+        return
+
+    # 운영 중 잠금 없이 생성 (CONCURRENTLY 는 트랜잭션 밖에서만 가능)
+    with op.get_context().autocommit_block():
+        for name, table, columns, where, used_by in INDEXES:
+            logger.info('인덱스 생성: %s (%s)', name, used_by)
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}" ({columns})'
+                + (f' WHERE {where}' if where else '')
+            )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        for name, table, _, _, _ in INDEXES:
+            op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, _, _, _, _ in INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
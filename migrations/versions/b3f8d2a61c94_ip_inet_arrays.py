@@ -0,0 +1,120 @@
+"""inet[] shadow columns holding every address for exact IP search
+
+Revision ID: b3f8d2a61c94
+Revises: e7a2c4d91b36
+Create Date: 2026-10-19 10:12:44.581306
+
+"""
+import ipaddress
+import logging
+import re
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f8d2a61c94'
+down_revision = 'e7a2c4d91b36'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+BATCH_SIZE = 1000
+
+# (테이블, PK, IP 텍스트 컬럼, inet[] 컬럼, 인덱스명) - app/services/ip_search.py INET_COLUMNS 와 같은 구성
+INET_ARRAYS = [
+    ('AST_Computer_System', 'Asset_ID', 'IP_Address', 'IP_Inets', 'ix_ast_computer_system_ip_inets'),
+    ('Server_Info', 'Server_ID', 'chServerInfo', 'chServerInets', 'ix_server_info_inets'),
+]
+
+# IP 텍스트 해석 - 이 리비전 작성 시점의 app/services/ip_search.py to_inets() 복사본
+# (앱 코드가 바뀌어도 이 리비전의 결과가 달라지지 않도록 고정, 수정하지 말 것)
+_IPV4 = re.compile(r"(?<![\d.])\d{1,3}(?:\.\d{1,3}){3}(?:/\d{1,2})?(?![\d.])")
+_SEPARATORS = re.compile(r"[\s,;()\[\]]+")
+
+
+def _interface(token):
+    try:
+        iface = ipaddress.ip_interface(token)
+    except ValueError:
+        return None
+    network = iface.network
+    if iface.ip == network.network_address and network.prefixlen < network.max_prefixlen:
+        return str(network)
+    return str(iface.ip)
+
+
+def _iter_inets(text):
+    if not text:
+        return
+    for token in _IPV4.findall(text):
+        value = _interface(token)
+        if value:
+            yield value
+    for token in _SEPARATORS.split(text):
+        if ":" in token:
+            value = _interface(token)
+            if value:
+                yield value
+
+
+def to_inets(text):
+    """IP 텍스트에 적힌 IP / 대역 목록 (중복 제거, 없으면 None)"""
+    return list(dict.fromkeys(_iter_inets(text))) or None
+
+
+def _backfill(bind, table, pk, source, target):
+    """기존 행의 IP 텍스트를 해석해 inet[] 컬럼 채우기 (SQLite 는 공백으로 감싼 텍스트, app/models/types.py)"""
+    is_pg = bind.dialect.name == 'postgresql'
+    rows = bind.execute(sa.text(
+        f'SELECT "{pk}", "{source}" FROM "{table}" WHERE "{source}" IS NOT NULL'
+    )).all()
+
+    values = []
+    for row_id, text in rows:
+        inets = to_inets(text)
+        if inets:
+            value = '{' + ','.join(inets) + '}' if is_pg else f" {' '.join(inets)} "
+            values.append({'id': row_id, 'inets': value})
+
+    cast = 'CAST(:inets AS INET[])' if is_pg else ':inets'
+    update = sa.text(f'UPDATE "{table}" SET "{target}" = {cast} WHERE "{pk}" = :id')
+    for start in range(0, len(values), BATCH_SIZE):
+        bind.execute(update, values[start:start + BATCH_SIZE])
+    logger.info('%s.%s: %d / %d 행의 IP 를 해석했습니다.', table, target, len(values), len(rows))
+
+
+def upgrade():
+    bind = op.get_bind()
+    is_pg = bind.dialect.name == 'postgresql'
+    array_type = postgresql.ARRAY(postgresql.INET()) if is_pg else sa.Text()
+    inspector = sa.inspect(bind)
+
+    # 모델로 테이블을 만든 DB(bench/seed.py 의 create_all)에는 컬럼이 이미 있음
+    for table, pk, source, target, _ in INET_ARRAYS:
+        if target not in {c['name'] for c in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column(target, array_type, nullable=True))
+        _backfill(bind, table, pk, source, target)
+
+    if not is_pg:
+        # 개발용 DB 는 LIKE '% IP %' 로 비교하므로 인덱스 없음
+        return
+
+    # GIN(array_ops): inet[] @> '{IP}' 조건을 인덱스로 처리
+    with op.get_context().autocommit_block():
+        for table, _, _, target, name in INET_ARRAYS:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}" USING gin ("{target}")')
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for _, _, _, _, name in INET_ARRAYS:
+                op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+    for table, _, _, target, _ in INET_ARRAYS:
+        op.drop_column(table, target)
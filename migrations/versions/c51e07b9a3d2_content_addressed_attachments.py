@@ -0,0 +1,119 @@
+"""move attachments into the content-addressed store
+
+Revision ID: c51e07b9a3d2
+Revises: 8a4d6e2f1c57
+Create Date: 2026-10-18 15:21:09.774120
+
+"""
+import hashlib
+import logging
+import os
+import shutil
+
+from alembic import op
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = 'c51e07b9a3d2'
+down_revision = '8a4d6e2f1c57'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+CHUNK_SIZE = 1024 * 1024
+
+# (테이블, PK, 경로 컬럼, 크기 컬럼)
+ATTACHMENT_TABLES = (
+    ('Work_Attachments', 'Attachment_ID', 'File_Path', 'File_Size'),
+    ('Note_Attachments', 'Attachment_ID', 'Stored_Filename', 'Size_Bytes'),
+)
+
+
+def _upload_root():
+    # app/services/file_store.py upload_root() 와 같은 규칙
+    folder = current_app.config.get('UPLOAD_FOLDER')
+    if not folder:
+        folder = os.path.join(current_app.root_path, 'static', 'uploads')
+    if not os.path.isabs(folder):
+        folder = os.path.join(current_app.root_path, folder)
+    return folder
+
+
+def _legacy_dirs(root):
+    """기존 코드가 파일을 저장하던 위치 (일부 라우트는 UPLOAD_FOLDER 를 작업 디렉터리 기준으로 사용)"""
+    dirs = [root]
+    folder = current_app.config.get('UPLOAD_FOLDER')
+    if folder and not os.path.isabs(folder):
+        dirs.append(os.path.abspath(folder))
+    return dirs
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _move_into_store(root, src):
+    sha = _sha256(src)
+    rel_path = os.path.join(sha[:2], sha[2:4], sha)
+    dest = os.path.join(root, rel_path)
+    if os.path.exists(dest):
+        os.remove(src)  # 같은 내용이 이미 저장되어 있음 (중복 제거)
+    else:
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.move(src, dest)
+    return rel_path, os.path.getsize(dest)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    root = _upload_root()
+    legacy_dirs = _legacy_dirs(root)
+
+    for table, pk, path_col, size_col in ATTACHMENT_TABLES:
+        if not inspector.has_table(table):
+            continue
+
+        # 해시 경로가 아닌(폴더 구분자 없는) 기존 행만 대상이라 다시 실행해도 안전
+        rows = bind.execute(sa.text(
+            f'SELECT "{pk}", "{path_col}" FROM "{table}" WHERE "{path_col}" NOT LIKE :p'
+        ), {'p': '%/%'}).all()
+
+        moved = {}  # 기존 파일명 → 새 상대 경로
+        # 파일 이동과 행 갱신이 어긋나지 않도록 한 행씩 바로 커밋
+        with op.get_context().autocommit_block():
+            for row_id, stored in rows:
+                if stored not in moved:
+                    src = next(
+                        (os.path.join(d, stored) for d in legacy_dirs if os.path.isfile(os.path.join(d, stored))),
+                        None,
+                    )
+                    if src is None:
+                        logger.warning('%s.%s=%s: 파일이 없어 건너뜁니다.', table, pk, row_id)
+                        continue
+                    moved[stored] = _move_into_store(root, src)
+
+                rel_path, size = moved[stored]
+                bind.execute(sa.text(
+                    f'UPDATE "{table}" SET "{path_col}" = :path, "{size_col}" = :size WHERE "{pk}" = :id'
+                ), {'path': rel_path, 'size': size, 'id': row_id})
+
+        logger.info('%s: %d 개 파일을 해시 저장소로 이동했습니다.', table, len(moved))
+
+        # file_store.ref_count() 의 경로별 참조 수 조회용
+        op.create_index(f'ix_{table}_{path_col}'.lower(), table, [path_col])
+
+
+def downgrade():
+    # 해시 저장소의 파일은 여러 첨부가 공유할 수 있어 원래 이름으로 되돌리지 않음 (인덱스만 제거)
+    inspector = sa.inspect(op.get_bind())
+    for table, _pk, path_col, _size_col in ATTACHMENT_TABLES:
+        if inspector.has_table(table):
+            op.drop_index(f'ix_{table}_{path_col}'.lower(), table_name=table)
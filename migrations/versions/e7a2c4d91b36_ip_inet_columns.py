@@ -0,0 +1,123 @@
+"""inet shadow columns + GiST indexes for IP range search
+
+Revision ID: e7a2c4d91b36
+Revises: 9d3f5b1e7c42
+Create Date: 2026-10-18 23:05:37.418260
+
+"""
+import ipaddress
+import logging
+import re
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c4d91b36'
+down_revision = '9d3f5b1e7c42'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+BATCH_SIZE = 1000
+
+# (테이블, PK, IP 텍스트 컬럼, inet 컬럼, 인덱스명) - app/services/ip_search.py INET_COLUMNS 와 같은 구성
+INET_COLUMNS = [
+    ('AST_Computer_System', 'Asset_ID', 'IP_Address', 'IP_Inet', 'ix_ast_computer_system_ip_inet'),
+    ('Server_Info', 'Server_ID', 'chServerInfo', 'chServerInet', 'ix_server_info_inet'),
+]
+
+
+# IP 텍스트 해석 - 이 리비전 작성 시점의 app/services/ip_search.py to_inet() 복사본
+# (앱 코드가 바뀌어도 이 리비전의 결과가 달라지지 않도록 고정, 수정하지 말 것)
+_IPV4 = re.compile(r"(?<![\d.])\d{1,3}(?:\.\d{1,3}){3}(?:/\d{1,2})?(?![\d.])")
+_SEPARATORS = re.compile(r"[\s,;()\[\]]+")
+
+
+def _interface(token):
+    try:
+        iface = ipaddress.ip_interface(token)
+    except ValueError:
+        return None
+    network = iface.network
+    if iface.ip == network.network_address and network.prefixlen < network.max_prefixlen:
+        return str(network)
+    return str(iface.ip)
+
+
+def _iter_inets(text):
+    if not text:
+        return
+    for token in _IPV4.findall(text):
+        value = _interface(token)
+        if value:
+            yield value
+    for token in _SEPARATORS.split(text):
+        if ":" in token:
+            value = _interface(token)
+            if value:
+                yield value
+
+
+def to_inet(text):
+    """IP 텍스트에서 첫 번째 IP / 대역 (해석할 수 없으면 None)"""
+    return next(_iter_inets(text), None)
+
+
+def _backfill(bind, table, pk, source, shadow):
+    """기존 행의 IP 텍스트를 해석해 inet 컬럼 채우기 (해석할 수 없는 값은 NULL 로 둠)"""
+    rows = bind.execute(sa.text(
+        f'SELECT "{pk}", "{source}" FROM "{table}" WHERE "{source}" IS NOT NULL'
+    )).all()
+    values = [{'id': row_id, 'inet': to_inet(text)} for row_id, text in rows]
+    values = [v for v in values if v['inet']]
+
+    cast = 'CAST(:inet AS INET)' if bind.dialect.name == 'postgresql' else ':inet'
+    update = sa.text(f'UPDATE "{table}" SET "{shadow}" = {cast} WHERE "{pk}" = :id')
+    for start in range(0, len(values), BATCH_SIZE):
+        bind.execute(update, values[start:start + BATCH_SIZE])
+    logger.info('%s.%s: %d / %d 행의 IP 를 해석했습니다.', table, shadow, len(values), len(rows))
+
+
+def upgrade():
+    bind = op.get_bind()
+    is_pg = bind.dialect.name == 'postgresql'
+    inet_type = postgresql.INET() if is_pg else sa.Text()
+
+    inspector = sa.inspect(bind)
+
+    # 모델로 테이블을 만든 DB(bench/seed.py 의 create_all)에는 컬럼이 이미 있음 → 추가만 건너뛰고 채우기는 진행
+    for table, pk, source, shadow, _ in INET_COLUMNS:
+        if shadow not in {c['name'] for c in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column(shadow, inet_type, nullable=True))
+        _backfill(bind, table, pk, source, shadow)
+
+    if not is_pg:
+        for table, _, _, shadow, name in INET_COLUMNS:
+            if name not in {i['name'] for i in inspector.get_indexes(table)}:
+                op.create_index(name, table, [shadow])
+        return
+
+    # inet_ops GiST: 포함(<<=, >>=) / 범위(<, >) 조건을 모두 인덱스로 처리
+    with op.get_context().autocommit_block():
+        for table, _, _, shadow, name in INET_COLUMNS:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "{table}" USING gist ("{shadow}" inet_ops)'
+            )
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for _, _, _, _, name in INET_COLUMNS:
+                op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+    else:
+        for table, _, _, _, name in INET_COLUMNS:
+            op.drop_index(name, table_name=table)
+
+    for table, _, _, shadow, _ in INET_COLUMNS:
+        op.drop_column(table, shadow)
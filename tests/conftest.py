@@ -0,0 +1,141 @@
+import os
+import re
+import sys
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import BigInteger
+from sqlalchemy.ext.compiler import compiles
+
+# 테스트 공용 fixture - SQLite 파일 DB 위에 testing 프로필 앱 (SQL_QUERY_BUDGET=raise)
+#
+#   python -m pytest -q
+#
+# 요청마다 캐시를 비워 두므로 응답의 SQL 문장 수는 캐시 미스 기준(query_budget.py 의 상한 기준)입니다.
+# TEST_DATABASE_URL 을 주면 그 DB 에서 실행합니다. (테이블을 지우고 다시 만드므로 테스트 전용 빈 DB 만 지정)
+# PostgreSQL 이면 PostgreSQL 전용 테스트(실행 계획 등)도 실행합니다.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PASSWORD = "test-password"
+PERSON_ID = "P-T0"
+
+# Customer_Notes 모델이 없어 외래 키를 만들 수 없는 테이블 (bench/seed.py 와 같음)
+SKIP_TABLES = {"Note_Attachments"}
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite 는 INTEGER PRIMARY KEY 만 자동 증가
+    return "INTEGER"
+
+
+def _seed(db):
+    from werkzeug.security import generate_password_hash
+
+    from app.models import (
+        AST_Computer_System, Contact, Contract, CTMPeople, ServerInfo, SRTicket, User, WorkInfo,
+    )
+
+    db.session.add(User(user_id="admin", user_name="관리자", password_hash=generate_password_hash(PASSWORD),
+                        role="ADMIN", is_active=True, must_change_password=False))
+    today = date.today()
+    for i in range(3):
+        person_id = f"P-T{i}"
+        db.session.add(CTMPeople(Person_ID=person_id, Company=f"테스트{i}", Last_Name=f"사이트{i}",
+                                 Client_Sensitivity="0", Report_YN="Y", Open_Date=today,
+                                 Terminate_Date=date(today.year + 1, 1, 1)))
+        db.session.flush()
+        for j in range(3):
+            n = i * 3 + j
+            db.session.add(WorkInfo(Person_ID=person_id, Work_Type="점검", Work_Date=today, Summary=f"작업 {n}",
+                                    Submitter="관리자", Create_Date=datetime.now(), Attachment_YN="N"))
+            db.session.add(SRTicket(location=f"사이트{i}", company=f"테스트{i}", request_date=today,
+                                    content=f"요청 {n}", handler="관리자", created_by="admin"))
+            db.session.add(AST_Computer_System(Person_ID=person_id, Company=f"테스트{i}", Owner_name=f"사이트{i}",
+                                               Name=f"fw-{n}", Type="방화벽", IP_Address=f"10.0.{n}.1"))
+            db.session.add(ServerInfo(Person_ID=person_id, chServerName=f"srv-{n}",
+                                      chServerInfo=f"192.168.{n}.10", Create_Date=datetime.now()))
+            db.session.add(Contact(Person_ID=person_id, Name=f"담당자{n}", Status="활성화"))
+            db.session.add(Contract(Person_ID=person_id, Service_Type="FW", Service_Status="사용중",
+                                    Open_Date=today, Terminate_Date=date(today.year + 1, 1, 1), Deleted_YN="N"))
+    db.session.commit()
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("soms")
+    os.environ.update(
+        DATABASE_URL=os.getenv("TEST_DATABASE_URL") or f"sqlite:///{tmp / 'test.db'}",
+        UPLOAD_FOLDER=str(tmp / "uploads"),
+        SECRET_KEY="test",
+        BOOTSTRAP_ADMIN_ID="",
+    )
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app("testing")
+    with app.app_context():
+        tables = [t for name, t in db.metadata.tables.items() if name not in SKIP_TABLES]
+        db.metadata.drop_all(db.engine, tables=tables)
+        db.metadata.create_all(db.engine, tables=tables)
+        _seed(db)
+    return app
+
+
+def clear_caches():
+    from app.services.customer_lookup import invalidate_customer_search
+    from app.services.customer_stats import invalidate_customer_summary
+    from app.services.dashboard_data import invalidate_dashboard
+    from app.services.ip_owner import invalidate_ip_owners
+    from app.services.user_cache import invalidate_user
+
+    invalidate_customer_search()
+    invalidate_customer_summary()
+    invalidate_dashboard()
+    invalidate_ip_owners()
+    invalidate_user()
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    response = client.post("/auth/login", data={"user_id": "admin", "password": PASSWORD})
+    assert response.status_code == 302
+    return client
+
+
+def query_count(response) -> int:
+    """Server-Timing 헤더의 SQL 문장 수 (services/sql_stats.py)"""
+    m = _QUERIES.search(response.headers.get("Server-Timing", ""))
+    assert m, "Server-Timing 헤더가 없습니다."
+    return int(m.group(1))
+
+
+@pytest.fixture
+def call(app, client):
+    """캐시를 비운 상태로 요청하고 응답의 SQL 문장 수가 엔드포인트 상한 이내인지 확인"""
+    from app.services.query_budget import budget_for
+
+    adapter = app.url_map.bind("localhost")
+
+    def call(method: str, url: str, **kwargs):
+        clear_caches()
+        response = client.open(url, method=method, **kwargs)
+        endpoint, _ = adapter.match(url.split("?")[0], method=method)
+        count, budget = query_count(response), budget_for(endpoint)
+        assert count <= budget, f"{endpoint}: SQL {count}회 (상한 {budget}회)"
+        return response
+
+    return call
+
+
+@pytest.fixture
+def db(app):
+    from app.extensions import db
+
+    with app.app_context():
+        yield db
@@ -0,0 +1,45 @@
+import json
+import logging
+import os
+
+from flask import Flask
+
+# 정적 자원 묶음 (app/services/assets.py) - 빌드 없이 운영 설정으로 뜨면 시작 경고를 남기는지
+
+
+def _assets_app(static_folder, debug: bool) -> Flask:
+    from app.services.assets import init_assets
+
+    app = Flask(__name__, static_folder=str(static_folder))
+    app.config["ASSETS_DEBUG"] = debug
+    init_assets(app)
+    return app
+
+
+def _warnings(caplog):
+    return [r.getMessage() for r in caplog.records if r.name == "soms.assets" and r.levelno == logging.WARNING]
+
+
+def test_warns_without_build(tmp_path, caplog):
+    from app.services.assets import BUNDLES, missing_vendor_files
+
+    with caplog.at_level(logging.WARNING, logger="soms.assets"):
+        _assets_app(tmp_path, debug=False)
+    messages = _warnings(caplog)
+    assert len(messages) == 2
+    assert "flask build-assets" in messages[0]
+    assert "flask vendor-assets" in messages[1]
+
+    vendor = [p for files in BUNDLES.values() for p in files if p.startswith("vendor/")]
+    assert missing_vendor_files(str(tmp_path)) == vendor
+
+
+def test_no_warning_when_built_or_debug(tmp_path, caplog):
+    os.makedirs(tmp_path / "dist")
+    with open(tmp_path / "dist" / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump({"bundles": {"vendor.js": "dist/vendor.0123456789.js"}}, f)
+
+    with caplog.at_level(logging.WARNING, logger="soms.assets"):
+        _assets_app(tmp_path, debug=False)
+        _assets_app(tmp_path / "empty", debug=True)
+    assert _warnings(caplog) == []
@@ -0,0 +1,134 @@
+import time
+from datetime import date
+
+import pytest
+from flask import g, request, request_finished
+
+from conftest import SKIP_TABLES
+
+# 읽기 복제본 라우팅 (app/services/db_routing.py) - 테스트 클라이언트 요청으로 확인
+#
+# primary 에만 행을 넣고 복제본은 빈 DB(복제 지연)로 둡니다.
+# 복제본에서 읽은 응답에는 primary 의 행이 보이지 않으므로 응답 내용으로 어느 DB 에서 읽었는지 알 수 있습니다.
+
+
+@pytest.fixture(scope="module")
+def replica_app(tmp_path_factory):
+    tmp = tmp_path_factory.mktemp("replica")
+    patch = pytest.MonkeyPatch()
+    patch.setenv("DATABASE_URL", f"sqlite:///{tmp / 'primary.db'}")
+    patch.setenv("DATABASE_REPLICA_URL", f"sqlite:///{tmp / 'replica.db'}")
+    patch.setenv("UPLOAD_FOLDER", str(tmp / "uploads"))
+
+    from werkzeug.security import generate_password_hash
+
+    from app import create_app
+    from app.extensions import db
+    from app.models import CTMPeople, SRTicket, User
+
+    try:
+        app = create_app("testing")
+        with app.app_context():
+            tables = [t for name, t in db.metadata.tables.items() if name not in SKIP_TABLES]
+            for engine in (db.engines[None], db.engines["replica"]):
+                db.metadata.create_all(engine, tables=tables)
+            db.session.add(User(user_id="replica", user_name="복제본", password_hash=generate_password_hash("pw"),
+                                role="User", is_active=True, must_change_password=False))
+            db.session.add(CTMPeople(Person_ID="P-R0", Company="복제", Client_Sensitivity="0", Report_YN="Y",
+                                     Open_Date=date.today()))
+            db.session.add(SRTicket(location="복제", company="복제", request_date=date.today(), content="primary SR",
+                                    handler="복제본", created_by="replica"))
+            db.session.commit()
+        yield app
+    finally:
+        patch.undo()
+
+
+@pytest.fixture
+def routed(replica_app):
+    """요청마다 (엔드포인트, 메서드, 복제본에서 읽었는지) 기록"""
+    seen = []
+
+    def record(sender, response, **extra):
+        seen.append((request.endpoint, request.method, g.get("_read_replica", False)))
+
+    with request_finished.connected_to(record, replica_app):
+        yield seen
+
+
+@pytest.fixture
+def replica_client(replica_app):
+    from app.services.user_cache import invalidate_user
+
+    invalidate_user()
+    client = replica_app.test_client()
+    response = client.post("/auth/login", data={"user_id": "replica", "password": "pw"})
+    assert response.status_code == 302
+    _expire_sticky(client)  # 로그인 중 기록(flush)으로 붙은 primary 고정은 풀고 시작
+    return client
+
+
+def _expire_sticky(client):
+    with client.session_transaction() as s:
+        s["_primary_until"] = int(time.time()) - 1
+
+
+def _sr_contents(client) -> list:
+    response = client.get("/sr/ajax/list")
+    assert response.status_code == 200, response.get_data(as_text=True)[:500]
+    return [item["content"] for item in response.get_json()["items"]]
+
+
+def test_allow_listed_get_reads_replica(replica_client, routed):
+    assert _sr_contents(replica_client) == []
+    assert replica_client.head("/sr/ajax/list").status_code == 200
+    assert routed == [("sr.ajax_list_sr", "GET", True), ("sr.ajax_list_sr", "HEAD", True)]
+
+
+def test_other_requests_read_primary(replica_client, routed):
+    # 목록에 없는 화면
+    response = replica_client.get("/customers/ajax/search?q=복제")
+    assert "P-R0" in response.get_data(as_text=True)
+    # 목록에 있는 화면이라도 POST (고객사명이 비어 저장하지 않음)
+    assert replica_client.post("/customers", data={"Company": ""}).status_code == 302
+    assert routed == [("customers.ajax_search", "GET", False), ("customers.list_customers", "POST", False)]
+
+    with replica_client.session_transaction() as s:
+        assert s["_primary_until"] < time.time()  # 쓰지 않은 요청은 고정하지 않음
+
+
+def test_write_sticks_to_primary(replica_app, replica_client, routed):
+    form = {"location": "복제", "company": "복제", "request_date": date.today().isoformat(), "content": "new SR",
+            "handler": "복제본"}
+    before = time.time()
+    response = replica_client.post("/sr/ajax/create", data=form)
+    assert response.get_json()["ok"]
+
+    with replica_client.session_transaction() as s:
+        until = s["_primary_until"]
+    sticky = replica_app.config["REPLICA_STICKY_SECONDS"]
+    assert int(before) + sticky <= until <= time.time() + sticky
+
+    # 고정 시간 안의 조회는 primary (방금 쓴 행이 보임)
+    assert set(_sr_contents(replica_client)) == {"primary SR", "new SR"}
+    # 시간이 지나면 다시 복제본
+    _expire_sticky(replica_client)
+    assert _sr_contents(replica_client) == []
+    assert [r[2] for r in routed] == [False, False, True]
+
+
+def test_cache_fills_read_primary(replica_app, replica_client, routed):
+    from app.services.customer_stats import customer_summary, invalidate_customer_summary
+    from app.services.user_cache import invalidate_user
+
+    invalidate_customer_summary()
+    invalidate_user()
+    # 로그인 사용자 / 상단 통계 캐시를 복제본 조회 요청 안에서 채움
+    response = replica_client.get("/customers")
+    assert response.status_code == 200
+    assert routed == [("customers.list_customers", "GET", True)]
+
+    with replica_app.app_context():
+        assert customer_summary()["count_vip"] == 1  # 요청 중에 채운 값 (복제본이었으면 0)
+    invalidate_customer_summary()
+    invalidate_user()
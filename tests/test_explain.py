@@ -0,0 +1,71 @@
+import json
+import os
+
+import pytest
+from sqlalchemy import text
+
+from conftest import PERSON_ID, ROOT
+
+# 마이그레이션 / 실행 계획 검사 (flask explain-queries, app/cli.py) - PostgreSQL 전용
+#
+#   TEST_DATABASE_URL=postgresql+psycopg2://.../soms_test python -m pytest -q tests/test_explain.py
+#
+# 테스트 DB 에 마이그레이션(인덱스)을 처음부터 적용한 뒤 명령을 실행하고, 순차 스캔이 남은 쿼리가 없는지 확인합니다.
+# 행이 몇 개뿐이면 어떤 인덱스든 전체를 읽는 편이 싸게 계산되므로, 검사하는 동안 서버 행을 EXTRA_SERVERS 개 더 넣어 둡니다.
+
+EXTRA_SERVERS = 2000
+
+
+def _timeouts(conn) -> tuple:
+    return tuple(conn.exec_driver_sql(f"SHOW {name}").scalar()
+                 for name in ("statement_timeout", "idle_in_transaction_session_timeout"))
+
+
+@pytest.fixture(scope="module")
+def migrated(app):
+    from flask_migrate import stamp, upgrade
+
+    from app.extensions import db
+    from app.models import ServerInfo
+
+    with app.app_context():
+        if db.engine.dialect.name != "postgresql":
+            pytest.skip("실행 계획 검사는 PostgreSQL 테스트 DB(TEST_DATABASE_URL)에서만")
+        # conftest 가 테이블을 다시 만들었으므로 버전 기록을 지우고 처음부터 적용
+        directory = os.path.join(ROOT, "migrations")
+        seen = []  # 리비전마다 마이그레이션 연결의 제한 시간 (migrations/env.py 에서 끔)
+        configure_args = app.extensions["migrate"].configure_args
+        configure_args["on_version_apply"] = lambda ctx, **kw: seen.append(_timeouts(ctx.connection))
+        try:
+            stamp(directory=directory, revision="base")
+            upgrade(directory=directory)
+        finally:
+            configure_args.pop("on_version_apply")
+
+        servers = ServerInfo.__table__
+        rows = [{"Person_ID": PERSON_ID, "chServerName": f"explain-{i}", "chServerInfo": ip,
+                 "chServerInet": ip, "chServerInets": [ip]}
+                for i, ip in enumerate(f"172.16.{i >> 8}.{i & 255}" for i in range(EXTRA_SERVERS))]
+        with db.engine.begin() as conn:
+            conn.execute(servers.insert(), rows)
+            conn.execute(text("ANALYZE"))
+        with db.engine.connect() as conn:
+            after = _timeouts(conn)
+        yield {"during": seen, "after": after}
+        with db.engine.begin() as conn:
+            conn.execute(servers.delete().where(servers.c.chServerName.like("explain-%")))
+
+
+def test_explain_queries(app, migrated):
+    result = app.test_cli_runner().invoke(args=["explain-queries", "--json"])
+    report = json.loads(result.output)
+
+    failed = [r for r in report["results"] if not r["ok"]]
+    assert not failed, json.dumps(failed, ensure_ascii=False, indent=2)
+
+
+def test_migrations_run_without_timeouts(app, migrated):
+    # 연결 시작 옵션(config.py)의 제한 시간은 마이그레이션 동안만 꺼지고, 풀로 돌아간 연결은 원래 값
+    assert migrated["during"] and set(migrated["during"]) == {("0", "0")}
+    statement_ms = app.config["STATEMENT_TIMEOUTS"]["default"]
+    assert migrated["after"][0] == f"{statement_ms // 1000}s"
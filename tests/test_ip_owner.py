@@ -0,0 +1,144 @@
+import io
+
+import pytest
+
+from conftest import PERSON_ID
+
+# IP → 소유 고객 표 (app/services/ip_owner.py)
+# 최장 접두사 일치, ORM 저장 / 삭제 / 고객명 변경의 commit 후 반영(전체 다시 읽기 없이), rollback 무시,
+# 일괄 등록(Core INSERT) 후 invalidate_ip_owners() 로 다시 읽는지
+#
+# conftest 의 call 은 요청마다 캐시를 비우므로 여기서는 client 로 직접 요청합니다.
+
+OTHER_PERSON_ID = "P-T1"
+
+
+@pytest.fixture
+def owners(app, client):
+    """표를 새로 읽어 둔 뒤 IP 목록 → {IP: 결과} 조회 함수"""
+    from app.services.ip_owner import _owners, invalidate_ip_owners
+
+    def resolve(*ips):
+        response = client.post("/asset/ajax/ip-owners", json={"ips": list(ips)})
+        assert response.status_code == 200, response.get_data(as_text=True)[:500]
+        return response.get_json()["results"]
+
+    invalidate_ip_owners()
+    resolve("10.0.0.1")
+    resolve.built_at = _owners.built_at
+    return resolve
+
+
+def _names(result) -> list:
+    return [m["name"] for m in result["matches"]] if result else []
+
+
+def _add_asset(db, name, ip, person_id=PERSON_ID):
+    from app.models import AST_Computer_System
+
+    asset = AST_Computer_System(Person_ID=person_id, Company="테스트", Owner_name="사이트", Name=name,
+                                Type="방화벽", IP_Address=ip)
+    db.session.add(asset)
+    db.session.commit()
+    return asset
+
+
+def test_longest_prefix_wins(owners, db):
+    from app.models import ServerInfo
+
+    network = _add_asset(db, "owner-net", "10.77.0.0/16", person_id=OTHER_PERSON_ID)
+    server = ServerInfo(Person_ID=PERSON_ID, chServerName="owner-host", chServerInfo="10.77.1.5")
+    db.session.add(server)
+    db.session.commit()
+    try:
+        results = owners("10.77.1.5", "10.77.2.9", "10.78.0.1")
+        assert results["10.77.1.5"]["network"] == "10.77.1.5/32"
+        assert _names(results["10.77.1.5"]) == ["owner-host"]
+        assert results["10.77.2.9"]["network"] == "10.77.0.0/16"
+        assert _names(results["10.77.2.9"]) == ["owner-net"]
+        assert results["10.77.2.9"]["matches"][0]["person_id"] == OTHER_PERSON_ID
+        assert results["10.78.0.1"] is None
+
+        # /32 장비를 지우면 대역 장비로
+        db.session.delete(server)
+        db.session.commit()
+        assert _names(owners("10.77.1.5")["10.77.1.5"]) == ["owner-net"]
+    finally:
+        db.session.delete(network)
+        db.session.commit()
+
+
+def test_orm_changes_apply_after_commit(owners, db):
+    from app.services.ip_owner import _owners
+
+    asset = _add_asset(db, "owner-fw", "10.79.0.1")
+    assert _names(owners("10.79.0.1")["10.79.0.1"]) == ["owner-fw"]
+
+    asset.IP_Address = "10.79.0.2 (관리)"
+    asset.Name = "owner-fw2"
+    db.session.commit()
+    results = owners("10.79.0.1", "10.79.0.2")
+    assert results["10.79.0.1"] is None
+    assert _names(results["10.79.0.2"]) == ["owner-fw2"]
+
+    db.session.delete(asset)
+    db.session.commit()
+    assert owners("10.79.0.2")["10.79.0.2"] is None
+
+    # 모두 commit 때 반영됐고 전체를 다시 읽지 않음
+    assert _owners.built_at == owners.built_at
+
+
+def test_customer_rename(owners, db):
+    from app.models import CTMPeople
+
+    people = db.session.query(CTMPeople).filter_by(Person_ID=PERSON_ID).one()
+    original = people.Company
+    people.Company = "이름변경"
+    db.session.commit()
+    try:
+        assert owners("10.0.0.1")["10.0.0.1"]["matches"][0]["company"] == "이름변경"
+    finally:
+        people.Company = original
+        db.session.commit()
+    assert owners("10.0.0.1")["10.0.0.1"]["matches"][0]["company"] == original
+
+
+def test_rollback_discards_changes(owners, db):
+    from app.models import AST_Computer_System
+
+    db.session.add(AST_Computer_System(Person_ID=PERSON_ID, Company="테스트", Owner_name="사이트",
+                                       Name="owner-rollback", Type="방화벽", IP_Address="10.80.0.1"))
+    db.session.flush()
+    db.session.rollback()
+
+    asset = db.session.query(AST_Computer_System).filter_by(Name="fw-0").one()
+    asset.IP_Address = "10.80.0.2"
+    db.session.flush()
+    db.session.rollback()
+
+    results = owners("10.80.0.1", "10.80.0.2", "10.0.0.1")
+    assert results["10.80.0.1"] is None
+    assert results["10.80.0.2"] is None
+    assert _names(results["10.0.0.1"]) == ["fw-0"]
+
+
+def test_bulk_import_invalidates(owners, client, db):
+    from app.models import AST_Computer_System
+    from app.services.ip_owner import invalidate_ip_owners
+
+    # Core INSERT 는 저장 이벤트가 없으므로 무효화 전까지 표에 없음
+    table = AST_Computer_System.__table__
+    db.session.execute(table.insert().values(Person_ID=PERSON_ID, Name="owner-core", IP_Address="10.81.0.1"))
+    db.session.commit()
+    assert owners("10.81.0.1")["10.81.0.1"] is None
+    invalidate_ip_owners()
+    assert _names(owners("10.81.0.1")["10.81.0.1"]) == ["owner-core"]
+
+    # 일괄 등록 화면은 커밋 후 직접 무효화
+    content = "장비명,사이트,IP\nowner-bulk,본사,10.81.0.2\n"
+    response = client.post(f"/customers/{PERSON_ID}/import/assets",
+                           data={"file": (io.BytesIO(content.encode()), "assets.csv")},
+                           content_type="multipart/form-data")
+    assert response.status_code == 200, response.get_data(as_text=True)[:500]
+    assert _names(owners("10.81.0.2")["10.81.0.2"]) == ["owner-bulk"]
@@ -0,0 +1,111 @@
+import io
+
+import pytest
+
+from conftest import PERSON_ID
+
+# IP 검색 (app/services/ip_search.py)
+# 여러 IP 가 적힌 장비도 두 번째 이후 IP 로 찾고, 앞뒤 숫자만 다른 IP(10.5.5.10, 110.5.5.1)는 찾지 않는지
+
+
+@pytest.fixture(scope="module")
+def multi_ip_devices(app):
+    from app.extensions import db
+    from app.models import AST_Computer_System, ServerInfo
+
+    assets = {
+        "multi-fw": "10.5.5.1, 10.5.5.2",
+        "near-fw": "10.5.5.10",
+        "far-fw": "110.5.5.1 (관리), 10.5.5.20",
+    }
+    servers = {
+        "multi-srv": "192.168.50.1 (관리) / 192.168.50.2",
+        "near-srv": "192.168.50.21",
+    }
+    with app.app_context():
+        for name, ip in assets.items():
+            db.session.add(AST_Computer_System(Person_ID=PERSON_ID, Company="테스트0", Owner_name="사이트0",
+                                               Name=name, Type="방화벽", IP_Address=ip))
+        for name, ip in servers.items():
+            db.session.add(ServerInfo(Person_ID=PERSON_ID, chServerName=name, chServerInfo=ip))
+        db.session.commit()
+
+
+def _names(call, url, names):
+    response = call("GET", url)
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    return {name for name in names if name in body}
+
+
+ASSET_NAMES = ("multi-fw", "near-fw", "far-fw")
+SERVER_NAMES = ("multi-srv", "near-srv")
+
+
+def test_iter_inets():
+    from app.services.ip_search import iter_inets, to_inet, to_inets
+
+    assert list(iter_inets("10.5.5.1, 10.5.5.2 (관리) 10.6.0.0/24")) == ["10.5.5.1", "10.5.5.2", "10.6.0.0/24"]
+    assert to_inet("10.5.5.1, 10.5.5.2") == "10.5.5.1"
+    assert to_inets("10.5.5.1, 10.5.5.2, 10.5.5.1") == ["10.5.5.1", "10.5.5.2"]
+    assert to_inet("관리용") is None
+    assert to_inets("관리용") is None
+
+
+def test_shadow_columns_filled(multi_ip_devices, db):
+    from app.models import AST_Computer_System
+
+    row = db.session.query(AST_Computer_System.IP_Inet, AST_Computer_System.IP_Inets).filter_by(Name="multi-fw").one()
+    assert str(row[0]) == "10.5.5.1"
+    assert [str(v) for v in row[1]] == ["10.5.5.1", "10.5.5.2"]
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("10.5.5.1", {"multi-fw"}),
+    ("10.5.5.2", {"multi-fw"}),
+    ("10.5.5.10", {"near-fw"}),
+    ("10.5.5.20", {"far-fw"}),
+    ("110.5.5.1", {"far-fw"}),
+    ("10.5.5.3", set()),
+])
+def test_exact_ip_security(call, multi_ip_devices, q, expected):
+    assert _names(call, f"/asset/security?q={q}", ASSET_NAMES) == expected
+
+
+@pytest.mark.parametrize("q, expected", [
+    ("192.168.50.1", {"multi-srv"}),
+    ("192.168.50.2", {"multi-srv"}),
+    ("192.168.50.21", {"near-srv"}),
+])
+def test_exact_ip_servers(call, multi_ip_devices, q, expected):
+    assert _names(call, f"/asset/servers?q={q}", SERVER_NAMES) == expected
+
+
+def test_update_resyncs_addresses(call, multi_ip_devices, db):
+    from app.models import AST_Computer_System
+
+    asset = db.session.query(AST_Computer_System).filter_by(Name="near-fw").one()
+    asset.IP_Address = "10.5.6.1, 10.5.6.2"
+    db.session.commit()
+    try:
+        assert _names(call, "/asset/security?q=10.5.6.2", ASSET_NAMES) == {"near-fw"}
+        assert _names(call, "/asset/security?q=10.5.5.10", ASSET_NAMES) == set()
+    finally:
+        asset.IP_Address = "10.5.5.10"
+        db.session.commit()
+
+
+def test_bulk_import_fills_addresses(call):
+    content = "장비명,사이트,IP\nbulk-fw,본사,10.5.7.1; 10.5.7.2\n"
+    response = call("POST", f"/customers/{PERSON_ID}/import/assets",
+                    data={"file": (io.BytesIO(content.encode()), "assets.csv")}, content_type="multipart/form-data")
+    assert response.status_code == 200, response.get_data(as_text=True)[:500]
+    assert _names(call, "/asset/security?q=10.5.7.2", ("bulk-fw",)) == {"bulk-fw"}
+
+
+def test_cidr_search(call, multi_ip_devices, db):
+    if db.engine.dialect.name != "postgresql":
+        pytest.skip("inet 대역 검색은 PostgreSQL 전용")
+    # 대역 / 범위는 첫 번째 IP 기준 (far-fw 의 두 번째 IP 10.5.5.20 은 대역 검색 대상이 아님)
+    assert _names(call, "/asset/security?q=10.5.5.0/24", ASSET_NAMES) == {"multi-fw", "near-fw"}
+    assert _names(call, "/asset/security?q=10.5.5.5-10.5.5.15", ASSET_NAMES) == {"near-fw"}
@@ -0,0 +1,252 @@
+import io
+from datetime import date
+
+import pytest
+
+from conftest import PERSON_ID
+
+# 엔드포인트별 SQL 문장 수 상한 (app/services/query_budget.py)
+#
+# 모든 블루프린트의 화면 / AJAX 조회와 저장 요청을 캐시를 비운 상태로 보내고,
+# 저장 요청은 목록 행 조각(fragment=...)을 요청할 때와 요청하지 않을 때를 모두 확인합니다.
+# testing 프로필은 SQL_QUERY_BUDGET=raise 이므로 상한을 넘으면 요청 자체가 QueryBudgetExceeded 로 실패합니다.
+
+TODAY = date.today().isoformat()
+
+
+def _first_id(db, model, column, **filters):
+    with_filter = db.session.query(column).filter_by(**filters) if filters else db.session.query(column)
+    return with_filter.order_by(column).limit(1).scalar()
+
+
+@pytest.fixture
+def ids(db):
+    from app.models import AST_Computer_System, Contact, ServerInfo, SRTicket, WorkInfo
+
+    return {
+        "work": _first_id(db, WorkInfo, WorkInfo.Work_ID, Person_ID=PERSON_ID),
+        "sr": _first_id(db, SRTicket, SRTicket.sr_id),
+        "asset": _first_id(db, AST_Computer_System, AST_Computer_System.Asset_ID, Person_ID=PERSON_ID),
+        "server": _first_id(db, ServerInfo, ServerInfo.Server_ID, Person_ID=PERSON_ID),
+        "contact": _first_id(db, Contact, Contact.Contact_ID, Person_ID=PERSON_ID),
+    }
+
+
+def _ok(response, status=200):
+    assert response.status_code == status, response.get_data(as_text=True)[:500]
+    data = response.get_json()
+    if data is not None:
+        assert data.get("ok", True), data
+    return data
+
+
+# ---------------------------------------------------------------------------
+# 조회
+# ---------------------------------------------------------------------------
+GET_URLS = [
+    "/",
+    "/customers",
+    "/customers?page=2",
+    "/customers?q=테스트",
+    f"/customers/{PERSON_ID}",
+    f"/customers/{PERSON_ID}/tabs/work",
+    f"/customers/{PERSON_ID}/tabs/assets",
+    f"/customers/{PERSON_ID}/tabs/servers",
+    f"/customers/{PERSON_ID}/tabs/contacts",
+    f"/customers/{PERSON_ID}/tabs/contracts",
+    "/customers/ajax/search?q=테스트",
+    f"/contract/ajax/{PERSON_ID}",
+    "/work/list",
+    "/work/list?page=2",
+    "/work/list?q=작업",
+    "/work/ajax/list",
+    "/work/export?format=csv",
+    "/sr/list",
+    "/sr/list?page=1",
+    "/sr/ajax/list",
+    "/sr/export?format=csv",
+    "/asset/security",
+    "/asset/security?q=fw",
+    "/asset/security?q=10.0.1.1",
+    "/asset/security?q=10.0.0.0/16",
+    "/asset/security/export?format=csv",
+    "/asset/servers",
+    "/asset/servers?q=192.168.1.10",
+    "/asset/servers/export?format=csv",
+    "/schedule",
+    "/schedule/month",
+    "/users/list",
+    "/auth/change-password",
+    "/metrics",
+]
+
+
+@pytest.mark.parametrize("url", GET_URLS)
+def test_get_pages(call, url):
+    response = call("GET", url)
+    assert response.status_code == 200, response.get_data(as_text=True)[:500]
+
+
+def test_get_details(call, ids):
+    _ok(call("GET", f"/work/ajax/{ids['work']}/detail"))
+    _ok(call("GET", f"/work/ajax/{ids['work']}/attachments"))
+    _ok(call("GET", f"/work/ajax/{ids['work']}/row?fragment=work.list"))
+    _ok(call("GET", f"/sr/ajax/{ids['sr']}"))
+    _ok(call("GET", f"/customers/{PERSON_ID}/works/{ids['work']}"))
+    _ok(call("GET", f"/customers/{PERSON_ID}/servers/{ids['server']}/edit"))
+    _ok(call("GET", f"/customers/{PERSON_ID}/contacts/{ids['contact']}/edit"))
+    assert call("GET", "/uploads/chunked/unknown").status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# 저장 (fragment 없이 / 목록 화면별 fragment)
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize("fragment", [None, "work.list", "customers.work"])
+def test_work_mutations(call, fragment):
+    extra = {"fragment": fragment} if fragment else {}
+    form = {"person_id": PERSON_ID, "work_date": TODAY, "work_type": "점검", "summary": "예산 확인", **extra}
+
+    created = _ok(call("POST", "/work/ajax/create", data=form))
+    assert ("html" in created) == bool(fragment)
+    work_id = created["work_id"]
+
+    updated = _ok(call("POST", f"/work/ajax/{work_id}/update", data={**form, "summary": "수정"}))
+    assert ("html" in updated) == bool(fragment)
+    _ok(call("POST", f"/work/ajax/{work_id}/delete"))
+
+
+@pytest.mark.parametrize("fragment", [None, "sr.list"])
+def test_sr_mutations(call, fragment):
+    extra = {"fragment": fragment} if fragment else {}
+    form = {"location": "사이트0", "company": "테스트0", "request_date": TODAY, "content": "예산 확인",
+            "handler": "관리자", **extra}
+
+    created = _ok(call("POST", "/sr/ajax/create", data=form))
+    assert ("html" in created) == bool(fragment)
+    updated = _ok(call("POST", f"/sr/ajax/{created['id']}/update", data={**form, "result": "완료"}))
+    assert ("html" in updated) == bool(fragment)
+    _ok(call("POST", f"/sr/ajax/{created['id']}/delete"))
+
+
+@pytest.mark.parametrize("fragment", [None, "asset.security", "customers.assets"])
+def test_asset_mutations(call, db, fragment):
+    from app.models import AST_Computer_System
+
+    extra = {"fragment": fragment} if fragment else {}
+    name = f"budget-{fragment or 'plain'}"
+    form = {"person_id": PERSON_ID, "ci_name": name, "owner_name": "본사", "ip_address": "10.9.9.1", **extra}
+
+    created = _ok(call("POST", "/asset/ajax/save", data=form))
+    assert ("html" in created) == bool(fragment)
+    asset_id = db.session.query(AST_Computer_System.Asset_ID).filter_by(Name=name).scalar()
+
+    updated = _ok(call("POST", "/asset/ajax/save", data={**form, "asset_id": asset_id, "ip_address": "10.9.9.2"}))
+    assert ("html" in updated) == bool(fragment)
+    _ok(call("POST", f"/asset/ajax/{asset_id}/delete"))
+
+
+def test_server_page_create(call):
+    response = call("POST", "/asset/servers", data={"Person_ID": PERSON_ID, "server_name": "srv-page",
+                                                    "server_ip": "10.8.8.8"})
+    assert response.status_code == 302
+
+
+def test_ip_owners(call):
+    data = _ok(call("POST", "/asset/ajax/ip-owners", json={"ips": ["10.0.1.1", "192.168.2.10", "8.8.8.8"]}))
+    assert data["found"] == 2
+    data = _ok(call("POST", "/asset/ajax/ip-owners", data={"ips": "10.0.1.1\n10.0.2.1"}))
+    assert data["found"] == 2
+
+
+@pytest.mark.parametrize("fragment", [None, "customers.servers"])
+def test_customer_server_mutations(call, db, fragment):
+    from app.models import ServerInfo
+
+    extra = {"fragment": fragment} if fragment else {}
+    base = f"/customers/{PERSON_ID}/servers"
+
+    created = _ok(call("POST", f"{base}/add", data={
+        "server_names[]": ["budget-a", "budget-b"], "server_ips[]": ["10.7.0.1", "10.7.0.2"], **extra,
+    }))
+    assert ("html" in created) == bool(fragment)
+
+    server_id = db.session.query(ServerInfo.Server_ID).filter_by(chServerName="budget-a").scalar()
+
+    updated = _ok(call("POST", f"{base}/{server_id}/edit", data={"server_name": "budget-a2",
+                                                                "server_ip": "10.7.0.3", **extra}))
+    assert ("html" in updated) == bool(fragment)
+    for name in ("budget-a2", "budget-b"):
+        server_id = db.session.query(ServerInfo.Server_ID).filter_by(chServerName=name).scalar()
+        _ok(call("POST", f"{base}/{server_id}/delete"))
+
+
+@pytest.mark.parametrize("fragment", [None, "customers.contacts"])
+def test_customer_contact_mutations(call, db, fragment):
+    from app.models import Contact
+
+    extra = {"fragment": fragment} if fragment else {}
+    base = f"/customers/{PERSON_ID}/contacts"
+    name = f"예산-{fragment or 'plain'}"
+
+    created = _ok(call("POST", f"{base}/add", data={"name": name, "phone": "010-0000-0000", **extra}))
+    assert ("html" in created) == bool(fragment)
+    contact_id = db.session.query(Contact.Contact_ID).filter_by(Name=name).scalar()
+
+    updated = _ok(call("POST", f"{base}/{contact_id}/edit", data={"name": name, "status": "활성화", **extra}))
+    assert ("html" in updated) == bool(fragment)
+    _ok(call("POST", f"{base}/{contact_id}/delete"))
+
+
+def test_customer_work_mutations(call):
+    base = f"/customers/{PERSON_ID}/works"
+    created = _ok(call("POST", f"{base}/add", data={"work_date": TODAY, "work_type": "점검", "summary": "탭 등록"}))
+    work_id = created["work_id"]
+    _ok(call("POST", f"{base}/{work_id}/edit", data={"work_date": TODAY, "work_type": "점검", "summary": "탭 수정"}))
+    _ok(call("POST", f"{base}/{work_id}/delete"))
+
+
+def test_customer_info_update(call):
+    _ok(call("POST", f"/customers/{PERSON_ID}/update", data={"company": "테스트0", "site_name": "사이트0"}))
+
+
+@pytest.mark.parametrize("fragment", [None, "customers.contracts"])
+def test_contract_mutations(call, db, fragment):
+    from app.models import Contract
+
+    extra = {"fragment": fragment} if fragment else {}
+    created = _ok(call("POST", "/contract/ajax/create", data={
+        "person_id": PERSON_ID, "service_type": "FW", "service_status": "사용중",
+        "open_date": TODAY, "terminate_date": TODAY, **extra,
+    }))
+    assert ("html" in created) == bool(fragment)
+
+    contract_id = db.session.query(Contract.Contract_ID).order_by(Contract.Contract_ID.desc()).limit(1).scalar()
+    _ok(call("POST", f"/contract/ajax/{contract_id}/delete"))
+
+
+@pytest.mark.parametrize("kind, content", [
+    ("assets", "장비명,사이트,IP,설치일\nimp-1,본사,10.6.0.1,20240101\nimp-2,본사,10.6.0.2,45292\n"),
+    ("servers", "서버명,IP\nimp-srv-1,10.6.1.1\n"),
+    ("contacts", "이름,휴대폰\n가져오기,010-1111-2222\n"),
+])
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_bulk_import(call, kind, content, dry_run):
+    data = {"file": (io.BytesIO(content.encode("utf-8")), f"{kind}.csv")}
+    if dry_run:
+        data["dry_run"] = "1"
+    _ok(call("POST", f"/customers/{PERSON_ID}/import/{kind}", data=data, content_type="multipart/form-data"))
+
+
+def test_bulk_import_bad_date_is_row_error(call):
+    content = "장비명,사이트,설치일\nbad-date,본사,99999999999\n"
+    response = call("POST", f"/customers/{PERSON_ID}/import/assets",
+                    data={"file": (io.BytesIO(content.encode()), "bad.csv")}, content_type="multipart/form-data")
+    assert response.status_code == 400
+    assert [e["row"] for e in response.get_json()["errors"]] == [2]
+
+
+def test_user_mutations(call):
+    response = call("POST", "/users/list", data={"user_id": "budget", "user_name": "예산", "password": "pw-12345",
+                                                 "role": "User"})
+    assert response.status_code == 302
+    assert call("POST", "/users/delete/budget").status_code == 302
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+
+from conftest import PERSON_ID
+
+# 분할 업로드 (app/routes/uploads.py, app/services/chunked_upload.py)
+# 대상은 init 에서 확인하고, 세션은 첨부 행 커밋이 성공한 뒤에만 지워지는지
+
+CONTENT = b"0123456789" * 1000
+
+
+@pytest.fixture
+def work_id(db):
+    from app.models import WorkInfo
+
+    return db.session.query(WorkInfo.Work_ID).filter_by(Person_ID=PERSON_ID).order_by(WorkInfo.Work_ID).limit(1).scalar()
+
+
+def _init(call, target_type, target_id, content=CONTENT):
+    return call("POST", "/uploads/chunked", json={"filename": "capture.pcap", "size": len(content),
+                                                   "target_type": target_type, "target_id": target_id})
+
+
+def _upload(call, work_id, content=CONTENT) -> str:
+    response = _init(call, "work", work_id, content)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    upload_id = response.get_json()["upload_id"]
+
+    half = len(content) // 2
+    for offset, chunk in ((0, content[:half]), (half, content[half:])):
+        response = call("PUT", f"/uploads/chunked/{upload_id}?offset={offset}", data=chunk)
+        assert response.status_code == 200, response.get_data(as_text=True)
+    return upload_id
+
+
+def _status(call, upload_id):
+    return call("GET", f"/uploads/chunked/{upload_id}")
+
+
+def test_init_rejects_unknown_targets(app, call):
+    from app.services import chunked_upload
+
+    with app.app_context():
+        session_dir = chunked_upload._session_dir()
+        before = set(os.listdir(session_dir))
+
+    response = _init(call, "note", 999999)
+    assert response.status_code == 404
+    assert response.get_json()["message"] == "특이사항을 찾을 수 없습니다."
+    assert _init(call, "work", 999999).status_code == 404
+    assert set(os.listdir(session_dir)) == before
+
+
+def test_complete_creates_attachment(call, db, work_id):
+    from app.models import WorkAttachment
+    from app.services import file_store
+
+    upload_id = _upload(call, work_id)
+    response = call("POST", f"/uploads/chunked/{upload_id}/complete")
+    assert response.status_code == 200, response.get_data(as_text=True)
+    data = response.get_json()
+    assert data["size"] == len(CONTENT)
+
+    att = db.session.get(WorkAttachment, data["attachment_id"])
+    assert att.Work_ID == work_id
+    with open(file_store.absolute_path(att.File_Path), "rb") as f:
+        assert f.read() == CONTENT
+    assert _status(call, upload_id).status_code == 404
+
+
+def test_failed_commit_keeps_session(call, db, work_id, monkeypatch):
+    from app.models import WorkAttachment
+    from app.services import file_store
+
+    content = b"retry" * 1000
+    upload_id = _upload(call, work_id, content)
+
+    commit = db.session.commit
+    failures = []
+
+    def fail_once():
+        if not failures:
+            failures.append(True)
+            raise RuntimeError("commit failed")
+        commit()
+
+    monkeypatch.setattr(db.session, "commit", fail_once)
+    response = call("POST", f"/uploads/chunked/{upload_id}/complete")
+    assert response.status_code == 500
+    monkeypatch.undo()
+
+    # 저장소로 옮긴 파일은 정리되고, 세션과 받은 조각은 그대로
+    assert db.session.query(WorkAttachment).filter_by(File_Size=len(content)).count() == 0
+    status = _status(call, upload_id).get_json()
+    assert status["complete"] and status["offset"] == len(content)
+
+    response = call("POST", f"/uploads/chunked/{upload_id}/complete")
+    assert response.status_code == 200, response.get_data(as_text=True)
+    att = db.session.get(WorkAttachment, response.get_json()["attachment_id"])
+    assert os.path.exists(file_store.absolute_path(att.File_Path))
+    assert _status(call, upload_id).status_code == 404